@@ -2,6 +2,7 @@ from typing import TYPE_CHECKING, Iterator, Optional, Self
 from dataclasses import dataclass
 
 from engine.events import Events, Pressed
+from engine.events.constants import DEFAULT_EVENT
 from engine.audio import Sound
 from engine.utils.events import check_events
 from engine.mixins.management import ManagementMixin
@@ -81,15 +82,9 @@ class DynamicAction(Action):
             direction (DirectionGroupEnum): направление проверки коллизии.
             sing_x_y (tuple[int, int]): направление выталкивания.
         """
-        if sprite_coordinate := group.collide_mask(obj, direction):
-            sign_x, sign_y = sing_x_y
-            while True:
-                obj.rect.y -= sign_y
-                obj.rect.x -= sign_x
-                if not obj.collide_mask(sprite_coordinate[0], direction):
-                    obj.rect.y += sign_y
-                    obj.rect.x += sign_x
-                    break
+        if manifold := group.collide_mask_manifold(obj, direction):
+            if resolution := obj.resolve_penetration(manifold, sing_x_y):
+                obj.rect.x, obj.rect.y = resolution.coordinate
 
 
 @dataclass
@@ -231,6 +226,21 @@ class ActionGroup:
             else:
                 del self._active_actions[events_action.events]
 
+    def is_triggered(self, pressed: Pressed) -> bool:
+        """Проверяет, совершено ли хотя бы одно событие группы, кроме дефолтного.
+
+        Args:
+            pressed (Pressed): объект состояния кнопок, коллизии и активности объекта.
+
+        Returns:
+            bool: флаг совершения события.
+        """
+        for events_action in self._events_actions:
+            for item in events_action if isinstance(events_action, tuple) else (events_action,):
+                if item.events != DEFAULT_EVENT and check_events(item.events, pressed):
+                    return True
+        return False
+
     def events(self, pressed: Pressed) -> None:
         """Проверка событий, совершённых пользователем.
 
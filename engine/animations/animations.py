@@ -16,6 +16,7 @@ from engine.settings import Settings
 from engine.animations.constants import Flip
 from engine.constants import Scale
 from engine.time import GlobalClock
+from engine.cache import TextureAtlas
 
 
 class Animation(ManagementMixin):
@@ -24,12 +25,14 @@ class Animation(ManagementMixin):
     Attributes:
         _settings (Settings): объект настроек игрового процесса.
         _global_clock (GlobalClock): объект глобальных часов игрового процесса.
+        _atlas (TextureAtlas): атлас текстур.
         _empty_frame (EmptyFrame): пустое кадр.
         time_between (int): время между кадрами.
     """
 
     _settings: Settings = Settings()
     _global_clock: GlobalClock = GlobalClock()
+    _atlas: TextureAtlas = TextureAtlas()
     _empty_frame: EmptyFrame = EMPTY_FRAME
     time_between: int = _settings['engine']['time_between_animation_frames']
 
@@ -43,7 +46,8 @@ class Animation(ManagementMixin):
         scale_rect: Scale = Scale(),
         scale_image: Scale = Scale(_settings['engine']['scale_image'], _settings['engine']['scale_image']),
     ) -> None:
-        """Инициализация анимации.
+        """Инициализация анимации. При включённой упаковке в атлас текстур при создании анимации
+        кадры упаковываются сразу.
 
         Args:
             dir (str): директорию анимации.
@@ -65,6 +69,37 @@ class Animation(ManagementMixin):
         self._sound = sound
         self._count_frames = len(self._frames)
         self._set_default_values()
+        if self._atlas.is_enabled and self._atlas.is_preloaded:
+            self.pack()
+
+    @classmethod
+    def pack_directory(
+        cls,
+        dir: str | Path = '',
+        flip: Flip = Flip(),
+        scale_image: Scale = Scale(_settings['engine']['scale_image'], _settings['engine']['scale_image']),
+    ) -> int:
+        """Упаковывает кадры всех анимаций директории и вложенных директорий.
+        Директории обходятся по алфавиту, кадры одной анимации упаковываются в атлас текстур подряд.
+
+        Args:
+            dir (str | Path, optional): директория анимаций. По дефолту '' - все анимации.
+            flip (Flip, optional):
+                Флаги отражения по вертикале, горизонтале и по направлению движения. Flip().
+            scale_image (Scale, optional): scale image.
+                По дефолту Scale(_settings['engine']['scale_image'], _settings['engine']['scale_image']).
+
+        Returns:
+            int: количество упакованных анимаций.
+        """
+        count = 0
+        for root, dirs, files in os.walk(BasePathEnum.ANIMATIONS_PATH.value / dir):
+            dirs.sort()
+            if not files:
+                continue
+            cls(Path(root).relative_to(BasePathEnum.ANIMATIONS_PATH.value), flip=flip, scale_image=scale_image).pack()
+            count += 1
+        return count
 
     def _get_full_path_images(self, path: Path) -> list[str]:
         """Отдаёт список полных путей до изображений анимации.
@@ -83,6 +118,13 @@ class Animation(ManagementMixin):
                 path_images.append(full_path)
         return path_images
 
+    def pack(self) -> None:
+        """Заранее готовит изображения кадров анимации. При включённом атласе текстур
+        кадры одной анимации упаковываются в атлас подряд.
+        """
+        for frame in self._frames:
+            frame.pack()
+
     @property
     def frame(self) -> Frame:
         """Отдаёт следующий кадр анимации в зависимости от времени между кадрами.
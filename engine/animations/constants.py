@@ -1,4 +1,9 @@
 from collections import namedtuple
 
+from engine.constants.direction import DirectionGroupEnum
+
 
 Flip = namedtuple('Flip', ('x', 'y', 'direction'), defaults=(False, False, False))
+
+DIRECTIONS = (None, *DirectionGroupEnum)
+FLIPPED_DIRECTIONS = (DirectionGroupEnum.LEFT, DirectionGroupEnum.DOWN)
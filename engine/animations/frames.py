@@ -3,18 +3,23 @@ from typing import Callable, TYPE_CHECKING, Optional, Self
 from pygame import transform, Surface, mask, Mask, image
 
 from engine.constants import Size, Coordinate
-from engine.animations.constants import Flip
+from engine.animations.constants import Flip, DIRECTIONS, FLIPPED_DIRECTIONS
 from engine.constants import Scale
 from engine.constants.direction import DirectionGroupEnum
 from engine.settings import Settings
-from engine.cache import Cache
+from engine.cache import Cache, TextureAtlas
 
 if TYPE_CHECKING:
     from engine.objects import Object
 
 
 class EmptyFrame:
-    """Класс пустого frame."""
+    """Класс пустого frame.
+
+    Attributes:
+        images (dict[DirectionGroupEnum | None, Surface]): изображения по направлениям движения.
+        masks (dict[DirectionGroupEnum | None, Mask]): маски по направлениям движения.
+    """
 
     def __init__(self, empty_surface: Surface, zero_coordinates_shift: Coordinate) -> None:
         """Инициализация пустого frame.
@@ -29,6 +34,8 @@ class EmptyFrame:
         self.mask = mask.from_surface(self.image)
         self.rect_mask = Mask((self.rect.width, self.rect.height))
         self.rect_mask.fill()
+        self.images: dict[DirectionGroupEnum | None, Surface] = dict.fromkeys(DIRECTIONS, self.image)
+        self.masks: dict[DirectionGroupEnum | None, Mask] = dict.fromkeys(DIRECTIONS, self.mask)
 
 
 class Frame:
@@ -37,24 +44,26 @@ class Frame:
     Attributes:
         _settings (Settings): объект настроек игрового процесса.
         _cache: (Cache): кэш.
+        _atlas (TextureAtlas): атлас текстур.
         _map_flip_by_derection: (dict[DirectionGroupEnum | None, Callable]):
             словарь - направления и функция переворота изображения.
     """
 
     _settings: Settings = Settings()
     _cache: Cache = Cache()
+    _atlas: TextureAtlas = TextureAtlas()
     _map_flip_by_derection: dict[DirectionGroupEnum | None, Callable] = {
         None: lambda self: self._image,
         DirectionGroupEnum.RIGHT: lambda self: self._image,
         DirectionGroupEnum.UP: lambda self: self._image,
-        DirectionGroupEnum.LEFT: lambda self: self._cache.get(
+        DirectionGroupEnum.LEFT: lambda self: self._get_surface(
             (self._path_image, self._flip.x, self._flip.y, *self._scale_image, True, False),
             transform.flip,
             self._image,
             True,
             False,
         ),
-        DirectionGroupEnum.DOWN: lambda self: self._cache.get(
+        DirectionGroupEnum.DOWN: lambda self: self._get_surface(
             (self._path_image, self._flip.x, self._flip.y, *self._scale_image, False, True),
             transform.flip,
             self._image,
@@ -95,10 +104,44 @@ class Frame:
         """
         self._transform_image()
         self._set_data_frame()
+        self._set_variants()
         return self
 
+    def _get_surface(self, args_key: tuple, func: Callable, *args) -> Surface:
+        """Отдаёт изображение из атласа текстур или кэша.
+
+        Args:
+            args_key (tuple): аргументы ключа.
+            func (Callable): функция для получения изображения.
+
+        Returns:
+            Surface: изображение.
+        """
+        if self._atlas.is_enabled:
+            return self._atlas.get(args_key, func, *args)
+        return self._cache.get(args_key, func, *args)
+
+    def _load_image(self) -> Surface:
+        """Загружает, отражает и масштабирует изображение кадра анимации без кэширования промежуточных изображений.
+
+        Returns:
+            Surface: изображение кадра анимации.
+        """
+        image_frame = transform.flip(image.load(self._path_image).convert_alpha(), self._flip.x, self._flip.y)
+        rect = image_frame.get_frect()
+        return transform.scale(
+            image_frame, Size(rect.width * self._scale_image.width, rect.height * self._scale_image.height)
+        )
+
     def _transform_image(self) -> None:
-        """Преобразует изображение кадра анимации."""
+        """Преобразует изображение кадра анимации.
+        При упаковке в атлас текстур изображение кадра - подповерхность страницы атласа.
+        """
+        if self._atlas.is_enabled:
+            self._image = self._atlas.get(
+                (self._path_image, self._flip.x, self._flip.y, *self._scale_image), self._load_image
+            )
+            return
         self._image = self._cache.get(
             (self._path_image, self._flip.x, self._flip.y),
             transform.flip,
@@ -129,6 +172,26 @@ class Frame:
         self.rect_mask = Mask((self.rect.width, self.rect.height))
         self.rect_mask.fill()
 
+    def _set_variants(self) -> None:
+        """Заранее готовит изображения и маски кадра по направлениям движения,
+        чтобы при выводе вариант выбирался по направлению объекта без построения ключей кэша.
+        """
+        self.images: dict[DirectionGroupEnum | None, Surface] = dict.fromkeys(DIRECTIONS, self._image)
+        self.masks: dict[DirectionGroupEnum | None, Mask] = dict.fromkeys(DIRECTIONS, self.mask)
+        if not self._flip.direction:
+            return
+        for direction in FLIPPED_DIRECTIONS:
+            self.images[direction] = self._map_flip_by_derection[direction](self)
+            self.masks[direction] = mask.from_surface(self.images[direction])
+
+    def pack(self) -> None:
+        """Заранее готовит изображение кадра анимации и его отражения по направлению движения."""
+        self._transform_image()
+        if not self._flip.direction:
+            return
+        for direction in FLIPPED_DIRECTIONS:
+            self._map_flip_by_derection[direction](self)
+
     @property
     def image(self) -> Surface:
         """Getter изображения.
@@ -136,7 +199,7 @@ class Frame:
         Returns:
             Surface: изображение.
         """
-        return self._map_flip_by_derection[self._obj.direction if self._flip.direction else None](self)
+        return self.images[self._obj.direction] if self._flip.direction else self._image
 
     def __deepcopy__(self, memo: dict) -> 'Frame':
         """Копирует frame.
@@ -1,3 +1,4 @@
 from engine.cache.cache import Cache
+from engine.cache.atlas import TextureAtlas, AtlasPage
 
-__all__ = ('Cache',)
+__all__ = ('Cache', 'TextureAtlas', 'AtlasPage')
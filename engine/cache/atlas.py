@@ -0,0 +1,161 @@
+from typing import Callable
+
+from pygame import Rect, Surface, BLEND_RGBA_MAX, SRCALPHA
+
+from engine.metaclasses.singleton import SingletonMeta
+from engine.settings import Settings
+from engine.cache.cache import Cache
+
+
+class AtlasPage:
+    """Страница атласа текстур. Изображения раскладываются по полкам:
+    полка - горизонтальная полоса высотой с первое изображение, изображения кладутся в неё слева направо.
+
+    Attributes:
+        surface (Surface): изображение страницы.
+        _shelves (list[Rect]): полки(left - занятая ширина, top и height - положение и высота полки).
+    """
+
+    def __init__(self, size: int) -> None:
+        """Инициализация страницы атласа.
+
+        Args:
+            size (int): ширина и высота страницы.
+        """
+        self.surface = Surface((size, size), SRCALPHA)
+        self._shelves: list[Rect] = []
+
+    def _get_free_rect(self, width: int, height: int) -> Rect | None:
+        """Отдаёт свободное место под изображение.
+
+        Args:
+            width (int): ширина изображения.
+            height (int): высота изображения.
+
+        Returns:
+            Rect | None: свободное место или None, если страница заполнена.
+        """
+        page_width, page_height = self.surface.get_size()
+        for shelf in self._shelves:
+            if height <= shelf.height and shelf.left + width <= page_width:
+                rect = Rect(shelf.left, shelf.top, width, height)
+                shelf.left += width
+                return rect
+        top = self._shelves[-1].bottom if self._shelves else 0
+        if top + height > page_height or width > page_width:
+            return
+        self._shelves.append(Rect(width, top, 0, height))
+        return Rect(0, top, width, height)
+
+    def add(self, surface: Surface) -> Surface | None:
+        """Копирует изображение на страницу.
+
+        Args:
+            surface (Surface): изображение.
+
+        Returns:
+            Surface | None: подповерхность страницы с изображением или None, если страница заполнена.
+        """
+        if not (rect := self._get_free_rect(*surface.get_size())):
+            return
+        region = self.surface.subsurface(rect)
+        region.blit(surface, (0, 0), special_flags=BLEND_RGBA_MAX)
+        return region
+
+
+class TextureAtlas(metaclass=SingletonMeta):
+    """Атлас текстур. Кадры анимаций копируются на несколько больших страниц,
+    а кадры ссылаются на подповерхности страниц, поэтому blit-ы читают из общей памяти страницы.
+    Страницы и изображения больше страницы учитываются в бюджете памяти кэша по закреплённым ключам.
+
+    Attributes:
+        _settings (Settings): объект настроек игрового процесса.
+        _cache (Cache): кэш.
+        is_enabled (bool): флаг упаковки кадров анимаций в атлас.
+        is_preloaded (bool): флаг упаковки кадров анимации в атлас при создании анимации.
+        _page_size (int): ширина и высота страницы атласа.
+    """
+
+    _settings: Settings = Settings()
+    _cache: Cache = Cache()
+    is_enabled: bool = _settings['engine']['render']['atlas_mode']
+    is_preloaded: bool = _settings['engine']['render']['atlas_preload_mode']
+    _page_size: int = _settings['engine']['render']['atlas_page_size']
+
+    def __init__(self) -> None:
+        """Инициализация атласа текстур."""
+        self._pages: list[AtlasPage] = []
+        self._regions: dict[tuple, Surface] = {}
+        self._cache_keys: list[tuple] = []
+
+    def __len__(self) -> int:
+        """Отдаёт количество изображений в атласе."""
+        return len(self._regions)
+
+    @property
+    def pages(self) -> tuple[Surface, ...]:
+        """Отдаёт изображения страниц атласа.
+
+        Returns:
+            tuple[Surface, ...]: изображения страниц.
+        """
+        return tuple(page.surface for page in self._pages)
+
+    def _add_to_cache(self, args_key: tuple, surface: Surface) -> None:
+        """Учитывает изображение атласа в бюджете памяти кэша, ключ закрепляется и не вытесняется.
+
+        Args:
+            args_key (tuple): аргументы ключа.
+            surface (Surface): изображение.
+        """
+        args_key = (type(self), *args_key)
+        self._cache.pin(args_key)
+        self._cache.add(args_key, surface)
+        self._cache_keys.append(args_key)
+
+    def add(self, args_key: tuple, surface: Surface) -> Surface:
+        """Упаковывает изображение в атлас.
+        Изображения больше страницы в атлас не попадают и хранятся отдельно.
+
+        Args:
+            args_key (tuple): аргументы ключа.
+            surface (Surface): изображение.
+
+        Returns:
+            Surface: подповерхность страницы атласа или исходное изображение.
+        """
+        for page in self._pages:
+            if region := page.add(surface):
+                break
+        else:
+            page = AtlasPage(self._page_size)
+            if region := page.add(surface):
+                self._add_to_cache(('page', len(self._pages)), page.surface)
+                self._pages.append(page)
+            else:
+                region = surface
+                self._add_to_cache(args_key, surface)
+        self._regions[args_key] = region
+        return region
+
+    def get(self, args_key: tuple, func: Callable, *args, **kwargs) -> Surface:
+        """Отдаёт изображение из атласа, при отсутствии создаёт и упаковывает его.
+
+        Args:
+            args_key (tuple): аргументы ключа.
+            func (Callable): функция для получения изображения.
+
+        Returns:
+            Surface: изображение.
+        """
+        if region := self._regions.get(args_key):
+            return region
+        return self.add(args_key, func(*args, **kwargs))
+
+    def clear(self) -> None:
+        """Очищает атлас и освобождает его место в бюджете памяти кэша."""
+        for args_key in self._cache_keys:
+            self._cache.remove(args_key)
+        self._cache_keys.clear()
+        self._pages.clear()
+        self._regions.clear()
@@ -1,16 +1,77 @@
+from collections import OrderedDict
+from sys import getrefcount, getsizeof
 from typing import Callable
 
-from pygame import Surface, Sound
+from pygame import Surface, Sound, mixer
 
 from engine.metaclasses.singleton import SingletonMeta
+from engine.settings import Settings
 
 
 class Cache(metaclass=SingletonMeta):
-    """Класс кэширования."""
+    """Класс кэширования.
+    Объекты учитываются по занимаемой памяти, при превышении бюджета вытесняются давно не использованные объекты.
+    Закреплённые ключи и объекты, на которые ссылаются вне кэша, не вытесняются.
+
+    Attributes:
+        _settings (Settings): объект настроек игрового процесса.
+        _budget (int): бюджет памяти кэша в байтах, 0 - без ограничения.
+    """
+
+    _settings: Settings = Settings()
+    _budget: int = _settings['engine']['cache_budget'] * 1024 * 1024
 
     def __init__(self) -> None:
         """Инициализация кэша."""
-        self._cache = {}
+        self._cache: OrderedDict[tuple, tuple[Surface | Sound, int]] = OrderedDict()
+        self._pinned: set[tuple] = set()
+        self.size = 0
+
+    def __len__(self) -> int:
+        """Отдаёт количество объектов в кэше."""
+        return len(self._cache)
+
+    @staticmethod
+    def _get_size(obj: Surface | Sound) -> int:
+        """Отдаёт занимаемую объектом память.
+
+        Args:
+            obj (Surface | Sound): объект.
+
+        Returns:
+            int: размер в байтах.
+        """
+        if isinstance(obj, Surface):
+            return obj.get_pitch() * obj.get_height()
+        if isinstance(obj, Sound) and (init := mixer.get_init()):
+            frequency, size, channels = init
+            return round(obj.get_length() * frequency) * channels * abs(size) // 8
+        return getsizeof(obj)
+
+    def _is_held(self, args_key: tuple) -> bool:
+        """Проверяет, ссылаются ли на объект вне кэша, например кадры анимации.
+        Вытеснение такого объекта не освобождает память, а следующий запрос создаёт его копию.
+
+        Args:
+            args_key (tuple): аргументы ключа.
+
+        Returns:
+            bool: флаг ссылок на объект вне кэша.
+        """
+        return getrefcount(self._cache[args_key][0]) > 2
+
+    def _evict(self) -> None:
+        """Вытесняет давно не использованные незакреплённые объекты без ссылок вне кэша,
+        пока кэш превышает бюджет.
+        """
+        if not self._budget or self.size <= self._budget:
+            return
+        for args_key in list(self._cache):
+            if args_key in self._pinned or self._is_held(args_key):
+                continue
+            self.size -= self._cache.pop(args_key)[1]
+            if self.size <= self._budget:
+                return
 
     def get(self, args_key: tuple, func: Callable, *args, callback: str | None = None, **kwargs) -> Surface | Sound:
         """Отдаёт значение из кэша.
@@ -23,10 +84,61 @@ class Cache(metaclass=SingletonMeta):
         Returns:
             Surface | Sound: объект.
         """
-        if obj := self._cache.get(args_key):
-            return obj
+        if item := self._cache.get(args_key):
+            self._cache.move_to_end(args_key)
+            return item[0]
         obj = func(*args, **kwargs)
         if callback:
             obj = getattr(obj, callback)()
-        self._cache[args_key] = obj
+        return self.add(args_key, obj)
+
+    def add(self, args_key: tuple, obj: Surface | Sound) -> Surface | Sound:
+        """Добавляет объект в кэш и вытесняет объекты при превышении бюджета.
+
+        Args:
+            args_key (tuple): аргументы ключа.
+            obj (Surface | Sound): объект.
+
+        Returns:
+            Surface | Sound: объект.
+        """
+        if item := self._cache.pop(args_key, None):
+            self.size -= item[1]
+        size = self._get_size(obj)
+        self._cache[args_key] = (obj, size)
+        self.size += size
+        self._evict()
         return obj
+
+    def remove(self, args_key: tuple) -> None:
+        """Удаляет объект из кэша вместе с закреплением ключа.
+
+        Args:
+            args_key (tuple): аргументы ключа.
+        """
+        self._pinned.discard(args_key)
+        if item := self._cache.pop(args_key, None):
+            self.size -= item[1]
+
+    def pin(self, args_key: tuple) -> None:
+        """Закрепляет ключ, объект по закреплённому ключу не вытесняется из кэша.
+
+        Args:
+            args_key (tuple): аргументы ключа.
+        """
+        self._pinned.add(args_key)
+
+    def unpin(self, args_key: tuple) -> None:
+        """Открепляет ключ и вытесняет объекты при превышении бюджета.
+
+        Args:
+            args_key (tuple): аргументы ключа.
+        """
+        self._pinned.discard(args_key)
+        self._evict()
+
+    def clear(self) -> None:
+        """Очищает кэш, кроме объектов по закреплённым ключам."""
+        for args_key in list(self._cache):
+            if args_key not in self._pinned:
+                self.size -= self._cache.pop(args_key)[1]
@@ -2,27 +2,33 @@ from typing import Iterable
 
 from engine.objects import Object
 from engine.objects.groups import BaseGroup
-from engine.objects.backgrounds import BackgroundsGroup
 from engine.metaclasses.singleton import SingletonMeta
 from engine.settings import Settings
 from engine.constants import Size, Coordinate
-from engine.tile_grid import TileGrid
+from engine.map import VisibleMap
 
 
 class Camera(metaclass=SingletonMeta):
-    """Класс камеры."""
+    """Класс камеры.
+    Камера не сдвигает объекты, а меняет смещение видимой части карты, которое применяется при выводе,
+    поэтому перемещение камеры не зависит от размера уровня.
 
-    def __init__(self, obj: Object, groups_shift: Iterable[BaseGroup]) -> None:
+    Attributes:
+        is_moved (bool): флаг перемещения камеры при последнем обновлении.
+    """
+
+    def __init__(self, obj: Object, groups_shift: Iterable[BaseGroup] | None = None) -> None:
         """Инициализация камеры.
 
         Args:
             obj (Object): объект для отслеживания.
-            groups_shift (Iterable[BaseGroup]): группы для сдвига.
+            groups_shift (Iterable[BaseGroup] | None, optional): группы, которые выводятся со смещением камеры,
+                остальные группы остаются на месте экрана. По дефолту None - все группы.
         """
         self.obj = obj
-        self._groups_shift = groups_shift
         settings: Settings = Settings()
-        self._tile_grid: TileGrid = TileGrid()
+        self._visible_map: VisibleMap = VisibleMap()
+        self._visible_map.groups_shift = None if groups_shift is None else tuple(groups_shift)
         self._smoothness: float = settings['engine']['camera']['camera_smoothness']
         base_visible_map_size: Size = Size(*settings['engine']['base_visible_map_size'])
         self._dead_zone: Size = Size(*settings['engine']['camera']['dead_zone'])
@@ -30,7 +36,16 @@ class Camera(metaclass=SingletonMeta):
         self._half_height: float = base_visible_map_size.height / 2
         move = self._get_move()
         self._move(move)
-        self._groups_shift = tuple(self._groups_shift) + (BackgroundsGroup(),)
+        self.is_moved = True
+
+    @property
+    def offset(self) -> Coordinate:
+        """Отдаёт смещение мировых координат относительно видимой части карты.
+
+        Returns:
+            Coordinate: смещение по осям x, y.
+        """
+        return self._visible_map.offset
 
     def _get_move(self) -> Coordinate:
         """Отдаёт перемещение по осям x, y.
@@ -38,8 +53,8 @@ class Camera(metaclass=SingletonMeta):
         Returns:
             move (Coordinate): перемещение по осям x, y.
         """
-        move_x = self._half_width - self.obj.rect.x
-        move_y = self._half_height - self.obj.rect.y
+        move_x = self._half_width - self.obj.rect.x - self.offset.x
+        move_y = self._half_height - self.obj.rect.y - self.offset.y
         coordinate = Coordinate(
             0 if abs(move_x) <= self._dead_zone.width else move_x,
             0 if abs(move_y) <= self._dead_zone.height else move_y,
@@ -52,12 +67,11 @@ class Camera(metaclass=SingletonMeta):
         Args:
             move (Coordinate): перемещение по осям x, y.
         """
-        self._tile_grid.move(move)
-        for group in self._groups_shift:
-            group.move(move)
+        self._visible_map.offset = Coordinate(self.offset.x + move.x, self.offset.y + move.y)
 
     def update(self) -> None:
         """Обновление камеры."""
         move = self._get_move()
         move = Coordinate(move.x * self._smoothness, move.y * self._smoothness)
+        self.is_moved = bool(move.x or move.y)
         self._move(move)
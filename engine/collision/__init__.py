@@ -0,0 +1,6 @@
+from engine.collision.spatial_hash import SpatialHash
+from engine.collision.static_layer import StaticCollisionLayer, StaticChunk
+from engine.collision.cache import CollisionCache
+
+
+__all__ = ('SpatialHash', 'StaticCollisionLayer', 'StaticChunk', 'CollisionCache')
@@ -0,0 +1,87 @@
+from typing import TYPE_CHECKING, Callable, Hashable
+
+from pygame import Mask
+
+from engine.metaclasses.singleton import SingletonMeta
+from engine.settings import Settings
+from engine.constants import Coordinate
+from engine.constants.direction import DirectionGroupEnum
+
+if TYPE_CHECKING:
+    from engine.objects import Object
+    from engine.objects.constants import Manifold
+
+
+class CollisionCache(metaclass=SingletonMeta):
+    """Кэш проверок коллизии в пределах одного шага симуляции.
+    Ключ содержит объект, его rect, маску, кандидата, rect и маску кандидата, поэтому после изменения rect-а,
+    смены кадра или направления результат считается заново без явной инвалидации.
+    Непрерывные запросы (sweep, shapecast, raycast) идут мимо кэша: они проверяют маску
+    в промежуточных положениях, которые в пределах шага не повторяются.
+
+    Attributes:
+        is_enabled (bool): флаг кэширования проверок коллизии.
+        hits (int): количество попаданий в кэш.
+        misses (int): количество промахов кэша.
+    """
+
+    is_enabled: bool = Settings()['engine']['physics']['collision_cache']
+
+    def __init__(self) -> None:
+        """Инициализация кэша проверок коллизии."""
+        self._results: dict[Hashable, 'Coordinate | Manifold | None'] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Отдаёт количество закэшированных проверок."""
+        return len(self._results)
+
+    @property
+    def hit_rate(self) -> float:
+        """Отдаёт долю попаданий в кэш.
+
+        Returns:
+            float: доля попаданий от 0 до 1.
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0
+
+    def collide(
+        self,
+        obj: 'Object',
+        sprite: 'Object',
+        mask: Mask,
+        collide: Callable[['Object', DirectionGroupEnum | None], 'Coordinate | Manifold | None'],
+        side: DirectionGroupEnum | None = None,
+    ) -> 'Coordinate | Manifold | None':
+        """Проверяет коллизию объекта с кандидатом, повторные проверки отдаются из кэша.
+
+        Args:
+            obj (Object): объект для проверки коллизии.
+            sprite (Object): объект-кандидат.
+            mask (Mask): маска объекта, используемая при проверке.
+            collide (Callable[[Object, DirectionGroupEnum | None], Coordinate | Manifold | None]):
+                метод объекта для проверки коллизии с кандидатом.
+            side (DirectionGroupEnum | None, optional): сторона для проверки. По дефолту None.
+
+        Returns:
+            Coordinate | Manifold | None: результат проверки коллизии.
+        """
+        if not self.is_enabled:
+            return collide(sprite, side)
+        key = (collide.__name__, obj, tuple(obj.rect), mask, sprite, tuple(sprite.rect), sprite.mask, side)
+        if key in self._results:
+            self.hits += 1
+            return self._results[key]
+        self.misses += 1
+        result = self._results[key] = collide(sprite, side)
+        return result
+
+    def clear(self) -> None:
+        """Очищает кэш перед новым шагом симуляции."""
+        self._results.clear()
+
+    def reset_stats(self) -> None:
+        """Сбрасывает статистику попаданий."""
+        self.hits = self.misses = 0
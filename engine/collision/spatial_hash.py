@@ -0,0 +1,151 @@
+from collections import defaultdict
+
+from pygame import FRect
+from pygame.sprite import Sprite
+
+from engine.constants import Size
+
+
+type CellsRange = tuple[int, int, int, int]
+
+
+class SpatialHash:
+    """Пространственный хэш спрайтов на равномерной сетке.
+
+    Attributes:
+        _cell_size (Size): размер ячейки.
+        _cells (defaultdict[tuple[int, int], dict[Sprite, None]]): спрайты по ячейкам.
+        _sprites_cells (dict[Sprite, CellsRange | None]): диапазоны ячеек спрайтов.
+    """
+
+    def __init__(self, cell_size: Size) -> None:
+        """Инициализация пространственного хэша.
+
+        Args:
+            cell_size (Size): размер ячейки.
+        """
+        self._cell_size = cell_size
+        self._cells: defaultdict[tuple[int, int], dict[Sprite, None]] = defaultdict(dict)
+        self._sprites_cells: dict[Sprite, CellsRange | None] = {}
+
+    def __len__(self) -> int:
+        """Отдаёт количество спрайтов в хэше."""
+        return len(self._sprites_cells)
+
+    def __contains__(self, sprite: Sprite) -> bool:
+        """Проверяет наличие спрайта в хэше.
+
+        Args:
+            sprite (Sprite): спрайт.
+
+        Returns:
+            bool: флаг наличия спрайта.
+        """
+        return sprite in self._sprites_cells
+
+    def _get_cells_range(self, rect: FRect) -> CellsRange:
+        """Отдаёт диапазон ячеек, которые пересекает rect.
+
+        Args:
+            rect (FRect): rect для расчёта.
+
+        Returns:
+            CellsRange: левая, верхняя, правая и нижняя ячейки.
+        """
+        return (
+            int(rect.left // self._cell_size.width),
+            int(rect.top // self._cell_size.height),
+            int(rect.right // self._cell_size.width),
+            int(rect.bottom // self._cell_size.height),
+        )
+
+    def _insert(self, sprite: Sprite, cells_range: CellsRange) -> None:
+        """Добавляет спрайт в ячейки диапазона.
+
+        Args:
+            sprite (Sprite): спрайт.
+            cells_range (CellsRange): диапазон ячеек.
+        """
+        left, top, right, bottom = cells_range
+        for x in range(left, right + 1):
+            for y in range(top, bottom + 1):
+                self._cells[x, y][sprite] = None
+
+    def _delete(self, sprite: Sprite, cells_range: CellsRange) -> None:
+        """Удаляет спрайт из ячеек диапазона.
+
+        Args:
+            sprite (Sprite): спрайт.
+            cells_range (CellsRange): диапазон ячеек.
+        """
+        left, top, right, bottom = cells_range
+        for x in range(left, right + 1):
+            for y in range(top, bottom + 1):
+                cell = self._cells[x, y]
+                cell.pop(sprite, None)
+                if not cell:
+                    del self._cells[x, y]
+
+    def add(self, sprite: Sprite) -> None:
+        """Добавляет спрайт. Спрайт без rect попадёт в ячейки при следующем rebucket.
+
+        Args:
+            sprite (Sprite): спрайт.
+        """
+        self._sprites_cells[sprite] = None
+        self.rebucket(sprite)
+
+    def remove(self, sprite: Sprite) -> None:
+        """Удаляет спрайт.
+
+        Args:
+            sprite (Sprite): спрайт.
+        """
+        if cells_range := self._sprites_cells.pop(sprite, None):
+            self._delete(sprite, cells_range)
+
+    def rebucket(self, sprite: Sprite) -> bool:
+        """Переносит спрайт в ячейки по его текущему rect.
+
+        Args:
+            sprite (Sprite): спрайт.
+
+        Returns:
+            bool: флаг смены ячеек спрайта.
+        """
+        if sprite.rect is None:
+            return False
+        old_cells_range = self._sprites_cells[sprite]
+        cells_range = self._get_cells_range(sprite.rect)
+        if cells_range == old_cells_range:
+            return False
+        if old_cells_range:
+            self._delete(sprite, old_cells_range)
+        self._insert(sprite, cells_range)
+        self._sprites_cells[sprite] = cells_range
+        return True
+
+    def rebucket_all(self) -> None:
+        """Переносит все спрайты в ячейки по их текущим rect."""
+        for sprite in self._sprites_cells:
+            self.rebucket(sprite)
+
+    def query(self, rect: FRect) -> list[Sprite]:
+        """Отдаёт спрайты из ячеек, которые пересекает rect.
+
+        Args:
+            rect (FRect): rect для поиска.
+
+        Returns:
+            list[Sprite]: спрайты-кандидаты без повторов.
+        """
+        left, top, right, bottom = self._get_cells_range(rect)
+        cells = self._cells
+        if left == right and top == bottom:
+            return list(cells.get((left, top), ()))
+        candidates: dict[Sprite, None] = {}
+        for x in range(left, right + 1):
+            for y in range(top, bottom + 1):
+                if cell := cells.get((x, y)):
+                    candidates.update(cell)
+        return list(candidates)
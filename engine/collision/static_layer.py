@@ -0,0 +1,220 @@
+from typing import TYPE_CHECKING
+
+from pygame import FRect, Mask
+
+from engine.metaclasses.singleton import SingletonMeta
+from engine.settings import Settings
+from engine.constants import Size, Coordinate
+
+if TYPE_CHECKING:
+    from engine.objects import Object
+
+
+class StaticChunk:
+    """Чанк статического слоя коллизий размером с тайтл.
+
+    Attributes:
+        rect (FRect): rect чанка.
+        mask (Mask): запечённая маска статических объектов чанка.
+        sprites (dict[Object, None]): статические объекты, попадающие в чанк.
+        is_exact (bool): флаг запекания всех объектов по целым координатам. Маски объектов с дробными
+            координатами смещаются с отбрасыванием дробной части от начала чанка, а не друг от друга,
+            поэтому проверка по такому чанку может не совпасть с проверкой по объектам.
+    """
+
+    def __init__(self, rect: FRect) -> None:
+        """Инициализация чанка.
+
+        Args:
+            rect (FRect): rect чанка.
+        """
+        self.rect = rect
+        self.mask = Mask((int(rect.width), int(rect.height)))
+        self.sprites: dict['Object', None] = {}
+        self.is_exact = True
+
+    def _draw(self, sprite: 'Object') -> None:
+        """Растеризует маску статического объекта в маску чанка.
+
+        Args:
+            sprite (Object): статический объект.
+        """
+        self.mask.draw(sprite.mask, (sprite.rect.x - self.rect.x, sprite.rect.y - self.rect.y))
+        self.is_exact = self.is_exact and float(sprite.rect.x).is_integer() and float(sprite.rect.y).is_integer()
+
+    def add(self, sprite: 'Object') -> None:
+        """Добавляет статический объект в чанк и растеризует его маску.
+
+        Args:
+            sprite (Object): статический объект.
+        """
+        self.sprites[sprite] = None
+        self._draw(sprite)
+
+    def bake(self) -> None:
+        """Растеризует маски статических объектов в маску чанка."""
+        self.mask.clear()
+        self.is_exact = True
+        for sprite in self.sprites:
+            self._draw(sprite)
+
+
+class StaticCollisionLayer(metaclass=SingletonMeta):
+    """Статический слой коллизий. Маски неподвижных твёрдых объектов один раз запекаются
+    в чанки, выровненные по тайтлам сетки, и проверяются одним overlap на чанк.
+    Чанки разделены по категориям коллизии, поэтому неподходящие под маску категории не проверяются.
+    """
+
+    def __init__(self) -> None:
+        """Инициализация статического слоя коллизий."""
+        settings: Settings = Settings()
+        self._chunk_size: Size = Size(*settings['engine']['tile_grid']['tile_size'])
+        self._chunks: dict[tuple[int, int, int], StaticChunk] = {}
+        self._categories: dict[int, None] = {}
+        self._sprites_chunks: dict['Object', tuple[StaticChunk, ...]] = {}
+        self._sprites_rects: dict['Object', tuple[float, float, float, float]] = {}
+
+    def __contains__(self, sprite: 'Object') -> bool:
+        """Проверяет, запечён ли объект в слой.
+
+        Args:
+            sprite (Object): объект.
+
+        Returns:
+            bool: флаг наличия объекта в слое.
+        """
+        return sprite in self._sprites_chunks
+
+    def _get_keys(self, rect: FRect) -> list[tuple[int, int]]:
+        """Отдаёт ключи чанков, которые пересекает rect.
+
+        Args:
+            rect (FRect): rect для поиска.
+
+        Returns:
+            list[tuple[int, int]]: ключи чанков.
+        """
+        left = int(rect.left // self._chunk_size.width)
+        top = int(rect.top // self._chunk_size.height)
+        right = int(rect.right // self._chunk_size.width)
+        bottom = int(rect.bottom // self._chunk_size.height)
+        return [(x, y) for x in range(left, right + 1) for y in range(top, bottom + 1)]
+
+    def _get_categories(self, collision_mask: int) -> list[int]:
+        """Отдаёт категории слоя, подходящие под маску коллизии.
+
+        Args:
+            collision_mask (int): битовая маска категорий.
+
+        Returns:
+            list[int]: категории коллизии.
+        """
+        return [category for category in self._categories if category & collision_mask]
+
+    def _get_chunk(self, category: int, key: tuple[int, int]) -> StaticChunk:
+        """Отдаёт чанк категории по ключу, создавая его при отсутствии.
+
+        Args:
+            category (int): категория коллизии.
+            key (tuple[int, int]): ключ чанка.
+
+        Returns:
+            StaticChunk: чанк.
+        """
+        if chunk := self._chunks.get((category, *key)):
+            return chunk
+        x, y = key
+        chunk = StaticChunk(
+            FRect(
+                Coordinate(x * self._chunk_size.width, y * self._chunk_size.height),
+                self._chunk_size,
+            )
+        )
+        self._chunks[(category, *key)] = chunk
+        return chunk
+
+    def add(self, sprite: 'Object') -> None:
+        """Запекает маску объекта в чанки, которые он пересекает.
+
+        Args:
+            sprite (Object): статический объект.
+        """
+        self._categories[sprite.collision_category] = None
+        chunks = tuple(self._get_chunk(sprite.collision_category, key) for key in self._get_keys(sprite.rect))
+        for chunk in chunks:
+            chunk.add(sprite)
+        self._sprites_chunks[sprite] = chunks
+        self._sprites_rects[sprite] = tuple(sprite.rect)
+
+    def remove(self, sprite: 'Object') -> None:
+        """Удаляет объект из слоя и перезапекает затронутые чанки.
+
+        Args:
+            sprite (Object): статический объект.
+        """
+        self._sprites_rects.pop(sprite, None)
+        for chunk in self._sprites_chunks.pop(sprite, ()):
+            del chunk.sprites[sprite]
+            chunk.bake()
+
+    def rebake(self, sprite: 'Object') -> bool:
+        """Перезапекает объект, если его rect изменился после запекания.
+
+        Args:
+            sprite (Object): статический объект.
+
+        Returns:
+            bool: флаг перезапекания.
+        """
+        if self._sprites_rects.get(sprite, tuple(sprite.rect)) == tuple(sprite.rect):
+            return False
+        self.remove(sprite)
+        self.add(sprite)
+        return True
+
+    def get_sprites(self, rect: FRect, collision_mask: int) -> list['Object']:
+        """Отдаёт статические объекты из чанков подходящих категорий, которые пересекает rect.
+
+        Args:
+            rect (FRect): rect для поиска.
+            collision_mask (int): битовая маска категорий.
+
+        Returns:
+            list[Object]: статические объекты без повторов.
+        """
+        sprites: dict['Object', None] = {}
+        keys = self._get_keys(rect)
+        for category in self._get_categories(collision_mask):
+            for key in keys:
+                if chunk := self._chunks.get((category, *key)):
+                    sprites.update(chunk.sprites)
+        return list(sprites)
+
+    def get_colliding_sprites(self, rect: FRect, mask: Mask, collision_mask: int) -> list['Object']:
+        """Отдаёт статические объекты чанков подходящих категорий, маска которых может пересекаться с маской.
+        Проверка идёт одним overlap на чанк и только отсеивает чанки без коллизии,
+        коллизию с объектами нужно проверять отдельно. Дробные координаты rect или объектов чанка
+        смещают маски иначе, чем при проверке по объектам, поэтому такие чанки не отсеиваются.
+
+        Args:
+            rect (FRect): rect маски.
+            mask (Mask): маска для проверки.
+            collision_mask (int): битовая маска категорий.
+
+        Returns:
+            list[Object]: статические объекты без повторов.
+        """
+        sprites: dict['Object', None] = {}
+        is_exact = float(rect.x).is_integer() and float(rect.y).is_integer()
+        keys = self._get_keys(rect)
+        for category in self._get_categories(collision_mask):
+            for key in keys:
+                if not (chunk := self._chunks.get((category, *key))) or not chunk.sprites:
+                    continue
+                if (
+                    not is_exact
+                    or not chunk.is_exact
+                    or chunk.mask.overlap(mask, (rect.x - chunk.rect.x, rect.y - chunk.rect.y))
+                ):
+                    sprites.update(chunk.sprites)
+        return list(sprites)
@@ -1,20 +1,24 @@
+from math import ceil, floor
 from typing import Iterable
 
-from pygame import event, display, transform
+import pygame
+from pygame import event, FRect, Rect, Surface
 
 from engine.mixins import QuitMixin, SetSettingsMixin
 from engine.settings import Settings
 from engine.audio import Audio
 from engine.metaclasses.engine import EngineMeta
-from engine.objects.groups import AllObjectsGroup, BaseGroup
+from engine.objects.groups import AllObjectsGroup, BaseGroup, SolidObjectsGroup, DynamicObjectsGroup, TriggerGroup
 from engine.time import GlobalClock
-from engine.utils.screen import get_sreen_resolution
 from engine.objects.text import Text
 from engine.tile_grid import TileGrid
 from engine.constants import Coordinate
 from engine.camera import Camera
+from engine.collision import CollisionCache
 from engine.objects.backgrounds import BackgroundsGroup, BackgroundsSurface
 from engine.map import VisibleMap
+from engine.render import Presenter, RenderQueue, DynamicResolution, TextureRenderer
+from engine.render.constants import DIRTY_RECTS_MAX_COUNT, DIRTY_RECTS_MAX_COVERAGE
 
 
 class Engine(QuitMixin, SetSettingsMixin, metaclass=EngineMeta):
@@ -31,8 +35,20 @@ class Engine(QuitMixin, SetSettingsMixin, metaclass=EngineMeta):
         _audio (Audio): объект для работы с аудио.
         _settings (Settings): объект настроек игрового процесса.
         _all_objects_group (AllObjectsGroup): группа всех игровых объектов.
+        _solid_objects_group (SolidObjectsGroup): группа твёрдых объектов.
+        _dynamic_objects_group (DynamicObjectsGroup): группа динамических объектов.
+        _trigger_group (TriggerGroup): группа триггеров.
         _tile_grid (TileGrid): сетка тайтлов.
+        _collision_cache (CollisionCache): кэш проверок коллизии.
+        _presenter (Presenter): вывод видимой части карты на дисплей.
+        _render_queue (RenderQueue): очередь вывода.
+        _dynamic_resolution (DynamicResolution): динамическое разрешение вывода.
+        _texture_renderer (TextureRenderer): вывод через SDL2 Renderer.
         _debug (bool): флаг debug-a.
+        _culling_mode (bool): флаг отсечения спрайтов вне видимой части карты.
+        _dirty_rects_mode (bool): флаг перерисовки только изменившихся областей.
+        _render_queue_mode (bool): флаг вывода спрайтов всех групп через общую очередь.
+        _background_cache (Surface | None): задний план последней полной перерисовки.
         _display_fps (Surface): отображение fps.
     """
 
@@ -46,18 +62,48 @@ class Engine(QuitMixin, SetSettingsMixin, metaclass=EngineMeta):
     _audio: Audio = Audio()
     _settings: Settings = Settings()
     _all_objects_group: AllObjectsGroup = AllObjectsGroup()
+    _solid_objects_group: SolidObjectsGroup = SolidObjectsGroup()
+    _dynamic_objects_group: DynamicObjectsGroup = DynamicObjectsGroup()
+    _trigger_group: TriggerGroup = TriggerGroup()
     _tile_grid: TileGrid = TileGrid()
+    _collision_cache: CollisionCache = CollisionCache()
+    _presenter: Presenter = Presenter()
+    _render_queue: RenderQueue = RenderQueue()
+    _dynamic_resolution: DynamicResolution = DynamicResolution()
+    _texture_renderer: TextureRenderer = TextureRenderer()
     _debug: bool = _settings['engine']['debug']['debug_mode']
+    _culling_mode: bool = _settings['engine']['render']['culling_mode']
+    _dirty_rects_mode: bool = _settings['engine']['render']['dirty_rects_mode']
+    _render_queue_mode: bool = _settings['engine']['render']['render_queue_mode']
+    _background_cache: Surface | None = None
     _display_fps = Text()
     _display_fps.rect.center = Coordinate(*_settings['engine']['debug']['display_fps_coordinate'])
 
-    def _debug_mode(self) -> None:
-        """Веbug mode."""
+    def _debug_mode(self, surface: Surface) -> None:
+        """Веbug mode.
+
+        Args:
+            surface (Surface): цель вывода.
+        """
         if not self._debug:
             return
-        self._display_fps.text = f'{int(self._global_clock.get_fps())}'
-        self.visible_map.blit(self._display_fps.text, self._display_fps.rect)
-        self.visible_map.blit(self._tile_grid.surface, self._tile_grid.rect)
+        text = f'{int(self._global_clock.get_fps())}'
+        if self._collision_cache.is_enabled:
+            text += f' | cache {self._collision_cache.hit_rate:.0%}'
+        if self._culling_mode:
+            text += f' | culled {sum(group.culled for group in self.draw_groups)}'
+        self._display_fps.text = text
+        if (scale := self._dynamic_resolution.get_scale(surface)) != 1:
+            surface.blit(
+                self._display_fps.text, self._dynamic_resolution.scale_coordinate(self._display_fps.rect.topleft)
+            )
+            surface.blit(
+                self._dynamic_resolution.get_image(self._tile_grid.surface),
+                self.visible_map.to_screen(self._tile_grid.rect.topleft, scale),
+            )
+            return
+        surface.blit(self._display_fps.text, self._display_fps.rect)
+        surface.blit(self._tile_grid.surface, self._tile_grid.rect.move(self.visible_map.draw_offset))
 
     def _get_events(self) -> dict[int, event.Event]:
         """Отдаёт события в виде словаря.
@@ -67,12 +113,26 @@ class Engine(QuitMixin, SetSettingsMixin, metaclass=EngineMeta):
         """
         return {event.type: event for event in event.get()}
 
-    def _events(self) -> None:
-        """Проверка событий, совершённых пользователем."""
+    def _window_events(self) -> None:
+        """Проверка событий окна: выхода и изменения размера.
+        События читаются один раз за кадр, в том числе в кадрах без шагов симуляции.
+        """
         events = self._get_events()
         self._check_quit(events)
+        if pygame.VIDEORESIZE in events or pygame.WINDOWSIZECHANGED in events:
+            self._presenter.resize()
+
+    def _events(self) -> None:
+        """Проверка событий, совершённых пользователем.
+        Твёрдые объекты переносятся в ячейки пространственного хэша до событий и после пакетного шага,
+        чтобы учесть перемещения вне действий движения.
+        """
+        self._solid_objects_group.rebucket()
         for group in self.events_groups:
             group.events()
+        self._dynamic_objects_group.integrate()
+        self._solid_objects_group.rebucket()
+        self._trigger_group.update_triggers()
 
     def _update(self) -> None:
         """Обновление объектов."""
@@ -81,24 +141,137 @@ class Engine(QuitMixin, SetSettingsMixin, metaclass=EngineMeta):
         if self.camera:
             self.camera.update()
 
-    def _draw(self) -> None:
-        """Вывод элементов на дисплей."""
-        self.backgrounds.draw(self.visible_map)
-        self._debug_mode()
+    def _is_full_redraw(self) -> bool:
+        """Проверяет необходимость полной перерисовки.
+
+        Returns:
+            bool: флаг полной перерисовки.
+        """
+        if not self._dirty_rects_mode or self._background_cache is None or self._debug:
+            return True
+        return bool(self.camera and self.camera.is_moved)
+
+    def _get_dirty_rects(self) -> list[Rect]:
+        """Отдаёт целочисленные области перерисовки в пределах видимой части карты.
+
+        Returns:
+            list[Rect]: области перерисовки.
+        """
+        visible_rect = self.visible_map.get_rect()
+        dirty_rects = []
         for group in self.draw_groups:
-            group.draw(self.visible_map)
-        frame = transform.scale(self.visible_map, get_sreen_resolution())
-        self.display.blit(frame, frame.get_frect())
-        display.flip()
+            for rect in group.get_dirty_rects():
+                left, top = floor(rect.left) - 1, floor(rect.top) - 1
+                dirty_rect = Rect(left, top, ceil(rect.right) + 1 - left, ceil(rect.bottom) + 1 - top)
+                if dirty_rect := dirty_rect.clip(visible_rect):
+                    dirty_rects.append(dirty_rect)
+        return dirty_rects
+
+    def _merge_dirty_rects(self, dirty_rects: list[Rect]) -> list[Rect]:
+        """Объединяет пересекающиеся области перерисовки.
+        При большом количестве областей или покрытии ими большей части видимой части карты
+        отдаётся одна область - вся видимая часть карты.
+
+        Args:
+            dirty_rects (list[Rect]): области перерисовки.
+
+        Returns:
+            list[Rect]: непересекающиеся области перерисовки.
+        """
+        merged_rects: list[Rect] = []
+        for rect in dirty_rects:
+            while (index := rect.collidelist(merged_rects)) != -1:
+                rect = rect.union(merged_rects.pop(index))
+            merged_rects.append(rect)
+        visible_rect = self.visible_map.get_rect()
+        coverage = sum(rect.width * rect.height for rect in merged_rects) / (visible_rect.width * visible_rect.height)
+        if len(merged_rects) > DIRTY_RECTS_MAX_COUNT or coverage > DIRTY_RECTS_MAX_COVERAGE:
+            return [visible_rect]
+        return merged_rects
+
+    def _draw_groups(self, surface: Surface, area: FRect | None = None) -> None:
+        """Выводит группы на цель вывода.
+        В режиме очереди вывода спрайты всех групп сортируются по слою и y и выводятся одним вызовом blits.
+
+        Args:
+            surface (Surface): цель вывода.
+            area (FRect | None, optional): область, вне которой спрайты не выводятся. По дефолту None.
+        """
+        if not self._render_queue_mode:
+            for group in self.draw_groups:
+                group.draw(surface, area)
+            return
+        for group in self.draw_groups:
+            group.submit(self._render_queue, surface, area)
+        self._render_queue.flush(surface)
+
+    def _draw_dirty(self) -> None:
+        """Перерисовывает только изменившиеся области поверх запомненного заднего плана.
+        Пересекающиеся области объединяются, группы выводятся один раз на каждую объединённую область.
+        """
+        dirty_rects = self._merge_dirty_rects(self._get_dirty_rects())
+        if not dirty_rects:
+            return
+        for rect in dirty_rects:
+            self.visible_map.set_clip(rect)
+            self.visible_map.blit(self._background_cache, rect, rect)
+            self._draw_groups(self.visible_map, FRect(rect))
+        self.visible_map.set_clip(None)
+        self._presenter.present(self.visible_map, dirty_rects)
+
+    def _draw(self) -> None:
+        """Вывод элементов на дисплей.
+        В режиме dirty rects полная перерисовка выполняется только при движении камеры или в debug mode.
+        При динамическом разрешении кадр выводится на уменьшенную цель вывода, режим dirty rects имеет приоритет.
+        При выводе через SDL2 Renderer кадр выводится renderer-ом.
+        """
+        if not self._is_full_redraw():
+            self._draw_dirty()
+            return
+        if self._texture_renderer.is_enabled:
+            surface = self._texture_renderer
+        else:
+            if self._dynamic_resolution.is_enabled and not self._dirty_rects_mode:
+                self._dynamic_resolution.update()
+            surface = self._dynamic_resolution.surface
+        self.backgrounds.draw(surface)
+        if self._dirty_rects_mode:
+            self._background_cache = self.visible_map.copy()
+            for group in self.draw_groups:
+                group.get_dirty_rects()
+        self._debug_mode(surface)
+        self._draw_groups(surface)
+        self._presenter.present(surface)
+
+    def _step(self) -> None:
+        """Шаг симуляции. Положение динамических объектов в начале шага запоминается всегда,
+        по нему определяется сторона коллизии. При интерполяции запоминается и смещение камеры.
+        """
+        self._collision_cache.clear()
+        self._dynamic_objects_group.save_previous_coordinates()
+        if self._global_clock.is_interpolation:
+            self.visible_map.save_previous_offset()
+            for group in self.draw_groups:
+                if group is not self._dynamic_objects_group:
+                    group.save_previous_coordinates()
+        self._events()
+        self._update()
 
     def _main_loop(self) -> None:
-        """Основной цикл игрового процесса."""
+        """Основной цикл игрового процесса.
+        События окна проверяются раз в кадр. При фиксированном шаге симуляция выполняется столько раз,
+        сколько шагов накопилось за кадр.
+        """
         while True:
             self._global_clock.tick()
-            self._events()
-            self._update()
+            self._window_events()
+            for _ in range(self._global_clock.steps):
+                self._step()
             self._draw()
 
     def start(self) -> None:
         """Запуск игрового процесса."""
+        for group in self.draw_groups:
+            group.bake_static()
+        self._solid_objects_group.bake_static()
         self._main_loop()
@@ -15,6 +15,9 @@ class EventEnum(IntEnum):
     FALL_EVENT = 2000000007
     HIT_EVENT = 2000000008
     DEATH_EVENT = 2000000009
+    TRIGGER_ENTER_EVENT = 2000000010
+    TRIGGER_STAY_EVENT = 2000000011
+    TRIGGER_EXIT_EVENT = 2000000012
 
 
 DEFAULT_EVENT = Events(EventEnum.DEFAULT_EVENT)
@@ -26,3 +29,6 @@ DOUBLE_JUMP_EVENT = Events(EventEnum.DOUBLE_JUMP_EVENT)
 FALL_EVENT = Events(EventEnum.FALL_EVENT)
 HIT_EVENT = Events(EventEnum.HIT_EVENT)
 DEATH_EVENT = Events(EventEnum.DEATH_EVENT)
+TRIGGER_ENTER_EVENT = Events(EventEnum.TRIGGER_ENTER_EVENT)
+TRIGGER_STAY_EVENT = Events(EventEnum.TRIGGER_STAY_EVENT)
+TRIGGER_EXIT_EVENT = Events(EventEnum.TRIGGER_EXIT_EVENT)
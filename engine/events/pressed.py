@@ -28,6 +28,9 @@ class Pressed(metaclass=PressedSingletonMeta):
         EventEnum.FALL_EVENT: lambda status: getattr(status, 'fall'),
         EventEnum.HIT_EVENT: lambda status: getattr(status, 'hit'),
         EventEnum.DEATH_EVENT: lambda status: getattr(status, 'death'),
+        EventEnum.TRIGGER_ENTER_EVENT: lambda status: getattr(status, 'trigger_enter'),
+        EventEnum.TRIGGER_STAY_EVENT: lambda status: getattr(status, 'trigger_stay'),
+        EventEnum.TRIGGER_EXIT_EVENT: lambda status: getattr(status, 'trigger_exit'),
     }
 
     @property
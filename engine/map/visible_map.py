@@ -1,14 +1,100 @@
-from pygame import Surface
+from pygame import FRect, Surface
 
 from engine.metaclasses.singleton import SingletonMeta
 from engine.settings import Settings
-from engine.constants import Size
+from engine.constants import Coordinate, Size
+from engine.time import GlobalClock
 
 
 class VisibleMap(Surface, metaclass=SingletonMeta):
-    """Отображение видимой части карты."""
+    """Отображение видимой части карты.
+    Объекты хранят мировые координаты, смещение камеры применяется только при выводе.
+    При интерполяции смещение при выводе интерполируется между шагами симуляции так же, как координаты объектов.
+
+    Attributes:
+        offset (Coordinate): смещение мировых координат относительно видимой части карты.
+        previous_offset (Coordinate): смещение в начале шага симуляции для интерполяции вывода.
+        groups_shift (tuple | None): группы, которые сдвигаются на смещение камеры. По дефолту None - все группы.
+        _global_clock (GlobalClock): объект глобальных часов игрового процесса.
+    """
+
+    _global_clock: GlobalClock = GlobalClock()
 
     def __init__(self) -> None:
         """Инициализация отображения видимой части карты."""
         settings: Settings = Settings()
         super().__init__(Size(*settings['engine']['base_visible_map_size']))
+        self.offset: Coordinate = Coordinate(0, 0)
+        self.previous_offset: Coordinate = Coordinate(0, 0)
+        self.groups_shift: tuple | None = None
+
+    def save_previous_offset(self) -> None:
+        """Запоминает смещение в начале шага симуляции."""
+        self.previous_offset = self.offset
+
+    @property
+    def draw_offset(self) -> Coordinate:
+        """Отдаёт смещение для вывода, при интерполяции - между смещениями начала и конца шага.
+
+        Returns:
+            Coordinate: смещение для вывода.
+        """
+        if not self._global_clock.is_interpolation:
+            return self.offset
+        previous, alpha = self.previous_offset, self._global_clock.alpha
+        return Coordinate(
+            previous.x + (self.offset.x - previous.x) * alpha, previous.y + (self.offset.y - previous.y) * alpha
+        )
+
+    def is_shifted(self, group: object) -> bool:
+        """Проверяет, что группа сдвигается на смещение камеры.
+
+        Args:
+            group (object): группа.
+
+        Returns:
+            bool: флаг сдвига группы.
+        """
+        return self.groups_shift is None or group in self.groups_shift
+
+    @property
+    def world_rect(self) -> FRect:
+        """Отдаёт видимую часть карты в мировых координатах.
+
+        Returns:
+            FRect: видимая часть карты.
+        """
+        offset = self.draw_offset
+        return FRect(-offset.x, -offset.y, self.get_width(), self.get_height())
+
+    def to_screen(self, coordinate: Coordinate, scale: float = 1, is_shifted: bool = True) -> Coordinate:
+        """Переводит мировые координаты в координаты цели вывода.
+
+        Args:
+            coordinate (Coordinate): мировые координаты.
+            scale (float, optional): масштаб цели вывода относительно видимой части карты.
+                По дефолту 1 - координаты видимой части карты.
+            is_shifted (bool, optional): флаг сдвига на смещение камеры, без сдвига координаты экранные.
+                По дефолту True.
+
+        Returns:
+            Coordinate: координаты цели вывода.
+        """
+        offset = self.draw_offset if is_shifted else Coordinate(0, 0)
+        return Coordinate((coordinate[0] + offset.x) * scale, (coordinate[1] + offset.y) * scale)
+
+    def to_world(self, coordinate: Coordinate, scale: float = 1, is_shifted: bool = True) -> Coordinate:
+        """Переводит координаты цели вывода в мировые координаты.
+
+        Args:
+            coordinate (Coordinate): координаты цели вывода.
+            scale (float, optional): масштаб цели вывода относительно видимой части карты.
+                По дефолту 1 - координаты видимой части карты.
+            is_shifted (bool, optional): флаг сдвига на смещение камеры, без сдвига координаты экранные.
+                По дефолту True.
+
+        Returns:
+            Coordinate: мировые координаты.
+        """
+        offset = self.draw_offset if is_shifted else Coordinate(0, 0)
+        return Coordinate(coordinate[0] / scale - offset.x, coordinate[1] / scale - offset.y)
@@ -1,17 +1,45 @@
 import pygame
 
+from engine.settings.constants import ScaleModeEnum
+
 
 class SetSettingsMixin:
     """Mixin установки настроек игрового процесса."""
 
+    @classmethod
+    def _set_settings_renderer(cls) -> bool:
+        """Создаёт окно вывода через SDL2 Renderer.
+        Дисплей pygame создаётся скрытым и нужен только для преобразования форматов изображений,
+        режим dirty rects при выводе через renderer отключается.
+
+        Returns:
+            bool: флаг успешного создания окна, при ошибке вывод идёт через Surface.
+        """
+        if not cls._texture_renderer.create(
+            cls._settings['engine']['caption_title'] or 'pygame window',
+            cls._settings['graphics']['screen_resolution'],
+            cls._settings['graphics']['fullscreen'],
+        ):
+            return False
+        cls.display = pygame.display.set_mode((1, 1), pygame.HIDDEN)
+        cls._dirty_rects_mode = False
+        if cls._settings['engine']['path_icon']:
+            cls._texture_renderer.window.set_icon(pygame.image.load(cls._settings['engine']['path_icon']))
+        return True
+
     @classmethod
     def _set_settings_display(cls) -> None:
-        """Устанавливает настройки дисплея."""
+        """Устанавливает настройки дисплея.
+        В режиме масштабирования SCALED размер дисплея равен видимой части карты, масштабирует SDL.
+        """
+        if cls._texture_renderer.is_enabled and cls._set_settings_renderer():
+            return
         flags = pygame.FULLSCREEN if cls._settings['graphics']['fullscreen'] else pygame.SHOWN
-        cls.display = pygame.display.set_mode(
-            cls._settings['graphics']['screen_resolution'],
-            flags,
-        )
+        resolution = cls._settings['graphics']['screen_resolution']
+        if cls._settings['engine']['render']['scale_mode'] == ScaleModeEnum.SCALED:
+            flags |= pygame.SCALED
+            resolution = cls._settings['engine']['base_visible_map_size']
+        cls.display = pygame.display.set_mode(resolution, flags)
         if cls._settings['engine']['caption_title']:
             pygame.display.set_caption(cls._settings['engine']['caption_title'])
         if cls._settings['engine']['path_icon']:
@@ -1,9 +1,8 @@
-from weakref import WeakValueDictionary
-from typing import Tuple
-
+from math import floor
+from warnings import warn
 
 from pygame.sprite import LayeredUpdates
-from pygame import image, transform, Surface, FRect
+from pygame import image, transform, Surface
 
 from engine.metaclasses.singleton import SingletonMeta
 from engine.objects.base_object import BaseObject
@@ -11,46 +10,61 @@ from engine.constants.path import BasePathEnum
 from engine.settings import Settings
 from engine.cache import Cache
 from engine.constants import Size, Coordinate
+from engine.map import VisibleMap
+from engine.render import DynamicResolution
 from engine.objects.backgrounds.constants import Background, CoefShiftRate
-from engine.constants.direction import DirectionEnum, OPPOSITE_DIRECTIONS
 
 
 class BackgroundsGroup(LayeredUpdates, metaclass=SingletonMeta):
     """Группа заднего фона игры со слоями отрисовки.
+    Каждый слой - один объект с закэшированным изображением, которое выводится сеткой
+    со сдвигом по модулю размера изображения, поэтому при движении камеры объекты не создаются и не удаляются.
 
     Attributes:
-        _base_visible_map_size (Size): размер видимой игровой карты.
+        _visible_map (VisibleMap): отображение видимой части карты со смещением камеры.
+        _dynamic_resolution (DynamicResolution): динамическое разрешение вывода.
     """
 
-    _base_visible_map_size: Size = Size(*Settings()['engine']['base_visible_map_size'])
-    _half_width: float = _base_visible_map_size.width / 2
-    _half_height: float = _base_visible_map_size.height / 2
+    _visible_map: VisibleMap = VisibleMap()
+    _dynamic_resolution: DynamicResolution = DynamicResolution()
 
     def move(self, move: Coordinate) -> None:
-        """Перемещение спрайтов.
+        """Перемещение слоёв. Устарело и ничего не делает: слои сдвигаются при выводе
+        на смещение VisibleMap.offset с учётом коэффициента сдвига слоя.
 
         Args:
             move (Coordinate): перемещение по осям x, y.
         """
-        for sprite in self.sprites():
-            rect: FRect = sprite.rect
-            coef_shift_rate: CoefShiftRate = sprite.coef_shift_rate
-            rect.x += move.x * coef_shift_rate.x
-            rect.y += move.y * coef_shift_rate.y
-            bottomright = Coordinate(*rect.bottomright)
-
-            if bottomright.x < -self._base_visible_map_size.width:
-                sprite.kill()
-            elif rect.x > self._base_visible_map_size.width:
-                sprite.kill()
+        warn('BackgroundsGroup.move устарел, используйте VisibleMap.offset', DeprecationWarning, stacklevel=2)
 
-            if bottomright.y < -self._base_visible_map_size.height:
-                sprite.kill()
-            elif rect.y > self._base_visible_map_size.height:
-                sprite.kill()
+    def draw(self, surface: Surface, *args, **kwargs) -> None:
+        """Выводит слои сеткой, сдвинутой на смещение камеры с учётом коэффициента сдвига слоя.
+        Сдвиг округляется вниз до пикселя, чтобы все изображения сетки стояли встык без шва.
 
-            if rect.collidepoint(self._half_width, self._half_height):
-                sprite.create_adjacent_backgrounds()
+        Args:
+            surface (Surface): отображение.
+        """
+        offset = self._visible_map.draw_offset
+        scale = self._dynamic_resolution.get_scale(surface)
+        width, height = surface.get_size()
+        blits = []
+        for sprite in self.sprites():
+            image = self._dynamic_resolution.get_image(sprite.image) if scale != 1 else sprite.image
+            image_width, image_height = image.get_size()
+            if not image_width or not image_height:
+                continue
+            left = floor((sprite.rect.x + offset.x * sprite.coef_shift_rate.x) * scale % image_width)
+            top = floor((sprite.rect.y + offset.y * sprite.coef_shift_rate.y) * scale % image_height)
+            left -= image_width if left > 0 else 0
+            top -= image_height if top > 0 else 0
+            y = top
+            while y < height:
+                x = left
+                while x < width:
+                    blits.append((image, (x, y)))
+                    x += image_width
+                y += image_height
+        surface.blits(blits, doreturn=False)
 
 
 class BackgroundsObject(BaseObject):
@@ -74,7 +88,6 @@ class BackgroundsObject(BaseObject):
         """
         super().__init__()
         self.background = background
-        self.adjacent_backgrounds = WeakValueDictionary()
         path_image = BasePathEnum.BACKGROUNDS_PATH.value / background.path_image
         self.new_layer = layer
         self.coef_shift_rate: CoefShiftRate = background.coef_shift_rate
@@ -91,60 +104,11 @@ class BackgroundsObject(BaseObject):
         )
         self.rect = self.image.get_frect()
 
-    def _create_left_right_adjacent_backgrounds(self) -> Tuple['BackgroundsObject', 'BackgroundsObject']:
-        """Создаёт левый и правый фоны.
-
-        Returns:
-            Tuple[BackgroundsObject, BackgroundsObject]: левый и правый фоны.
-        """
-        background_left, background_right = (
-            self.adjacent_backgrounds.get(DirectionEnum.LEFT),
-            self.adjacent_backgrounds.get(DirectionEnum.RIGHT),
-        )
-        if not background_left:
-            background_left = BackgroundsObject(self.background, self.new_layer)
-            self.adjacent_backgrounds[DirectionEnum.LEFT] = background_left
-            background_left.rect.topright = self.rect.topleft
-            background_left.adjacent_backgrounds[OPPOSITE_DIRECTIONS[DirectionEnum.LEFT]] = self
-        if not background_right:
-            background_right = BackgroundsObject(self.background, self.new_layer)
-            self.adjacent_backgrounds[DirectionEnum.RIGHT] = background_right
-            background_right.rect.topleft = self.rect.topright
-            background_right.adjacent_backgrounds[OPPOSITE_DIRECTIONS[DirectionEnum.RIGHT]] = self
-        return background_left, background_right
-
-    def _create_up_down_adjacent_backgrounds(self) -> Tuple['BackgroundsObject', 'BackgroundsObject']:
-        """Создаёт верхний и нижний фоны.
-
-        Returns:
-            Tuple[BackgroundsObject, BackgroundsObject]: верхний и нижний фоны.
-        """
-        background_up, background_down = (
-            self.adjacent_backgrounds.get(DirectionEnum.UP),
-            self.adjacent_backgrounds.get(DirectionEnum.DOWN),
-        )
-        if not background_up:
-            background_up = BackgroundsObject(self.background, self.new_layer)
-            self.adjacent_backgrounds[DirectionEnum.UP] = background_up
-            background_up.rect.bottomleft = self.rect.topleft
-            background_up.adjacent_backgrounds[OPPOSITE_DIRECTIONS[DirectionEnum.UP]] = self
-        if not background_down:
-            background_down = BackgroundsObject(self.background, self.new_layer)
-            self.adjacent_backgrounds[DirectionEnum.DOWN] = background_down
-            background_down.rect.topleft = self.rect.bottomleft
-            background_down.adjacent_backgrounds[OPPOSITE_DIRECTIONS[DirectionEnum.DOWN]] = self
-        return background_up, background_down
-
     def create_adjacent_backgrounds(self) -> None:
-        """Создаёт соседние фоны."""
-        background_up, background_down = self._create_up_down_adjacent_backgrounds()
-        background_left, background_right = self._create_left_right_adjacent_backgrounds()
-        background_up_left, background_up_right = background_up._create_left_right_adjacent_backgrounds()
-        background_down_left, background_down_right = background_down._create_left_right_adjacent_backgrounds()
-        background_left.adjacent_backgrounds[DirectionEnum.UP] = background_up_left
-        background_left.adjacent_backgrounds[DirectionEnum.DOWN] = background_down_left
-        background_right.adjacent_backgrounds[DirectionEnum.UP] = background_up_right
-        background_right.adjacent_backgrounds[DirectionEnum.DOWN] = background_down_right
+        """Создаёт соседние фоны. Устарело и ничего не делает: слой выводится сеткой,
+        которая покрывает видимую часть карты без соседних объектов.
+        """
+        warn('BackgroundsObject.create_adjacent_backgrounds устарел', DeprecationWarning, stacklevel=2)
 
 
 class BackgroundsSurface:
@@ -153,10 +117,12 @@ class BackgroundsSurface:
     Attributes:
         _base_visible_map_size (Size): размер видимой игровой карты.
         _backgrounds_group (BackgroundsGroup): группа заднего плана.
+        _dynamic_resolution (DynamicResolution): динамическое разрешение вывода.
     """
 
     _base_visible_map_size: Size = Size(*Settings()['engine']['base_visible_map_size'])
     _backgrounds_group: BackgroundsGroup = BackgroundsGroup()
+    _dynamic_resolution: DynamicResolution = DynamicResolution()
 
     def __init__(self, *args: Background) -> None:
         """Инициализация заднего плана."""
@@ -172,7 +138,7 @@ class BackgroundsSurface:
         Args:
             surface (Surface): отображение для отрисовки заднего плана.
         """
+        if self._dynamic_resolution.get_scale(surface) != 1:
+            surface.blit(self._dynamic_resolution.get_image(self.image), (0, 0))
+            return
         surface.blit(self.image, self.rect)
-
-    def move(self, move: Coordinate) -> None:
-        pass
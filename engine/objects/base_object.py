@@ -2,6 +2,7 @@ from pygame import sprite, mask as mk
 
 from engine.objects.groups import AllObjectsGroup, BaseGroup
 from engine.constants.empty import EMPTY_FRAME, ZERO_COORDINATES, ZERO_COORDINATES_SHIFT
+from engine.objects.constants import DEFAULT_COLLISION_CATEGORY, ALL_COLLISION_CATEGORIES
 
 
 class BaseObject(sprite.Sprite):
@@ -10,10 +11,19 @@ class BaseObject(sprite.Sprite):
     Attributes:
         _all_objects_group (AllObjectsGroup): группа всех игровых объектов.
         groups (tuple[BaseGroup, ...]): кортеж групп игровых объектов. По дефолту tuple.
+        is_static (bool): флаг неподвижного объекта. По дефолту False.
+        render_layer (int): слой вывода в очереди вывода. По дефолту 0.
+        collision_category (int): битовая категория коллизии объекта. По дефолту DEFAULT_COLLISION_CATEGORY.
+        collision_mask (int): битовая маска категорий, с которыми объект сталкивается.
+            По дефолту ALL_COLLISION_CATEGORIES.
     """
 
     _all_objects_group = AllObjectsGroup()
     groups: tuple[BaseGroup, ...] = tuple()
+    is_static: bool = False
+    render_layer: int = 0
+    collision_category: int = DEFAULT_COLLISION_CATEGORY
+    collision_mask: int = ALL_COLLISION_CATEGORIES
 
     def __init__(self) -> None:
         """Инициализация базового объекта."""
@@ -28,3 +38,14 @@ class BaseObject(sprite.Sprite):
         self.coordinate_shift = ZERO_COORDINATES_SHIFT
         self.mask = mk.from_surface(self.image)
         self.rect_mask = self.mask
+
+    def can_collide(self, obj: 'BaseObject') -> bool:
+        """Проверяет, что категории коллизии объектов подходят под маски друг друга.
+
+        Args:
+            obj (BaseObject): объект для проверки.
+
+        Returns:
+            bool: флаг возможности коллизии.
+        """
+        return bool(self.collision_category & obj.collision_mask and obj.collision_category & self.collision_mask)
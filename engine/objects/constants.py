@@ -1,3 +1,4 @@
+from collections import namedtuple
 from enum import StrEnum
 
 
@@ -30,3 +31,24 @@ class NameStatusEnum(StrEnum):
     FALL = 'fall'
     JUMP = 'jump'
     DOUBLE_JUMP = 'double_jump'
+    TRIGGER_ENTER = 'trigger_enter'
+    TRIGGER_STAY = 'trigger_stay'
+    TRIGGER_EXIT = 'trigger_exit'
+
+
+Resolution = namedtuple('Resolution', ('coordinate', 'side', 'depth'))
+Manifold = namedtuple('Manifold', ('obj', 'side', 'depth', 'rect', 'point'))
+CastHit = namedtuple('CastHit', ('obj', 'distance', 'coordinate'))
+
+
+MOVEMENT_SPEEDS = (
+    NameSpeedEnum.WALK,
+    NameSpeedEnum.RUN,
+    NameSpeedEnum.SQUAT,
+    NameSpeedEnum.FALL,
+    NameSpeedEnum.JUMP,
+    NameSpeedEnum.DOUBLE_JUMP,
+)
+INTEGRATOR_CAPACITY = 64
+DEFAULT_COLLISION_CATEGORY = 1
+ALL_COLLISION_CATEGORIES = 0xFFFFFFFF
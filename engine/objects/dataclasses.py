@@ -1,8 +1,11 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from typing import TYPE_CHECKING
 
 from pygame import mouse
 
+from engine.map import VisibleMap
+from engine.render import Presenter
+
 if TYPE_CHECKING:
     from engine.objects import Object
 
@@ -48,6 +51,9 @@ class Status:
         obj (Object): игровой объект.
         inactive (bool): статус неактивности.
         focus (bool): статус фокуса.
+        trigger_enter (bool): статус входа в пересечение с триггером.
+        trigger_stay (bool): статус нахождения в пересечении с триггером.
+        trigger_exit (bool): статус выхода из пересечения с триггером.
         jump (bool): статус прыжка.
         double_jump (bool): статус двойного прыжка.
         fall (bool): статус падения.
@@ -58,17 +64,32 @@ class Status:
     _obj: 'Object'
     inactive: bool = False
     focus: bool = False
+    trigger_enter: bool = False
+    trigger_stay: bool = False
+    trigger_exit: bool = False
 
     @property
     def collision_mos(self) -> bool:
         """Флаг коллизии объекта с мышкой.
+        Координаты мышки переводятся из координат дисплея в мировые,
+        для объектов групп без сдвига на смещение камеры - в экранные.
 
         Returns:
             bool: флаг коллизии объекта с мышкой.
         """
-        pos = mouse.get_pos()
-        pos_in_mask = pos[0] - self._obj.rect.x, pos[1] - self._obj.rect.y
-        return bool(self._obj.rect.collidepoint(*pos) and self._obj.mask.get_at(pos_in_mask))
+        is_shifted = all(group.is_shifted for group in self._obj.groups)
+        pos = VisibleMap().to_world(Presenter().to_visible_map(mouse.get_pos()), 1, is_shifted)
+        if not self._obj.rect.collidepoint(pos):
+            return False
+        return bool(self._obj.mask.get_at((int(pos.x - self._obj.rect.x), int(pos.y - self._obj.rect.y))))
+
+    def get_values(self) -> tuple[bool, ...]:
+        """Отдаёт значения статусов.
+
+        Returns:
+            tuple[bool, ...]: значения статусов без учёта коллизии с мышкой.
+        """
+        return tuple(getattr(self, field.name) for field in fields(self) if field.name != '_obj')
 
 
 @dataclass
@@ -1,16 +1,24 @@
-from typing import TYPE_CHECKING, Optional
+from math import hypot
+from warnings import warn
+from typing import TYPE_CHECKING, Callable, Iterator, Optional
 
 from pygame.sprite import Group
-from pygame import Surface, draw, FRect
+from pygame import Surface, draw, FRect, Mask
 
 from engine.events import Pressed
 from engine.metaclasses.singleton import SingletonMeta
 from engine.constants.direction import DirectionGroupEnum
 from engine.settings import Settings
-from engine.constants import Color, Coordinate
+from engine.constants import Color, Coordinate, Size
+from engine.collision import SpatialHash, StaticCollisionLayer, CollisionCache
+from engine.time import GlobalClock
+from engine.map import VisibleMap
+from engine.render import StaticRenderLayer, RenderQueue, DynamicResolution, StripRenderer, TextureRenderer
+from engine.objects.constants import Manifold, CastHit, ALL_COLLISION_CATEGORIES
 
 if TYPE_CHECKING:
     from engine.objects import Object
+    from engine.objects.integrator import BatchIntegrator
 
 
 class BaseGroup(Group, metaclass=SingletonMeta):
@@ -19,10 +27,151 @@ class BaseGroup(Group, metaclass=SingletonMeta):
     Attributes:
         _settings (Settings): объект настроек игрового процесса.
         _debug (bool): флаг debug-a.
+        _global_clock (GlobalClock): объект глобальных часов игрового процесса.
+        _collision_cache (CollisionCache): кэш проверок коллизии.
+        _visible_map (VisibleMap): отображение видимой части карты со смещением камеры.
+        _dynamic_resolution (DynamicResolution): динамическое разрешение вывода.
+        _strip_renderer (StripRenderer): вывод по горизонтальным полосам.
+        _culling_mode (bool): флаг отсечения спрайтов вне видимой части карты.
+        _culling_margin (Size): запас отсечения под coordinate_shift, равен размеру тайтла.
+        _static_layer_mode (bool): флаг запекания статических спрайтов в чанки статического слоя вывода.
+        _static_chunk_size (Size): размер чанка статического слоя вывода, кратен размеру тайтла.
+        is_screen_space (bool): флаг вывода группы в экранных координатах без смещения камеры(интерфейс).
+        culled (int): количество отсечённых спрайтов при последнем выводе.
     """
 
+    is_screen_space: bool = False
     _settings: Settings = Settings()
     _debug: bool = _settings['engine']['debug']['debug_mode']
+    _global_clock: GlobalClock = GlobalClock()
+    _collision_cache: CollisionCache = CollisionCache()
+    _visible_map: VisibleMap = VisibleMap()
+    _dynamic_resolution: DynamicResolution = DynamicResolution()
+    _strip_renderer: StripRenderer = StripRenderer()
+    _culling_mode: bool = _settings['engine']['render']['culling_mode']
+    _culling_margin: Size = Size(*_settings['engine']['tile_grid']['tile_size'])
+    _static_layer_mode: bool = _settings['engine']['render']['static_layer_mode']
+    _static_chunk_size: Size = Size(
+        _culling_margin.width * _settings['engine']['render']['static_chunk_tiles'],
+        _culling_margin.height * _settings['engine']['render']['static_chunk_tiles'],
+    )
+
+    def __init__(self, *sprites: 'Object') -> None:
+        """Инициализация группы объектов."""
+        self._previous_coordinates: dict['Object', Coordinate] = {}
+        self._draw_index = SpatialHash(self._culling_margin) if self._culling_mode else None
+        self._draw_order: dict['Object', int] = {}
+        self._draw_movable: dict['Object', None] = {}
+        self._count_added = 0
+        self._drawn: dict['Object', tuple[Surface, FRect]] = {}
+        self._removed_rects: list[FRect] = []
+        self._static_render_layer = StaticRenderLayer(self._static_chunk_size) if self._static_layer_mode else None
+        self.culled = 0
+        super().__init__(*sprites)
+
+    @property
+    def is_shifted(self) -> bool:
+        """Флаг сдвига группы на смещение камеры при выводе и проверке коллизии с мышкой.
+
+        Returns:
+            bool: False для групп в экранных координатах и групп, не переданных камере в groups_shift.
+        """
+        return not self.is_screen_space and self._visible_map.is_shifted(self)
+
+    @property
+    def offset(self) -> Coordinate:
+        """Смещение вывода группы.
+
+        Returns:
+            Coordinate: смещение камеры или нулевое смещение для групп без сдвига.
+        """
+        return self._visible_map.draw_offset if self.is_shifted else Coordinate(0, 0)
+
+    def add_internal(self, sprite: 'Object', layer: None = None) -> None:
+        """Добавляет объект в группу и индекс отсечения.
+
+        Args:
+            sprite (Object): объект.
+            layer (None, optional): слой, не используется. По дефолту None.
+        """
+        super().add_internal(sprite, layer)
+        if self._draw_index is None:
+            return
+        self._draw_index.add(sprite)
+        self._draw_order[sprite] = self._count_added
+        self._count_added += 1
+        if not sprite.is_static:
+            self._draw_movable[sprite] = None
+
+    def remove_internal(self, sprite: 'Object') -> None:
+        """Удаляет объект из группы и индекса отсечения, запоминает его область для перерисовки.
+
+        Args:
+            sprite (Object): объект.
+        """
+        super().remove_internal(sprite)
+        self._previous_coordinates.pop(sprite, None)
+        if drawn := self._drawn.pop(sprite, None):
+            self._removed_rects.append(drawn[1])
+        if self._static_render_layer is not None:
+            self._static_render_layer.remove(sprite)
+        if self._draw_index is None:
+            return
+        self._draw_index.remove(sprite)
+        self._draw_order.pop(sprite, None)
+        self._draw_movable.pop(sprite, None)
+
+    def rebucket_sprite(self, sprite: 'Object') -> None:
+        """Переносит нестатический спрайт в актуальные ячейки индекса отсечения после перемещения,
+        поэтому при выводе индекс только запрашивается.
+
+        Args:
+            sprite (Object): переместившийся спрайт.
+        """
+        if self._draw_index is not None and sprite in self._draw_movable:
+            self._draw_index.rebucket(sprite)
+
+    def _get_candidates(self, rect: FRect) -> list['Object']:
+        """Отдаёт объекты группы, которые могут пересекаться с rect.
+
+        Args:
+            rect (FRect): rect для поиска.
+
+        Returns:
+            list[Object]: объекты-кандидаты.
+        """
+        return self.sprites()
+
+    def _collide(
+        self,
+        obj: 'Object',
+        mask: Mask,
+        collide: Callable[['Object', DirectionGroupEnum | None], Coordinate | Manifold | None],
+        side: DirectionGroupEnum | None = None,
+    ) -> Optional[tuple['Object', Coordinate | Manifold]]:
+        """Проверяет коллизию объекта с кандидатами группы.
+        Сам объект и кандидаты с неподходящими категориями коллизии отбрасываются до проверки rect и маски.
+        Спящий объект, с которым произошла коллизия, пробуждается.
+
+        Args:
+            obj (Object): объект для проверки коллизии.
+            mask (Mask): маска объекта, используемая при проверке.
+            collide (Callable[[Object, DirectionGroupEnum | None], Coordinate | Manifold | None]):
+                метод объекта для проверки коллизии с кандидатом.
+            side (DirectionGroupEnum | None, optional): сторона для проверки. По дефолту None.
+
+        Returns:
+            Optional[tuple[Object, Coordinate | Manifold]]: объект, с которым произошла коллизия, и результат проверки.
+        """
+        for sprite in self._get_candidates(obj.rect):
+            if (
+                sprite is not obj
+                and obj.can_collide(sprite)
+                and (collision := self._collision_cache.collide(obj, sprite, mask, collide, side))
+            ):
+                if getattr(sprite, 'is_sleeping', False):
+                    sprite.wake_up()
+                return sprite, collision
 
     def collide_rect_with_mask(
         self,
@@ -38,9 +187,7 @@ class BaseGroup(Group, metaclass=SingletonMeta):
         Returns:
             Optional[tuple[Object, Coordinate]]: координаты коллизии и объект, с которым произошла коллизия.
         """
-        for sprite in self.sprites():
-            if coordinate := obj.collide_rect_with_mask(sprite, side):
-                return sprite, coordinate
+        return self._collide(obj, obj.rect_mask, obj.collide_rect_with_mask, side)
 
     def collide_mask(
         self,
@@ -56,9 +203,42 @@ class BaseGroup(Group, metaclass=SingletonMeta):
         Returns:
             Optional[tuple[Object, Coordinate]]: координаты коллизии и объект, с которым произошла коллизия.
         """
-        for sprite in self.sprites():
-            if coordinate := obj.collide_mask(sprite, side):
-                return sprite, coordinate
+        return self._collide(obj, obj.mask, obj.collide_mask, side)
+
+    def collide_rect_manifold(self, obj: 'Object', side: DirectionGroupEnum | None = None) -> Manifold | None:
+        """Отдаёт данные коллизии rect объекта с масками группы объектов.
+
+        Args:
+            obj (Object): объект для проверки коллизии.
+            side (DirectionGroupEnum | None, optional): сторона для проверки. По дефолту None.
+
+        Returns:
+            Manifold | None: данные коллизии.
+        """
+        if collision := self._collide(obj, obj.rect_mask, obj.collide_rect_manifold, side):
+            return collision[1]
+
+    def collide_mask_manifold(self, obj: 'Object', side: DirectionGroupEnum | None = None) -> Manifold | None:
+        """Отдаёт данные коллизии по маске с группой объектов.
+
+        Args:
+            obj (Object): объект для проверки коллизии.
+            side (DirectionGroupEnum | None, optional): сторона для проверки. По дефолту None.
+
+        Returns:
+            Manifold | None: данные коллизии.
+        """
+        if collision := self._collide(obj, obj.mask, obj.collide_mask_manifold, side):
+            return collision[1]
+
+    def move(self, move: Coordinate) -> None:
+        """Перемещение спрайтов. Устарело и ничего не делает: объекты хранят мировые координаты,
+        смещение камеры задаёт VisibleMap.offset и применяется при выводе.
+
+        Args:
+            move (Coordinate): перемещение по осям x, y.
+        """
+        warn(f'{type(self).__name__}.move устарел, используйте VisibleMap.offset', DeprecationWarning, stacklevel=2)
 
     def events(self, *args, **kwargs) -> None:
         """Запускает у объектов проверку событий."""
@@ -74,38 +254,187 @@ class BaseGroup(Group, metaclass=SingletonMeta):
         """
         if not self._debug:
             return
+        is_scaled = self._dynamic_resolution.get_scale(surface) != 1
+        color = Color(*self._settings['engine']['rect_outline']['rect_outline_color'])
+        width = self._settings['engine']['rect_outline']['rect_outline_width']
         for sprite in self.sprites():
-            draw.rect(
-                surface,
-                Color(*self._settings['engine']['rect_outline']['rect_outline_color']),
-                sprite.rect,
-                width=self._settings['engine']['rect_outline']['rect_outline_width'],
-            )
+            rect = sprite.rect.move(self.offset)
+            if isinstance(surface, TextureRenderer):
+                surface.draw_rect(color, rect, width)
+                continue
+            draw.rect(surface, color, self._dynamic_resolution.scale_rect(rect) if is_scaled else rect, width=width)
+
+    def save_previous_coordinates(self) -> None:
+        """Запоминает положение спрайтов перед шагом симуляции для интерполяции при выводе."""
+        self._previous_coordinates = {sprite: Coordinate(sprite.rect.x, sprite.rect.y) for sprite in self.sprites()}
+
+    def _get_interpolated_coordinate(self, sprite: 'Object') -> Coordinate:
+        """Отдаёт положение спрайта между предыдущим и текущим шагом симуляции.
+
+        Args:
+            sprite (Object): спрайт.
+
+        Returns:
+            Coordinate: интерполированное положение спрайта.
+        """
+        rect, alpha = sprite.rect, self._global_clock.alpha
+        if not (previous := self._previous_coordinates.get(sprite)):
+            return Coordinate(rect.x, rect.y)
+        return Coordinate(previous.x + (rect.x - previous.x) * alpha, previous.y + (rect.y - previous.y) * alpha)
 
-    def draw(self, surface: Surface, *args, **kwargs) -> None:
-        """Добавляет обводку спрайтам при отладке и меняет логину отрисовки."""
+    def _get_visible_sprites(self, surface: Surface, area: FRect | None = None) -> list['Object']:
+        """Отдаёт спрайты, изображение которых пересекает отображение, в порядке добавления в группу.
+        Кандидаты берутся из индекса отсечения по видимой области в мировых координатах с запасом под coordinate_shift.
+
+        Args:
+            surface (Surface): отображение.
+            area (FRect | None, optional): область отображения, по которой запрашивается индекс.
+                По дефолту None - всё отображение.
+
+        Returns:
+            list[Object]: видимые спрайты.
+        """
+        scale = self._dynamic_resolution.get_scale(surface)
+        visible_rect = FRect(0, 0, surface.get_width() / scale, surface.get_height() / scale)
+        if area:
+            visible_rect = visible_rect.clip(area)
+        world_rect = FRect(self._visible_map.to_world(visible_rect.topleft, 1, self.is_shifted), visible_rect.size)
+        sprites = [
+            spr
+            for spr in self._draw_index.query(world_rect.inflate(self._culling_margin))
+            if visible_rect.colliderect(self._get_blit_rect(spr))
+        ]
+        sprites.sort(key=self._draw_order.__getitem__)
+        return sprites
+
+    def _get_blit_coordinate(self, sprite: 'Object', scale: float = 1) -> Coordinate:
+        """Отдаёт координаты вывода изображения спрайта с учётом интерполяции, coordinate_shift и смещения камеры.
+
+        Args:
+            sprite (Object): спрайт.
+            scale (float, optional): масштаб цели вывода. По дефолту 1.
+
+        Returns:
+            Coordinate: координаты вывода.
+        """
+        coordinate = self._get_interpolated_coordinate(sprite) if self._global_clock.is_interpolation else sprite.rect
+        return self._visible_map.to_screen(
+            (coordinate.x - sprite.coordinate_shift.x, coordinate.y - sprite.coordinate_shift.y),
+            scale,
+            self.is_shifted,
+        )
+
+    def _get_blit_rect(self, sprite: 'Object') -> FRect:
+        """Отдаёт область вывода изображения спрайта.
+
+        Args:
+            sprite (Object): спрайт.
+
+        Returns:
+            FRect: область вывода.
+        """
+        return FRect(self._get_blit_coordinate(sprite), sprite.image.get_size())
+
+    def get_dirty_rects(self) -> list[FRect]:
+        """Отдаёт области спрайтов, сменивших изображение или положение с прошлого вызова, и удалённых спрайтов.
+        Текущие изображения и области запоминаются как выведенные.
+
+        Returns:
+            list[FRect]: области для перерисовки.
+        """
+        dirty_rects, self._removed_rects = self._removed_rects, []
+        drawn: dict['Object', tuple[Surface, FRect]] = {}
+        for spr in self.sprites():
+            rect = self._get_blit_rect(spr)
+            previous = self._drawn.get(spr)
+            if not previous or previous[0] is not spr.image or previous[1] != rect:
+                dirty_rects.append(rect)
+                if previous:
+                    dirty_rects.append(previous[1])
+            drawn[spr] = (spr.image, rect)
+        self._drawn = drawn
+        return dirty_rects
+
+    def bake_static(self) -> None:
+        """Запекает ещё не запечённые статические спрайты в статический слой вывода."""
+        if self._static_render_layer is None:
+            return
+        for sprite in self.sprites():
+            if sprite.is_static and sprite not in self._static_render_layer:
+                self._static_render_layer.add(sprite)
+                if self._draw_index is not None:
+                    self._draw_index.remove(sprite)
+
+    def _get_draw_sprites(self, surface: Surface, area: FRect | None = None) -> list['Object']:
+        """Добавляет обводку спрайтам при отладке, выводит статический слой и отдаёт спрайты для вывода.
+        При отсечении отдаются только спрайты, пересекающие отображение или область, индекс запрашивается по области.
+        Запечённые статические спрайты выводятся чанками статического слоя под остальными спрайтами.
+
+        Args:
+            surface (Surface): отображение.
+            area (FRect | None, optional): область, вне которой спрайты не выводятся. По дефолту None.
+
+        Returns:
+            list[Object]: спрайты для вывода.
+        """
         self._debug_mode(surface)
+        static_render_layer = self._static_render_layer or ()
+        if static_render_layer:
+            static_render_layer.draw(surface, self.offset, area, self._dynamic_resolution.get_scale(surface))
         sprites = self.sprites()
-        self.spritedict.update(
-            zip(
-                sprites,
-                surface.blits(
-                    (spr.image, (spr.rect.x - spr.coordinate_shift.x, spr.rect.y - spr.coordinate_shift.y))
-                    for spr in sprites
-                ),
-            )
+        if self._draw_index is not None:
+            visible_sprites = self._get_visible_sprites(surface, area)
+            if not area:
+                self.culled = len(sprites) - len(visible_sprites) - len(static_render_layer)
+            return visible_sprites
+        if static_render_layer:
+            sprites = [spr for spr in sprites if spr not in static_render_layer]
+        if area:
+            sprites = [spr for spr in sprites if area.colliderect(self._get_blit_rect(spr))]
+        return sprites
+
+    def _get_blits(self, surface: Surface, sprites: list['Object']) -> Iterator[tuple[Surface, Coordinate]]:
+        """Отдаёт изображения и координаты вывода спрайтов.
+        При выводе на уменьшенную цель динамического разрешения изображения и координаты масштабируются.
+
+        Args:
+            surface (Surface): отображение.
+            sprites (list[Object]): спрайты.
+
+        Returns:
+            Iterator[tuple[Surface, Coordinate]]: изображения и координаты вывода.
+        """
+        if (scale := self._dynamic_resolution.get_scale(surface)) == 1:
+            return ((spr.image, self._get_blit_coordinate(spr)) for spr in sprites)
+        return (
+            (self._dynamic_resolution.get_image(spr.image), self._get_blit_coordinate(spr, scale)) for spr in sprites
         )
 
-    def move(self, move: Coordinate) -> None:
-        """Перемещение спрайтов.
+    def draw(self, surface: Surface, area: FRect | None = None, *args, **kwargs) -> None:
+        """Выводит спрайты группы одним вызовом blits.
+        При выводе по полосам спрайты выводятся по горизонтальным полосам, выведенные области не запоминаются.
 
         Args:
-            move (Coordinate): перемещение по осям x, y.
+            surface (Surface): отображение.
+            area (FRect | None, optional): область, вне которой спрайты не выводятся. По дефолту None.
         """
-        for sprite in self.sprites():
-            rect: FRect = sprite.rect
-            rect.x += move.x
-            rect.y += move.y
+        sprites = self._get_draw_sprites(surface, area)
+        if self._strip_renderer.is_enabled:
+            self._strip_renderer.blits(surface, self._get_blits(surface, sprites))
+            return
+        self.spritedict.update(zip(sprites, surface.blits(self._get_blits(surface, sprites))))
+
+    def submit(self, render_queue: RenderQueue, surface: Surface, area: FRect | None = None) -> None:
+        """Добавляет спрайты группы в очередь вывода со слоем вывода и нижней границей rect-а как ключом по y.
+
+        Args:
+            render_queue (RenderQueue): очередь вывода.
+            surface (Surface): отображение.
+            area (FRect | None, optional): область, вне которой спрайты не выводятся. По дефолту None.
+        """
+        sprites = self._get_draw_sprites(surface, area)
+        for spr, (image, coordinate) in zip(sprites, self._get_blits(surface, sprites)):
+            render_queue.submit(image, coordinate, spr.render_layer, spr.rect.bottom)
 
 
 class AllObjectsGroup(BaseGroup):
@@ -113,8 +442,568 @@ class AllObjectsGroup(BaseGroup):
 
 
 class SolidObjectsGroup(BaseGroup):
-    """Группа твёрдых объектов."""
+    """Группа твёрдых объектов. Хранит объекты в пространственном хэше,
+    поэтому проверка коллизии затрагивает только объекты из ячеек, которые пересекает rect.
+    Статические объекты после запекания проверяются через статический слой коллизий.
+
+    Attributes:
+        _cell_size (Size): размер ячейки пространственного хэша, равен размеру тайтла.
+        _static_collision_layer (StaticCollisionLayer): статический слой коллизий.
+    """
+
+    _cell_size: Size = Size(*BaseGroup._settings['engine']['tile_grid']['tile_size'])
+    _static_collision_layer: StaticCollisionLayer = StaticCollisionLayer()
+
+    def __init__(self, *sprites: 'Object') -> None:
+        """Инициализация группы твёрдых объектов."""
+        self._spatial_hash = SpatialHash(self._cell_size)
+        self._rects: dict['Object', tuple[float, float, float, float] | None] = {}
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite: 'Object', layer: None = None) -> None:
+        """Добавляет объект в группу и пространственный хэш и пробуждает спящие объекты рядом с ним.
+
+        Args:
+            sprite (Object): объект.
+            layer (None, optional): слой, не используется. По дефолту None.
+        """
+        super().add_internal(sprite, layer)
+        self._spatial_hash.add(sprite)
+        self._rects[sprite] = None
+        if rect := self._update_rect(sprite):
+            DynamicObjectsGroup().wake_up(rect)
+
+    def remove_internal(self, sprite: 'Object') -> None:
+        """Удаляет объект из группы и пространственного хэша.
+
+        Args:
+            sprite (Object): объект.
+        """
+        super().remove_internal(sprite)
+        self._spatial_hash.remove(sprite)
+        self._rects.pop(sprite, None)
+        self._static_collision_layer.remove(sprite)
+        DynamicObjectsGroup().wake_up(sprite.rect)
+
+    def _get_candidates(self, rect: FRect) -> list['Object']:
+        return self._spatial_hash.query(rect)
+
+    def _collide_static(
+        self,
+        obj: 'Object',
+        mask: Mask,
+        collide: Callable[['Object', DirectionGroupEnum | None], Coordinate | Manifold | None],
+        side: DirectionGroupEnum | None = None,
+    ) -> Optional[tuple['Object', Coordinate | Manifold]]:
+        """Проверяет коллизию со статическим слоем. Слой отсеивает чанки без коллизии,
+        объекты оставшихся чанков проверяются так же, как объекты хэша.
+
+        Args:
+            obj (Object): объект для проверки коллизии.
+            mask (Mask): маска объекта для проверки по слою.
+            collide (Callable[[Object, DirectionGroupEnum | None], Coordinate | Manifold | None]):
+                метод объекта для проверки коллизии со статическим объектом.
+            side (DirectionGroupEnum | None, optional): сторона для проверки. По дефолту None.
+
+        Returns:
+            Optional[tuple[Object, Coordinate | Manifold]]: объект, с которым произошла коллизия, и результат проверки.
+        """
+        for sprite in self._static_collision_layer.get_colliding_sprites(obj.rect, mask, obj.collision_mask):
+            if obj.can_collide(sprite) and (
+                collision := self._collision_cache.collide(obj, sprite, mask, collide, side)
+            ):
+                return sprite, collision
+
+    def _collide(
+        self,
+        obj: 'Object',
+        mask: Mask,
+        collide: Callable[['Object', DirectionGroupEnum | None], Coordinate | Manifold | None],
+        side: DirectionGroupEnum | None = None,
+    ) -> Optional[tuple['Object', Coordinate | Manifold]]:
+        if collision := self._collide_static(obj, mask, collide, side):
+            return collision
+        return super()._collide(obj, mask, collide, side)
+
+    def get_obstacles(self, rect: FRect, obj: Optional['Object'] = None) -> list['Object']:
+        """Отдаёт статические и динамические твёрдые объекты, пересекающие rect.
+        Объекты, которые только касаются rect краем, не пересекают его.
+
+        Args:
+            rect (FRect): rect для поиска.
+            obj (Optional[Object], optional): перемещаемый объект для фильтрации по категориям коллизии,
+                сам объект в кандидаты не попадает. По дефолту None.
+
+        Returns:
+            list[Object]: объекты-кандидаты.
+        """
+        collision_mask = obj.collision_mask if obj else ALL_COLLISION_CATEGORIES
+        return [
+            sprite
+            for sprite in (
+                *self._static_collision_layer.get_sprites(rect, collision_mask),
+                *self._get_candidates(rect),
+            )
+            if (not obj or sprite is not obj and obj.can_collide(sprite)) and rect.colliderect(sprite.rect)
+        ]
+
+    @staticmethod
+    def _collide_candidates(rect: FRect, mask: Mask, candidates: list['Object']) -> Optional['Object']:
+        """Проверяет коллизию rect с маской по списку кандидатов.
+
+        Args:
+            rect (FRect): rect маски.
+            mask (Mask): маска для проверки.
+            candidates (list[Object]): объекты-кандидаты.
+
+        Returns:
+            Optional[Object]: объект, с которым произошла коллизия.
+        """
+        for sprite in candidates:
+            if rect.colliderect(sprite.rect) and sprite.mask.overlap(
+                mask, (rect.x - sprite.rect.x, rect.y - sprite.rect.y)
+            ):
+                return sprite
+
+    def sweep(
+        self,
+        rect: FRect,
+        mask: Mask,
+        move: Coordinate,
+        obj: Optional['Object'] = None,
+    ) -> tuple[Coordinate, Optional['Object']]:
+        """Непрерывное перемещение маски до первого касания с твёрдым объектом.
+        Кандидаты один раз отбираются по rect всего пути. Путь проходится шагами не больше размера rect,
+        поэтому тонкие объекты не пропускаются, а точка касания уточняется бинарным поиском
+        по целым пикселям, так что маска останавливается вплотную к объекту. Спящий объект касания пробуждается.
+        Проверки идут мимо кэша коллизий, т.к. промежуточные положения в пределах шага не повторяются.
+
+        Args:
+            rect (FRect): rect маски в начале перемещения.
+            mask (Mask): маска для проверки.
+            move (Coordinate): перемещение по осям x, y.
+            obj (Optional[Object], optional): перемещаемый объект для фильтрации по категориям коллизии.
+                По дефолту None.
+
+        Returns:
+            tuple[Coordinate, Optional[Object]]: допустимое перемещение и объект, с которым произошла коллизия.
+        """
+        distance = max(abs(move.x), abs(move.y))
+        if not distance:
+            return move, None
+        candidates = self.get_obstacles(rect.union(rect.move(move)), obj)
+        if not candidates:
+            return move, None
+        step_x, step_y = move.x / distance, move.y / distance
+        max_step = max(1, int(min(rect.width if step_x else distance, rect.height if step_y else distance)))
+        current_rect = rect.copy()
+        low = 0
+        while low < distance:
+            high = min(low + max_step, distance)
+            current_rect.topleft = (rect.x + step_x * high, rect.y + step_y * high)
+            if sprite := self._collide_candidates(current_rect, mask, candidates):
+                break
+            low = high
+        else:
+            return move, None
+        while high - low > 1:
+            middle = (low + high) // 2
+            current_rect.topleft = (rect.x + step_x * middle, rect.y + step_y * middle)
+            if collided_sprite := self._collide_candidates(current_rect, mask, candidates):
+                high, sprite = middle, collided_sprite
+            else:
+                low = middle
+        if getattr(sprite, 'is_sleeping', False):
+            sprite.wake_up()
+        return Coordinate(step_x * low, step_y * low), sprite
+
+    @staticmethod
+    def _march_mask(
+        sprite: 'Object',
+        origin: Coordinate,
+        step: Coordinate,
+        start: float,
+        end: float,
+    ) -> Optional[float]:
+        """Проходит луч по маске объекта с шагом в 1 пиксель.
+
+        Args:
+            sprite (Object): объект, маска которого проверяется.
+            origin (Coordinate): начало луча.
+            step (Coordinate): единичное направление луча.
+            start (float): расстояние, с которого начинается проход.
+            end (float): расстояние, на котором проход заканчивается.
+
+        Returns:
+            Optional[float]: расстояние до первого непрозрачного пикселя маски.
+        """
+        width, height = sprite.mask.get_size()
+        distance = start
+        while distance <= end:
+            x = int(origin.x + step.x * distance - sprite.rect.x)
+            y = int(origin.y + step.y * distance - sprite.rect.y)
+            if 0 <= x < width and 0 <= y < height and sprite.mask.get_at((x, y)):
+                return distance
+            distance += 1
+
+    def raycast(
+        self,
+        origin: Coordinate,
+        direction: Coordinate,
+        max_distance: float,
+        obj: Optional['Object'] = None,
+    ) -> Optional[CastHit]:
+        """Пускает луч и отдаёт первое пересечение с маской твёрдого объекта.
+        Кандидаты отбираются по rect луча, маски проходятся только на отрезке луча внутри rect кандидата.
+        Положение объектов не меняется, проверки идут мимо кэша коллизий.
+
+        Args:
+            origin (Coordinate): начало луча.
+            direction (Coordinate): направление луча.
+            max_distance (float): длина луча.
+            obj (Optional[Object], optional): объект, от которого пускается луч, для фильтрации
+                по категориям коллизии. По дефолту None.
+
+        Returns:
+            Optional[CastHit]: объект, расстояние и координаты первого пересечения.
+        """
+        length = hypot(direction.x, direction.y)
+        if not length or max_distance <= 0:
+            return
+        step = Coordinate(direction.x / length, direction.y / length)
+        end = Coordinate(origin.x + step.x * max_distance, origin.y + step.y * max_distance)
+        rect = FRect(min(origin.x, end.x), min(origin.y, end.y), abs(end.x - origin.x) + 1, abs(end.y - origin.y) + 1)
+        hit = None
+        for sprite in self.get_obstacles(rect, obj):
+            if not (clipped_line := sprite.rect.clipline(origin, end)):
+                continue
+            (x, y), _ = clipped_line
+            start = hypot(x - origin.x, y - origin.y)
+            limit = hit.distance if hit else max_distance
+            if start >= limit:
+                continue
+            distance = self._march_mask(sprite, origin, step, start, limit)
+            if distance is not None and (not hit or distance < hit.distance):
+                hit = CastHit(sprite, distance, Coordinate(origin.x + step.x * distance, origin.y + step.y * distance))
+        return hit
+
+    def shapecast(
+        self,
+        rect: FRect,
+        delta: Coordinate,
+        mask: Mask | None = None,
+        obj: Optional['Object'] = None,
+    ) -> Optional[CastHit]:
+        """Перемещает фигуру на delta и отдаёт первое касание с твёрдым объектом.
+        Положение объектов не меняется, проверки идут мимо кэша коллизий.
+
+        Args:
+            rect (FRect): rect фигуры.
+            delta (Coordinate): перемещение по осям x, y.
+            mask (Mask | None, optional): маска фигуры. По дефолту None - заполненный rect.
+            obj (Optional[Object], optional): объект фигуры для фильтрации по категориям коллизии.
+                По дефолту None.
+
+        Returns:
+            Optional[CastHit]: объект, пройденное расстояние и координаты rect-а в точке касания.
+        """
+        if mask is None:
+            mask = Mask((int(rect.width), int(rect.height)), fill=True)
+        move, sprite = self.sweep(rect, mask, delta, obj)
+        if not sprite:
+            return
+        return CastHit(sprite, hypot(move.x, move.y), Coordinate(rect.x + move.x, rect.y + move.y))
+
+    def bake_static(self) -> None:
+        """Запекает ещё не запечённые статические объекты в статические слои вывода и коллизий."""
+        super().bake_static()
+        for sprite in self.sprites():
+            if sprite.is_static and sprite not in self._static_collision_layer:
+                self._spatial_hash.remove(sprite)
+                self._rects.pop(sprite, None)
+                self._static_collision_layer.add(sprite)
+
+    def _update_rect(self, sprite: 'Object') -> FRect | None:
+        """Запоминает rect объекта из пространственного хэша.
+
+        Args:
+            sprite (Object): объект.
+
+        Returns:
+            FRect | None: область старого и нового rect, если rect изменился.
+        """
+        if (rect := getattr(sprite, 'rect', None)) is None or (previous := self._rects[sprite]) == tuple(rect):
+            return
+        self._rects[sprite] = tuple(rect)
+        return rect.union(previous) if previous else rect.copy()
+
+    def rebucket(self) -> None:
+        """Переносит переместившиеся объекты в актуальные ячейки пространственного хэша
+        и пробуждает спящие объекты рядом с объектами, rect которых изменился.
+        """
+        self._spatial_hash.rebucket_all()
+        if rects := [rect for sprite in self._rects if (rect := self._update_rect(sprite))]:
+            DynamicObjectsGroup().wake_up(*rects)
+
+    def rebucket_sprite(self, sprite: 'Object') -> None:
+        """Переносит объект в актуальные ячейки сразу после перемещения, чтобы следующие проверки
+        коллизии в том же шаге видели его новое положение, и пробуждает спящие объекты рядом.
+        Запечённый статический объект перезапекается.
+
+        Args:
+            sprite (Object): переместившийся объект.
+        """
+        super().rebucket_sprite(sprite)
+        if sprite in self._spatial_hash:
+            self._spatial_hash.rebucket(sprite)
+            if rect := self._update_rect(sprite):
+                DynamicObjectsGroup().wake_up(rect)
+        elif sprite in self._static_collision_layer:
+            self._static_collision_layer.rebake(sprite)
+
+    def move_sprite(self, sprite: 'Object', move: Coordinate, is_swept: bool = False) -> bool:
+        """Перемещение объекта. Без непрерывного перемещения коллизия проверяется в конечной точке,
+        при коллизии перемещение отменяется и объект доводится до точки касания.
+
+        Args:
+            sprite (Object): перемещаемый объект.
+            move (Coordinate): перемещение по осям x, y.
+            is_swept (bool, optional): флаг непрерывного перемещения до точки касания. По дефолту False.
+
+        Returns:
+            bool: флаг коллизии.
+        """
+        if is_swept:
+            swept_move, collided_sprite = self.sweep(sprite.rect, sprite.rect_mask, move, sprite)
+            sprite.rect.x += swept_move.x
+            sprite.rect.y += swept_move.y
+            self.rebucket_sprite(sprite)
+            return collided_sprite is not None
+        sprite.rect.x += move.x
+        sprite.rect.y += move.y
+        self.rebucket_sprite(sprite)
+        if not self.collide_rect_with_mask(sprite):
+            return False
+        sprite.rect.x -= move.x
+        sprite.rect.y -= move.y
+        swept_move, collided_sprite = self.sweep(sprite.rect, sprite.rect_mask, move, sprite)
+        if collided_sprite:
+            sprite.rect.x += swept_move.x
+            sprite.rect.y += swept_move.y
+        self.rebucket_sprite(sprite)
+        return True
 
 
 class DynamicObjectsGroup(BaseGroup):
-    """Группа динамических объектов."""
+    """Группа динамических объектов.
+    Спящие объекты хранятся в пространственном хэше, поэтому пробуждение затрагивает только объекты
+    из ячеек рядом с изменением. Спящий объект не перемещается, поэтому переносится в ячейки один раз при засыпании.
+
+    Attributes:
+        _wake_up_distance (Size): расстояние, на котором пробуждаются спящие объекты, равно размеру тайтла.
+        _is_batched (bool): флаг пакетного интегратора движения.
+        _is_swept (bool): флаг непрерывного перемещения до точки касания.
+        _sleeping_mode (bool): флаг засыпания динамических объектов в покое.
+    """
+
+    _wake_up_distance: Size = Size(*BaseGroup._settings['engine']['tile_grid']['tile_size'])
+    _is_batched: bool = BaseGroup._settings['engine']['physics']['batched_integrator']
+    _is_swept: bool = BaseGroup._settings['engine']['physics']['swept_movement']
+    _sleeping_mode: bool = BaseGroup._settings['engine']['physics']['sleeping_mode']
+
+    def __init__(self, *sprites: 'Object') -> None:
+        """Инициализация группы динамических объектов и пакетного интегратора, если он включён."""
+        self._spatial_hash = SpatialHash(self._wake_up_distance)
+        self.integrator: 'BatchIntegrator | None' = None
+        if self._is_batched:
+            from engine.objects.integrator import BatchIntegrator
+
+            self.integrator = BatchIntegrator()
+        super().__init__(*sprites)
+
+    def remove_internal(self, sprite: 'Object') -> None:
+        """Удаляет объект из группы, пространственного хэша спящих объектов и пакетного интегратора.
+
+        Args:
+            sprite (Object): объект.
+        """
+        super().remove_internal(sprite)
+        self._spatial_hash.remove(sprite)
+        if self.integrator is not None:
+            self.integrator.remove(sprite)
+
+    def get_movement(self, sprite: 'Object') -> Coordinate:
+        """Отдаёт перемещение объекта с начала шага симуляции.
+
+        Args:
+            sprite (Object): объект.
+
+        Returns:
+            Coordinate: перемещение по осям x, y, для объектов не из группы - нулевое.
+        """
+        if not (previous := self._previous_coordinates.get(sprite)):
+            return Coordinate(0, 0)
+        return Coordinate(sprite.rect.x - previous.x, sprite.rect.y - previous.y)
+
+    def integrate(self) -> None:
+        """Пакетный шаг движения всех объектов, если интегратор включён."""
+        if self.integrator is not None:
+            self.integrator.step(self._global_clock.dt, SolidObjectsGroup(), self._is_swept)
+
+    def wake_up(self, *rects: FRect) -> None:
+        """Пробуждает спящие объекты рядом с rect-ами.
+
+        Args:
+            rects (FRect): rect-ы, рядом с которыми произошло изменение.
+        """
+        if not self._sleeping_mode or not self._spatial_hash:
+            return
+        for rect in rects:
+            area = rect.inflate(self._wake_up_distance)
+            for sprite in self._spatial_hash.query(area):
+                if sprite.rect.colliderect(area):
+                    sprite.wake_up()
+
+    def set_sleeping(self, sprite: 'Object', is_sleeping: bool) -> None:
+        """Добавляет заснувший объект группы в пространственный хэш спящих объектов или удаляет проснувшийся.
+
+        Args:
+            sprite (Object): объект.
+            is_sleeping (bool): флаг сна объекта.
+        """
+        if not is_sleeping:
+            self._spatial_hash.remove(sprite)
+        elif sprite in self._spatial_hash:
+            self._spatial_hash.rebucket(sprite)
+        elif self.has(sprite):
+            self._spatial_hash.add(sprite)
+
+
+class TriggerGroup(BaseGroup):
+    """Группа триггеров. Триггеры хранятся в пространственном хэше,
+    пересечения с динамическими объектами обновляются инкрементально раз в шаг симуляции
+    и выставляют статусы входа, нахождения и выхода у триггеров и объектов.
+    Спящие динамические объекты сохраняют пересечения предыдущего шага без проверки.
+
+    Attributes:
+        _cell_size (Size): размер ячейки пространственного хэша, равен размеру тайтла.
+    """
+
+    _cell_size: Size = Size(*BaseGroup._settings['engine']['tile_grid']['tile_size'])
+
+    def __init__(self, *sprites: 'Object') -> None:
+        """Инициализация группы триггеров."""
+        self._spatial_hash = SpatialHash(self._cell_size)
+        self._overlaps: dict['Object', dict['Object', None]] = {}
+        self._entered: dict['Object', list['Object']] = {}
+        self._exited: dict['Object', list['Object']] = {}
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite: 'Object', layer: None = None) -> None:
+        """Добавляет триггер в группу и пространственный хэш.
+
+        Args:
+            sprite (Object): триггер.
+            layer (None, optional): слой, не используется. По дефолту None.
+        """
+        super().add_internal(sprite, layer)
+        self._spatial_hash.add(sprite)
+
+    def remove_internal(self, sprite: 'Object') -> None:
+        """Удаляет триггер из группы и пространственного хэша.
+
+        Args:
+            sprite (Object): триггер.
+        """
+        super().remove_internal(sprite)
+        self._spatial_hash.remove(sprite)
+
+    def get_overlaps(self, obj: 'Object') -> list['Object']:
+        """Отдаёт объекты, пересекающиеся с триггером, или триггеры, пересекающиеся с объектом.
+
+        Args:
+            obj (Object): триггер или динамический объект.
+
+        Returns:
+            list[Object]: пересекающиеся объекты.
+        """
+        return list(self._overlaps.get(obj, ()))
+
+    def get_entered(self, obj: 'Object') -> list['Object']:
+        """Отдаёт объекты, вошедшие в пересечение на последнем шаге симуляции.
+
+        Args:
+            obj (Object): триггер или динамический объект.
+
+        Returns:
+            list[Object]: вошедшие объекты.
+        """
+        return self._entered.get(obj, [])
+
+    def get_exited(self, obj: 'Object') -> list['Object']:
+        """Отдаёт объекты, вышедшие из пересечения на последнем шаге симуляции.
+
+        Args:
+            obj (Object): триггер или динамический объект.
+
+        Returns:
+            list[Object]: вышедшие объекты.
+        """
+        return self._exited.get(obj, [])
+
+    def _get_triggers(self, obj: 'Object') -> dict['Object', None]:
+        """Отдаёт триггеры, пересекающиеся по маске с объектом.
+
+        Args:
+            obj (Object): динамический объект.
+
+        Returns:
+            dict[Object, None]: триггеры.
+        """
+        if obj.is_sleeping:
+            return {trigger: None for trigger in self._overlaps.get(obj, ()) if self.has(trigger)}
+        return {
+            trigger: None
+            for trigger in self._spatial_hash.query(obj.rect)
+            if trigger.can_collide(obj) and trigger.collide_mask(obj)
+        }
+
+    def _set_statuses(self, obj: 'Object') -> None:
+        """Выставляет статусы входа, нахождения и выхода.
+
+        Args:
+            obj (Object): триггер или динамический объект.
+        """
+        overlaps = self._overlaps.get(obj, {})
+        entered = self._entered.get(obj, ())
+        obj.status.trigger_enter = bool(entered)
+        obj.status.trigger_exit = bool(self._exited.get(obj))
+        obj.status.trigger_stay = len(overlaps) > len(entered)
+
+    def update_triggers(self) -> None:
+        """Обновляет пересечения триггеров с динамическими объектами."""
+        self._spatial_hash.rebucket_all()
+        previous_objects = set(self._entered) | set(self._exited) | set(self._overlaps)
+        self._entered, self._exited = {}, {}
+        overlaps: dict['Object', dict['Object', None]] = {trigger: {} for trigger in self.sprites()}
+        for obj in DynamicObjectsGroup().sprites():
+            overlaps[obj] = self._get_triggers(obj)
+            previous = self._overlaps.get(obj, {})
+            for trigger in overlaps[obj]:
+                overlaps[trigger][obj] = None
+                if trigger not in previous:
+                    self._entered.setdefault(obj, []).append(trigger)
+                    self._entered.setdefault(trigger, []).append(obj)
+            for trigger in previous:
+                if trigger not in overlaps[obj]:
+                    self._exited.setdefault(obj, []).append(trigger)
+                    self._exited.setdefault(trigger, []).append(obj)
+        for obj, previous in self._overlaps.items():
+            if obj not in overlaps:
+                for other in previous:
+                    if obj not in self._exited.get(other, ()):
+                        self._exited.setdefault(other, []).append(obj)
+        self._overlaps = {obj: objects for obj, objects in overlaps.items() if objects}
+        for obj in previous_objects | set(self._entered) | set(self._exited) | set(self._overlaps):
+            if obj.alive():
+                self._set_statuses(obj)
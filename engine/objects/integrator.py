@@ -0,0 +1,213 @@
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from engine.constants import Coordinate
+from engine.objects.constants import MOVEMENT_SPEEDS, INTEGRATOR_CAPACITY
+
+if TYPE_CHECKING:
+    from engine.objects import Object
+    from engine.objects.groups import SolidObjectsGroup
+    from engine.physics.actions import MovementAction
+
+
+class BatchIntegrator:
+    """Пакетный интегратор движения динамических объектов.
+    Скорости, ускорения и направления хранятся в непрерывных массивах NumPy(строка - объект,
+    столбец - скорость из MOVEMENT_SPEEDS), перемещение всех объектов считается за один векторный шаг.
+    Скорости и ускорения перечитываются из Speed объектов каждый шаг, поэтому их можно менять во время движения.
+    Широкая фаза коллизий запрашивает по rect пути каждого объекта только ближайшие ячейки пространственного хэша
+    и чанки статического слоя. Маски проверяются только у объектов, путь которых пересекает твёрдые объекты,
+    остальные перемещаются без проверки.
+    Координаты остаются в FRect объектов, т.к. их меняют камера, выталкивание и пользовательский код,
+    в FRect записываются только ненулевые перемещения.
+
+    Attributes:
+        _slots (dict[str, int]): индексы столбцов скоростей.
+        _rows (dict[Object, int]): индексы строк объектов.
+        _free_rows (list[int]): освободившиеся строки.
+        _objects (list[Object | None]): объекты по строкам.
+        _actions (list[list[MovementAction | None]]): действия движения по строкам и столбцам.
+        _speeds (np.ndarray): скорости.
+        _boosts (np.ndarray): ускорения.
+        _current_boosts (np.ndarray): накопленные ускорения.
+        _signs (np.ndarray): направления движения по осям x, y.
+        _active (np.ndarray): маска активных действий движения.
+    """
+
+    _slots: dict[str, int] = {name: slot for slot, name in enumerate(MOVEMENT_SPEEDS)}
+
+    def __init__(self, capacity: int = INTEGRATOR_CAPACITY) -> None:
+        """Инициализация пакетного интегратора.
+
+        Args:
+            capacity (int, optional): начальное количество строк. По дефолту INTEGRATOR_CAPACITY.
+        """
+        self._rows: dict['Object', int] = {}
+        self._free_rows: list[int] = []
+        self._objects: list['Object | None'] = []
+        self._actions: list[list['MovementAction | None']] = []
+        count_slots = len(MOVEMENT_SPEEDS)
+        self._speeds = np.zeros((capacity, count_slots))
+        self._boosts = np.zeros((capacity, count_slots))
+        self._current_boosts = np.zeros((capacity, count_slots))
+        self._signs = np.zeros((capacity, count_slots, 2))
+        self._active = np.zeros((capacity, count_slots), dtype=bool)
+
+    def __len__(self) -> int:
+        """Отдаёт количество объектов в интеграторе."""
+        return len(self._rows)
+
+    def _grow(self) -> None:
+        """Увеличивает массивы в два раза."""
+        for name in ('_speeds', '_boosts', '_current_boosts', '_signs', '_active'):
+            array = getattr(self, name)
+            setattr(self, name, np.concatenate((array, np.zeros_like(array))))
+
+    def _get_row(self, obj: 'Object') -> int:
+        """Отдаёт строку объекта, при необходимости выделяет новую.
+
+        Args:
+            obj (Object): игровой объект.
+
+        Returns:
+            int: индекс строки.
+        """
+        if (row := self._rows.get(obj)) is not None:
+            return row
+        if self._free_rows:
+            row = self._free_rows.pop()
+            self._objects[row] = obj
+        else:
+            row = len(self._objects)
+            if row == len(self._active):
+                self._grow()
+            self._objects.append(obj)
+            self._actions.append([None] * len(MOVEMENT_SPEEDS))
+        self._rows[obj] = row
+        return row
+
+    def activate(self, action: 'MovementAction', sign_x_y: tuple[int, int]) -> None:
+        """Включает действие движения в пакетный шаг.
+
+        Args:
+            action (MovementAction): действие движения.
+            sign_x_y (tuple[int, int]): направление движения по осям x, y.
+        """
+        obj = action._obj
+        row = self._get_row(obj)
+        slot = self._slots[action.name_field_speed]
+        if self._active[row, slot] and self._actions[row][slot] is action:
+            return
+        self._actions[row][slot] = action
+        self._current_boosts[row, slot] = action.current_boost
+        self._signs[row, slot] = sign_x_y
+        self._active[row, slot] = True
+
+    def deactivate(self, action: 'MovementAction') -> None:
+        """Исключает действие движения из пакетного шага.
+
+        Args:
+            action (MovementAction): действие движения.
+        """
+        if (row := self._rows.get(action._obj)) is None:
+            return
+        slot = self._slots[action.name_field_speed]
+        if self._actions[row][slot] is not action:
+            return
+        self._actions[row][slot] = None
+        self._active[row, slot] = False
+        self._current_boosts[row, slot] = 0
+
+    def remove(self, obj: 'Object') -> None:
+        """Удаляет объект из интегратора.
+
+        Args:
+            obj (Object): игровой объект.
+        """
+        if (row := self._rows.pop(obj, None)) is None:
+            return
+        self._objects[row] = None
+        self._actions[row] = [None] * len(MOVEMENT_SPEEDS)
+        self._active[row] = False
+        self._current_boosts[row] = 0
+        self._free_rows.append(row)
+
+    def _read_speeds(self, count: int) -> None:
+        """Перечитывает скорости и ускорения активных действий из Speed объектов.
+
+        Args:
+            count (int): количество занятых строк.
+        """
+        for row, slot in zip(*np.nonzero(self._active[:count])):
+            action = self._actions[row][slot]
+            speed = action._obj.speed
+            self._speeds[row, slot] = getattr(speed, action.name_field_speed)
+            self._boosts[row, slot] = getattr(speed, action.name_field_boost) if action.name_field_boost else 0
+
+    def _is_hit(self, obj: 'Object', move_x: float, move_y: float, group: 'SolidObjectsGroup') -> bool:
+        """Широкая фаза: проверяет, пересекает ли путь объекта твёрдые объекты.
+        Кандидаты запрашиваются только из ячеек пространственного хэша и чанков статического слоя под rect пути,
+        объекты, которые касаются пути краем, его не пересекают.
+
+        Args:
+            obj (Object): перемещаемый объект.
+            move_x (float): перемещение по оси x.
+            move_y (float): перемещение по оси y.
+            group (SolidObjectsGroup): группа твёрдых объектов.
+
+        Returns:
+            bool: флаг возможной коллизии.
+        """
+        return bool(group.get_obstacles(obj.rect.union(obj.rect.move(move_x, move_y)), obj))
+
+    def _on_collision(self, row: int, axis: int, moves: np.ndarray) -> None:
+        """Передаёт коллизию действиям, которые двигали объект по оси.
+
+        Args:
+            row (int): индекс строки.
+            axis (int): ось коллизии(0 - x, 1 - y).
+            moves (np.ndarray): перемещения объекта по столбцам скоростей.
+        """
+        for slot, action in enumerate(self._actions[row]):
+            if not action or not self._signs[row, slot, axis]:
+                continue
+            move = [0, 0]
+            move[axis] = moves[slot, axis].item()
+            action.current_boost = self._current_boosts[row, slot].item()
+            action.on_collision(Coordinate(*move))
+            self._current_boosts[row, slot] = action.current_boost
+
+    def step(self, dt: float, group: 'SolidObjectsGroup', is_swept: bool = False) -> None:
+        """Векторный шаг движения всех объектов.
+        Объекты без возможной коллизии перемещаются сразу, у остальных коллизии разрешаются отдельно по осям x и y.
+
+        Args:
+            dt (float): время шага.
+            group (SolidObjectsGroup): группа твёрдых объектов.
+            is_swept (bool, optional): флаг непрерывного перемещения до точки касания. По дефолту False.
+        """
+        count = len(self._objects)
+        if not count:
+            return
+        self._read_speeds(count)
+        active = self._active[:count]
+        self._current_boosts[:count] += self._boosts[:count] * dt * active
+        speeds = (self._speeds[:count] + self._current_boosts[:count]) * active
+        moves = speeds[:, :, np.newaxis] * self._signs[:count] * dt
+        totals = moves.sum(axis=1)
+        rows = np.flatnonzero(totals.any(axis=1))
+        if not len(rows):
+            return
+        for row in rows.tolist():
+            obj = self._objects[row]
+            move_x, move_y = totals[row].tolist()
+            if not self._is_hit(obj, move_x, move_y, group):
+                obj.rect.x += move_x
+                obj.rect.y += move_y
+                group.rebucket_sprite(obj)
+                continue
+            if move_x and group.move_sprite(obj, Coordinate(move_x, 0), is_swept):
+                self._on_collision(row, 0, moves[row])
+            if move_y and group.move_sprite(obj, Coordinate(0, move_y), is_swept):
+                self._on_collision(row, 1, moves[row])
@@ -1,16 +1,19 @@
 from copy import deepcopy
 
-from pygame import sprite
+from pygame import FRect, Mask
+from pygame.sprite import Sprite
 
 from engine.animations import AnimationGroup, EventsAnimationGroup
 from engine.actions import EventsActionGroup, ActionGroup
-from engine.objects.groups import SolidObjectsGroup, DynamicObjectsGroup
+from engine.objects.groups import BaseGroup, SolidObjectsGroup, DynamicObjectsGroup, TriggerGroup
 from engine.events import Pressed
 from engine.constants import Coordinate
 from engine.objects.dataclasses import Speed, Status, DynamicStatus
 from engine.constants.direction import DirectionGroupEnum
 from engine.tile_grid import TileGrid
+from engine.settings import Settings
 from engine.objects.base_object import BaseObject
+from engine.objects.constants import Resolution, Manifold
 
 
 class Object(BaseObject):
@@ -77,72 +80,241 @@ class Object(BaseObject):
         self._animation_actions_events(pressed)
 
     def _new_frame(self) -> None:
-        """Устанавливает новый фрейм."""
+        """Устанавливает новый фрейм. Изображение и маска выбираются по направлению движения."""
         rect_center = self.rect.center
         frame = self._animation_group.frame
-        self.image = frame.image
+        self.image = frame.images[self.direction]
         self.rect = frame.rect
         self.rect.center = rect_center
         self.coordinate_shift = frame.coordinate_shift
-        self.mask = frame.mask
+        self.mask = frame.masks[self.direction]
         self.rect_mask = frame.rect_mask
 
     def update(self) -> None:
-        """Логика обновления спрайта."""
+        """Логика обновления спрайта. Спрайт переносится в актуальные ячейки индексов своих групп."""
         self._new_frame()
+        for group in Sprite.groups(self):  # groups объекта - кортеж групп класса, а не метод Sprite
+            if isinstance(group, BaseGroup):
+                group.rebucket_sprite(self)
 
-    def _get_collision_side(self, obj: 'Object') -> DirectionGroupEnum:
-        """Отдаёт сторону коллизии.
+    @staticmethod
+    def _get_entry(start: float, end: float, obstacle_start: float, obstacle_end: float, move: float) -> float | None:
+        """Отдаёт долю перемещения по оси, на которой отрезок начал пересекаться с отрезком препятствия.
 
         Args:
-            obj ('Object'): объект для проверки стороны коллизии.
+            start (float): начало отрезка до перемещения.
+            end (float): конец отрезка до перемещения.
+            obstacle_start (float): начало отрезка препятствия.
+            obstacle_end (float): конец отрезка препятствия.
+            move (float): перемещение по оси.
+
+        Returns:
+            float | None: доля перемещения, None - перемещения нет или отрезки пересекались до него.
+        """
+        if move > 0:
+            entry = (obstacle_start - end) / move
+        elif move < 0:
+            entry = (obstacle_end - start) / move
+        else:
+            return
+        return entry if entry >= 0 else None
+
+    def _get_collision_side(self, obj: 'Object', rect: FRect) -> DirectionGroupEnum:
+        """Отдаёт сторону коллизии по относительному перемещению объектов с начала шага симуляции:
+        нормаль направлена по оси, по которой rect-ы начали пересекаться последними.
+        Если объекты не перемещались или пересекались до перемещения, сторона определяется по области пересечения.
+
+        Args:
+            obj (Object): объект коллизии.
+            rect (FRect): bounding rect области пересечения масок.
 
         Returns:
             DirectionGroupEnum: сторона коллизии.
         """
-        if self.rect.bottom <= obj.rect.top + obj.rect.height and self.rect.bottom >= obj.rect.top:
-            return DirectionGroupEnum.DOWN
-        elif self.rect.top <= obj.rect.bottom and self.rect.top >= obj.rect.bottom - obj.rect.height:
-            return DirectionGroupEnum.UP
-        if self.rect.right >= obj.rect.left and self.rect.left <= obj.rect.left:
-            return DirectionGroupEnum.RIGHT
-        if self.rect.left <= obj.rect.right and self.rect.right >= obj.rect.right:
-            return DirectionGroupEnum.LEFT
+        dynamic_objects_group = DynamicObjectsGroup()
+        own_move, obj_move = dynamic_objects_group.get_movement(self), dynamic_objects_group.get_movement(obj)
+        move_x, move_y = own_move.x - obj_move.x, own_move.y - obj_move.y
+        previous_rect = self.rect.move(-move_x, -move_y)
+        entry_x = self._get_entry(previous_rect.left, previous_rect.right, obj.rect.left, obj.rect.right, move_x)
+        entry_y = self._get_entry(previous_rect.top, previous_rect.bottom, obj.rect.top, obj.rect.bottom, move_y)
+        if entry_x is None and entry_y is None:
+            return self._get_overlap_side(rect)
+        if entry_y is None or entry_x is not None and entry_x > entry_y:
+            return DirectionGroupEnum.RIGHT if move_x > 0 else DirectionGroupEnum.LEFT
+        return DirectionGroupEnum.DOWN if move_y > 0 else DirectionGroupEnum.UP
+
+    def _get_depth(self, side: DirectionGroupEnum, rect: FRect) -> Coordinate:
+        """Отдаёт глубину проникновения вдоль нормали: от края области пересечения со стороны объекта коллизии
+        до ведущего края rect-а.
 
-    def collide_rect_with_mask(self, obj: 'Object', side: DirectionGroupEnum | None = None) -> Coordinate | None:
-        """Проверяет сторону коллизии rect объекта c маской другого объекта.
+        Args:
+            side (DirectionGroupEnum): сторона коллизии.
+            rect (FRect): bounding rect области пересечения масок.
+
+        Returns:
+            Coordinate: глубина проникновения по осям x, y, по оси без нормали - 0.
+        """
+        if side == DirectionGroupEnum.DOWN:
+            return Coordinate(0, self.rect.bottom - rect.top)
+        if side == DirectionGroupEnum.UP:
+            return Coordinate(0, rect.bottom - self.rect.top)
+        if side == DirectionGroupEnum.RIGHT:
+            return Coordinate(self.rect.right - rect.left, 0)
+        return Coordinate(rect.right - self.rect.left, 0)
+
+    def _get_overlap_side(self, rect: FRect) -> DirectionGroupEnum:
+        """Отдаёт сторону коллизии по bounding rect области пересечения масок.
+
+        Args:
+            rect (FRect): bounding rect области пересечения масок.
+
+        Returns:
+            DirectionGroupEnum: сторона коллизии.
+        """
+        if rect.width >= rect.height:
+            return DirectionGroupEnum.DOWN if rect.centery >= self.rect.centery else DirectionGroupEnum.UP
+        return DirectionGroupEnum.RIGHT if rect.centerx >= self.rect.centerx else DirectionGroupEnum.LEFT
+
+    def _get_manifold(self, obj: 'Object', mask: Mask, side: DirectionGroupEnum | None = None) -> Manifold | None:
+        """Рассчитывает данные коллизии по одному пересечению масок.
 
         Args:
             obj (Object): объект для проверки коллизии.
+            mask (Mask): маска объекта для проверки.
             side (DirectionGroupEnum | None, optional): сторона для проверки. По дефолту None.
 
         Returns:
-            Coordinate | None: координаты коллизии.
+            Manifold | None: объект коллизии, сторона, глубина проникновения вдоль нормали по осям x, y,
+                bounding rect области пересечения и координаты коллизии.
         """
         if not self.rect.colliderect(obj.rect):
             return
         offset = (self.rect.x - obj.rect.x, self.rect.y - obj.rect.y)
-        coordinate = obj.mask.overlap(self.rect_mask, offset)
-        if coordinate and (not side or self._get_collision_side(obj) == side):
-            return Coordinate(*coordinate)
-        return
+        if not (point := obj.mask.overlap(mask, offset)):
+            return
+        bounding_rects = obj.mask.overlap_mask(mask, offset).get_bounding_rects()
+        bounding_rect = bounding_rects[0].unionall(bounding_rects[1:])
+        rect = FRect(bounding_rect).move(obj.rect.x, obj.rect.y)
+        collision_side = self._get_collision_side(obj, rect)
+        if side and collision_side != side:
+            return
+        return Manifold(obj, collision_side, self._get_depth(collision_side, rect), rect, Coordinate(*point))
 
-    def collide_mask(self, obj: 'Object', side: DirectionGroupEnum | None = None) -> Coordinate | None:
-        """Проверяет коллизию по маске с объектом.
+    def _collide(self, obj: 'Object', mask: Mask, side: DirectionGroupEnum | None = None) -> Coordinate | None:
+        """Проверяет коллизию маски с маской другого объекта.
+        Без стороны достаточно одного пересечения масок, со стороной рассчитываются данные коллизии.
 
         Args:
             obj (Object): объект для проверки коллизии.
+            mask (Mask): маска объекта для проверки.
             side (DirectionGroupEnum | None, optional): сторона для проверки. По дефолту None.
 
         Returns:
             Coordinate | None: координаты коллизии.
         """
+        if side:
+            manifold = self._get_manifold(obj, mask, side)
+            return manifold.point if manifold else None
         if not self.rect.colliderect(obj.rect):
             return
-        coordinate = sprite.collide_mask(self, obj)
-        if coordinate and (not side or self._get_collision_side(obj) == side):
+        if coordinate := obj.mask.overlap(mask, (self.rect.x - obj.rect.x, self.rect.y - obj.rect.y)):
             return Coordinate(*coordinate)
-        return
+
+    def collide_rect_with_mask(self, obj: 'Object', side: DirectionGroupEnum | None = None) -> Coordinate | None:
+        """Проверяет сторону коллизии rect объекта c маской другого объекта.
+
+        Args:
+            obj (Object): объект для проверки коллизии.
+            side (DirectionGroupEnum | None, optional): сторона для проверки. По дефолту None.
+
+        Returns:
+            Coordinate | None: координаты коллизии.
+        """
+        return self._collide(obj, self.rect_mask, side)
+
+    def collide_mask(self, obj: 'Object', side: DirectionGroupEnum | None = None) -> Coordinate | None:
+        """Проверяет коллизию по маске с объектом.
+
+        Args:
+            obj (Object): объект для проверки коллизии.
+            side (DirectionGroupEnum | None, optional): сторона для проверки. По дефолту None.
+
+        Returns:
+            Coordinate | None: координаты коллизии.
+        """
+        return self._collide(obj, self.mask, side)
+
+    def collide_rect_manifold(self, obj: 'Object', side: DirectionGroupEnum | None = None) -> Manifold | None:
+        """Отдаёт данные коллизии rect объекта c маской другого объекта.
+
+        Args:
+            obj (Object): объект для проверки коллизии.
+            side (DirectionGroupEnum | None, optional): сторона для проверки. По дефолту None.
+
+        Returns:
+            Manifold | None: данные коллизии.
+        """
+        return self._get_manifold(obj, self.rect_mask, side)
+
+    def collide_mask_manifold(self, obj: 'Object', side: DirectionGroupEnum | None = None) -> Manifold | None:
+        """Отдаёт данные коллизии по маске с объектом.
+
+        Args:
+            obj (Object): объект для проверки коллизии.
+            side (DirectionGroupEnum | None, optional): сторона для проверки. По дефолту None.
+
+        Returns:
+            Manifold | None: данные коллизии.
+        """
+        return self._get_manifold(obj, self.mask, side)
+
+    def _collide_mask_with_shift(self, obj: 'Object', shift: Coordinate) -> Coordinate | None:
+        """Проверяет коллизию по маске со сдвигом объекта, не меняя его положение.
+
+        Args:
+            obj (Object): объект для проверки коллизии.
+            shift (Coordinate): сдвиг по осям x, y.
+
+        Returns:
+            Coordinate | None: координаты коллизии.
+        """
+        self.rect.x += shift.x
+        self.rect.y += shift.y
+        coordinate = self.collide_mask(obj)
+        self.rect.x -= shift.x
+        self.rect.y -= shift.y
+        return coordinate
+
+    def resolve_penetration(self, manifold: Manifold, sign_x_y: tuple[int, int]) -> Resolution | None:
+        """Рассчитывает выталкивание объекта из коллизии против направления sign_x_y.
+        Начальная оценка глубины берётся из данных коллизии и уточняется бинарным поиском,
+        поэтому количество проверок масок ограничено логарифмом глубины.
+        Объект остаётся в касании с объектом коллизии, как при попиксельном выталкивании.
+
+        Args:
+            manifold (Manifold): данные коллизии по маске.
+            sign_x_y (tuple[int, int]): направление выталкивания.
+
+        Returns:
+            Resolution | None: скорректированные координаты, сторона коллизии и глубина проникновения.
+        """
+        obj = manifold.obj
+        sign_x, sign_y = sign_x_y
+        max_steps = self.rect.width + self.rect.height + obj.rect.width + obj.rect.height
+        low, high = 0, max(manifold.depth.x * abs(sign_x), manifold.depth.y * abs(sign_y)) + 1
+        while self._collide_mask_with_shift(obj, Coordinate(-sign_x * high, -sign_y * high)):
+            if high > max_steps:
+                return
+            low, high = high, high * 2
+        while high - low > 1:
+            middle = (low + high) // 2
+            if self._collide_mask_with_shift(obj, Coordinate(-sign_x * middle, -sign_y * middle)):
+                low = middle
+            else:
+                high = middle
+        depth = high - 1
+        coordinate = Coordinate(self.rect.x - sign_x * depth, self.rect.y - sign_y * depth)
+        return Resolution(coordinate, manifold.side, depth)
 
 
 class SolidObject(Object):
@@ -151,23 +323,102 @@ class SolidObject(Object):
     groups: tuple[SolidObjectsGroup] = (SolidObjectsGroup(),)
 
 
+class TriggerObject(Object):
+    """Класс триггера. Не участвует в коллизиях, а отслеживает пересечения с динамическими объектами
+    и получает статусы входа, нахождения и выхода.
+    """
+
+    groups: tuple[TriggerGroup] = (TriggerGroup(),)
+
+
 class DynamicObject(Object):
     """Класс динамического объекта.
 
     Attributes:
         speed (Speed): скорость динамического объекта.
         physics_events_action_group (EventsAnimationGroup): группа событий и действий физики.
+        _sleeping_mode (bool): флаг засыпания объекта в покое.
+        _frames_before_sleep (int): количество кадров покоя до засыпания.
     """
 
     _status_class = DynamicStatus
     speed: Speed
     physics_events_action_group: EventsActionGroup = EventsActionGroup()
     groups: tuple[DynamicObjectsGroup] = (DynamicObjectsGroup(),)
+    _sleeping_mode: bool = Settings()['engine']['physics']['sleeping_mode']
+    _frames_before_sleep: int = Settings()['engine']['physics']['frames_before_sleep']
+
+    def _set_default_values(self) -> None:
+        """Добавляет к дефолтным значениям состояние сна."""
+        super()._set_default_values()
+        self._is_sleeping = False
+        self._resting_frames = 0
+        self._previous_status_values = self.status.get_values()
 
     def _init_animation_actions_group(self) -> None:
         super()._init_animation_actions_group()
         self._physics_actions_group = ActionGroup(deepcopy(self.physics_events_action_group, memo={'obj': self}))
 
-    def _animation_actions_events(self, pressed: Pressed) -> None:
+    @property
+    def is_sleeping(self) -> bool:
+        """Getter флага сна.
+
+        Returns:
+            bool: флаг сна.
+        """
+        return self._is_sleeping
+
+    @is_sleeping.setter
+    def is_sleeping(self, value: bool) -> None:
+        """Setter флага сна, заснувший объект переносится в пространственный хэш спящих объектов группы.
+
+        Args:
+            value (bool): флаг сна.
+        """
+        if value == self._is_sleeping:
+            return
+        self._is_sleeping = value
+        DynamicObjectsGroup().set_sleeping(self, value)
+
+    def wake_up(self) -> None:
+        """Пробуждает объект."""
+        self.is_sleeping = False
+        self._resting_frames = 0
+
+    def _update_sleep(self, is_triggered: bool) -> None:
+        """Считает кадры покоя и усыпляет объект. Объект в покое, если стоит на опоре,
+        не выполняет действий физики кроме дефолтных и его статусы не изменились.
+
+        Args:
+            is_triggered (bool): флаг совершения событий физики.
+        """
+        status = self.status
+        status_values = status.get_values()
+        if is_triggered or status.fall or status.jump or status.double_jump:
+            self._resting_frames = 0
+        elif status_values != self._previous_status_values:
+            self._resting_frames = 0
+        else:
+            self._resting_frames += 1
+        self._previous_status_values = status_values
+        self.is_sleeping = self._resting_frames >= self._frames_before_sleep
+
+    def _physics_events(self, pressed: Pressed) -> None:
+        """Проверка событий физики. Спящий объект пропускает физику, пока его не разбудит событие.
+
+        Args:
+            pressed (Pressed): объект состояния кнопок, коллизии и активности объекта.
+        """
+        if not self._sleeping_mode:
+            self._physics_actions_group.events(pressed)
+            return
+        is_triggered = self._physics_actions_group.is_triggered(pressed)
+        if self.is_sleeping and not is_triggered:
+            return
+        self.is_sleeping = False
         self._physics_actions_group.events(pressed)
+        self._update_sleep(is_triggered)
+
+    def _animation_actions_events(self, pressed: Pressed) -> None:
+        self._physics_events(pressed)
         super()._animation_actions_events(pressed)
@@ -1,10 +1,15 @@
-from typing import Iterable
+from typing import TYPE_CHECKING, Iterable
 
 from engine.actions import DynamicAction
+from engine.constants import Coordinate
 from engine.constants.direction import DirectionGroupEnum
 from engine.physics.constants import SING_X_Y
 from engine.objects.constants import NameSpeedEnum, NameStatusEnum
-from engine.objects.groups import SolidObjectsGroup
+from engine.objects.groups import SolidObjectsGroup, DynamicObjectsGroup
+from engine.settings import Settings
+
+if TYPE_CHECKING:
+    from engine.objects.integrator import BatchIntegrator
 
 
 class MovementAction(DynamicAction):
@@ -16,6 +21,8 @@ class MovementAction(DynamicAction):
         name_field_boost (NameSpeedEnum | None, optional): название поля ускорения. По дефолту None.
         name_statuses_field (Iterable[NameStatusEnum], optional): названия полей статуса. По дефолту list.
         _solid_objects_group (SolidObjectsGroup): группа твёрдых объектов.
+        _is_swept (bool): флаг непрерывного перемещения до точки касания.
+        _integrator (BatchIntegrator | None): пакетный интегратор, если включён.
     """
 
     direction_movement: DirectionGroupEnum
@@ -23,16 +30,61 @@ class MovementAction(DynamicAction):
     name_field_boost: NameSpeedEnum | None = None
     name_statuses_field: Iterable[NameStatusEnum] = []
     _solid_objects_group: SolidObjectsGroup = SolidObjectsGroup()
+    _is_swept: bool = Settings()['engine']['physics']['swept_movement']
+    _integrator: 'BatchIntegrator | None' = DynamicObjectsGroup().integrator
 
     def _set_default_values(self) -> None:
-        """Добавляет к дефолтным значениям обновление текущего ускорения."""
+        """Добавляет к дефолтным значениям обновление текущего ускорения
+        и исключение действия из пакетного интегратора.
+        """
         super()._set_default_values()
         self._current_boost = 0
+        if self._integrator is not None:
+            self._integrator.deactivate(self)
+
+    @property
+    def current_boost(self) -> float:
+        """Отдаёт текущее ускорение.
+
+        Returns:
+            float: текущее ускорение.
+        """
+        return self._current_boost
+
+    @current_boost.setter
+    def current_boost(self, value: float) -> None:
+        """Устанавливает текущее ускорение.
+
+        Args:
+            value (float): текущее ускорение.
+        """
+        self._current_boost = value
+
+    def on_collision(self, move: Coordinate) -> None:
+        """Реакция на коллизию при перемещении.
+
+        Args:
+            move (Coordinate): перемещение по осям x, y, при котором произошла коллизия.
+        """
+        for status in self.name_statuses_field:
+            setattr(self._obj.status, status, False)
+
+    def _move(self, move: Coordinate) -> None:
+        """Перемещение объекта с реакцией на коллизию.
+
+        Args:
+            move (Coordinate): перемещение по осям x, y.
+        """
+        if self._solid_objects_group.move_sprite(self._obj, move, self._is_swept):
+            self.on_collision(move)
 
     def perform(self) -> None:
         """Логика выполнения действия движения."""
         if self.direction_movement not in (DirectionGroupEnum.UP, DirectionGroupEnum.DOWN):
             self._obj.direction = self.direction_movement
+        if self._integrator is not None:
+            self._integrator.activate(self, SING_X_Y[self.direction_movement])
+            return
         sign_x, sign_y = SING_X_Y[self.direction_movement]
         boost = 0
         if self.name_field_boost:
@@ -41,13 +93,7 @@ class MovementAction(DynamicAction):
         speed = getattr(self._obj.speed, self.name_field_speed) + self._current_boost
         move_x = speed * sign_x * self._global_clock.dt
         move_y = speed * sign_y * self._global_clock.dt
-        self._obj.rect.x += move_x
-        self._obj.rect.y += move_y
-        if self._solid_objects_group.collide_rect_with_mask(self._obj):
-            for status in self.name_statuses_field:
-                setattr(self._obj.status, status, False)
-            self._obj.rect.x -= move_x
-            self._obj.rect.y -= move_y
+        self._move(Coordinate(move_x, move_y))
 
 
 class WalkAction(MovementAction):
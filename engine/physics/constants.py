@@ -1,6 +1,8 @@
 from engine.constants.direction import DirectionGroupEnum
 
 
+CONTACT_DISTANCE = 1
+
 SING_X_Y = {
     DirectionGroupEnum.UP: (0, -1),
     DirectionGroupEnum.DOWN: (0, 1),
@@ -1,9 +1,10 @@
+from engine.constants import Coordinate
 from engine.constants.direction import DirectionGroupEnum
 
 from engine.actions import DynamicAction
 from engine.objects.constants import NameSpeedEnum, NameStatusEnum
 from engine.objects.groups import SolidObjectsGroup
-from engine.physics.constants import SING_X_Y
+from engine.physics.constants import CONTACT_DISTANCE, SING_X_Y
 from engine.physics.actions import MovementAction, WalkAction, RunAction
 
 
@@ -17,18 +18,19 @@ class CheckObjectAction(DynamicAction):
     _solid_objects_group: SolidObjectsGroup = SolidObjectsGroup()
 
     def _check_status_fall(self) -> None:
-        """Проверка статуса падения."""
+        """Проверка статуса падения. Опора ищется одним shape-cast-ом вниз без перемещения rect
+        на контактное расстояние, не зависящее от скорости падения и длительности шага.
+        """
         if self._obj.status.jump or self._obj.status.double_jump:
             self._obj.status.fall = False
             return
-        moving_y = self._obj.speed.fall
-        self._obj.rect.y += moving_y
-        if self._solid_objects_group.collide_rect_with_mask(self._obj, DirectionGroupEnum.DOWN):
+        if self._solid_objects_group.shapecast(
+            self._obj.rect, Coordinate(0, CONTACT_DISTANCE), self._obj.rect_mask, self._obj
+        ):
             self._elapsed = 0
             self._obj.status.fall = False
         else:
             self._obj.status.fall = True
-        self._obj.rect.y -= moving_y
 
     def perform(self) -> None:
         """Логика проверки статусов игрового объекта."""
@@ -57,8 +59,22 @@ class JumpAction(MovementAction):
     direction_movement = DirectionGroupEnum.UP
     name_statuses_field = (NameStatusEnum.JUMP, NameStatusEnum.FALL)
 
+    def on_collision(self, move: Coordinate) -> None:
+        """Прыжок прекращается при ударе сверху и сбрасывает статусы при касании снизу.
+
+        Args:
+            move (Coordinate): перемещение по осям x, y, при котором произошла коллизия.
+        """
+        if move.y <= 0:
+            self._current_boost = -getattr(self._obj.speed, self.name_field_speed)
+        else:
+            super().on_collision(move)
+
     def perform(self) -> None:
         """Логика прыжка."""
+        if self._integrator is not None:
+            self._integrator.activate(self, SING_X_Y[self.direction_movement])
+            return
         _, sign_y = SING_X_Y[self.direction_movement]
         boost = 0
         if self.name_field_boost:
@@ -66,14 +82,7 @@ class JumpAction(MovementAction):
         self._current_boost += boost * self._global_clock.dt
         speed = getattr(self._obj.speed, self.name_field_speed) + self._current_boost
         move_y = speed * sign_y * self._global_clock.dt
-        self._obj.rect.y += move_y
-        if self._solid_objects_group.collide_rect_with_mask(self._obj):
-            if move_y <= 0:
-                self._current_boost = -getattr(self._obj.speed, self.name_field_speed)
-            else:
-                for status in self.name_statuses_field:
-                    setattr(self._obj.status, status, False)
-            self._obj.rect.y -= move_y
+        self._move(Coordinate(0, move_y))
 
 
 class DoubleJumpAction(JumpAction):
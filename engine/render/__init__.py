@@ -0,0 +1,17 @@
+from engine.render.presenter import Presenter
+from engine.render.strips import StripRenderer
+from engine.render.texture_renderer import TextureRenderer
+from engine.render.static_layer import StaticRenderLayer, StaticRenderChunk
+from engine.render.queue import RenderQueue
+from engine.render.resolution import DynamicResolution
+
+
+__all__ = (
+    'Presenter',
+    'StaticRenderLayer',
+    'StaticRenderChunk',
+    'RenderQueue',
+    'DynamicResolution',
+    'StripRenderer',
+    'TextureRenderer',
+)
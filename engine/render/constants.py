@@ -0,0 +1,5 @@
+FRAME_TIMES_WINDOW = 30
+HEADROOM_COEF = 0.7
+STRIP_MIN_BLITS = 64
+DIRTY_RECTS_MAX_COUNT = 32
+DIRTY_RECTS_MAX_COVERAGE = 0.5
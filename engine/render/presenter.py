@@ -0,0 +1,161 @@
+from math import ceil, floor
+from typing import Iterable
+
+from pygame import Rect, Surface, display, transform
+
+from engine.metaclasses.singleton import SingletonMeta
+from engine.settings import Settings
+from engine.settings.constants import ScaleModeEnum
+from engine.utils.screen import get_sreen_resolution
+from engine.constants import Coordinate, Size
+from engine.render.texture_renderer import TextureRenderer
+
+
+class Presenter(metaclass=SingletonMeta):
+    """Вывод видимой части карты на дисплей.
+    Видимая часть карты масштабируется прямо в заранее выделенную область дисплея,
+    разрешение и область запоминаются до изменения размера окна.
+
+    Attributes:
+        scale_mode (ScaleModeEnum): режим масштабирования.
+        _texture_renderer (TextureRenderer): вывод через SDL2 Renderer.
+    """
+
+    _texture_renderer: TextureRenderer = TextureRenderer()
+
+    def __init__(self) -> None:
+        """Инициализация вывода."""
+        settings: Settings = Settings()
+        self.scale_mode: ScaleModeEnum = settings['engine']['render']['scale_mode']
+        self._visible_map_size: Size = Size(*settings['engine']['base_visible_map_size'])
+        self._resolution: tuple[int, int] | None = None
+        self._frame_rect: Rect | None = None
+        self._frame: Surface | None = None
+
+    @property
+    def resolution(self) -> tuple[int, int]:
+        """Отдаёт запомненное разрешение экрана.
+
+        Returns:
+            tuple[int, int]: ширина и высота разрешения экрана.
+        """
+        if self._resolution is None:
+            self._resolution = get_sreen_resolution()
+        return self._resolution
+
+    def resize(self) -> None:
+        """Сбрасывает запомненные разрешение и область вывода после изменения размера окна."""
+        self._resolution = self._frame_rect = self._frame = None
+
+    def _get_frame_rect(self, size: tuple[int, int]) -> Rect:
+        """Отдаёт область дисплея, в которую масштабируется видимая часть карты.
+        В целочисленном режиме масштаб округляется вниз, а область центрируется.
+
+        Args:
+            size (tuple[int, int]): размер видимой части карты.
+
+        Returns:
+            Rect: область вывода.
+        """
+        width, height = self.resolution
+        if self.scale_mode != ScaleModeEnum.INTEGER:
+            return Rect(0, 0, width, height)
+        scale = min(width / size[0], height / size[1])
+        if scale >= 1:
+            scale = floor(scale)
+        frame_rect = Rect(0, 0, int(size[0] * scale), int(size[1] * scale))
+        frame_rect.center = (width // 2, height // 2)
+        return frame_rect
+
+    def _get_frame(self, surface: Surface) -> Surface:
+        """Отдаёт область дисплея для масштабирования, выделяя её один раз до изменения размера окна.
+
+        Args:
+            surface (Surface): видимая часть карты.
+
+        Returns:
+            Surface: область дисплея.
+        """
+        if self._frame is None:
+            screen = display.get_surface()
+            screen.fill((0, 0, 0))
+            self._frame_rect = self._get_frame_rect(self._visible_map_size).clip(screen.get_rect())
+            self._frame = screen.subsurface(self._frame_rect)
+        return self._frame
+
+    def to_visible_map(self, coordinate: Coordinate) -> Coordinate:
+        """Переводит координаты дисплея в координаты видимой части карты.
+
+        Args:
+            coordinate (Coordinate): координаты дисплея.
+
+        Returns:
+            Coordinate: координаты видимой части карты.
+        """
+        if self._texture_renderer.is_enabled:
+            return self._texture_renderer.to_visible_map(coordinate)
+        if self.scale_mode == ScaleModeEnum.SCALED:
+            return Coordinate(*coordinate)
+        frame_rect = self._frame_rect or self._get_frame_rect(self._visible_map_size)
+        return Coordinate(
+            (coordinate[0] - frame_rect.x) * self._visible_map_size.width / frame_rect.width,
+            (coordinate[1] - frame_rect.y) * self._visible_map_size.height / frame_rect.height,
+        )
+
+    def _scale_rect(self, rect: Rect, size: tuple[int, int]) -> Rect:
+        """Переводит область видимой части карты в область дисплея.
+
+        Args:
+            rect (Rect): область видимой части карты.
+            size (tuple[int, int]): размер видимой части карты.
+
+        Returns:
+            Rect: область дисплея.
+        """
+        scale_x = self._frame_rect.width / size[0]
+        scale_y = self._frame_rect.height / size[1]
+        left, top = floor(rect.left * scale_x), floor(rect.top * scale_y)
+        return Rect(left, top, ceil(rect.right * scale_x) - left, ceil(rect.bottom * scale_y) - top)
+
+    def present(self, surface: Surface | TextureRenderer, dirty_rects: Iterable[Rect] | None = None) -> None:
+        """Выводит видимую часть карты на дисплей.
+        В режиме SCALED масштабирование выполняет SDL, иначе масштабирование идёт без выделения новых Surface.
+        Уменьшенная цель вывода динамического разрешения растягивается до размера видимой части карты.
+        Кадр SDL2 Renderer-а выводится renderer-ом.
+
+        Args:
+            surface (Surface | TextureRenderer): видимая часть карты или вывод через SDL2 Renderer.
+            dirty_rects (Iterable[Rect] | None, optional): изменившиеся области видимой части карты.
+                По дефолту None - весь кадр.
+        """
+        if surface is self._texture_renderer:
+            surface.present()
+            return
+        if self.scale_mode == ScaleModeEnum.SCALED:
+            screen = display.get_surface()
+            if dirty_rects is None:
+                if surface.get_size() == screen.get_size():
+                    screen.blit(surface, (0, 0))
+                else:
+                    transform.scale(surface, screen.get_size(), screen)
+                display.flip()
+                return
+            dirty_rects = list(dirty_rects)
+            for rect in dirty_rects:
+                screen.blit(surface, rect, rect)
+            display.update(dirty_rects)
+            return
+        frame = self._get_frame(surface)
+        size = surface.get_size()
+        if dirty_rects is None:
+            transform.scale(surface, frame.get_size(), frame)
+            display.flip()
+            return
+        screen_rects = []
+        for rect in dirty_rects:
+            frame_rect = self._scale_rect(rect, size).clip(frame.get_rect())
+            if not frame_rect:
+                continue
+            transform.scale(surface.subsurface(rect), frame_rect.size, frame.subsurface(frame_rect))
+            screen_rects.append(frame_rect.move(self._frame_rect.topleft))
+        display.update(screen_rects)
@@ -0,0 +1,75 @@
+from math import inf
+
+from pygame import Surface
+
+from engine.metaclasses.singleton import SingletonMeta
+from engine.constants import Coordinate
+from engine.render.strips import StripRenderer
+
+
+class RenderQueue(metaclass=SingletonMeta):
+    """Очередь вывода кадра. Группы добавляют в неё изображения со слоем и ключом сортировки по y,
+    очередь один раз сортирует все записи и выводит их одним вызовом blits.
+    Записи - переиспользуемые списки [слой, ключ по y, порядок добавления, изображение, координаты],
+    буфер записей между кадрами не пересоздаётся, неиспользуемые записи имеют бесконечный слой.
+
+    Attributes:
+        _strip_renderer (StripRenderer): вывод по горизонтальным полосам.
+    """
+
+    _strip_renderer: StripRenderer = StripRenderer()
+
+    def __init__(self) -> None:
+        """Инициализация очереди вывода."""
+        self._entries: list[list] = []
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Отдаёт количество записей в очереди."""
+        return self._count
+
+    def submit(self, image: Surface, coordinate: Coordinate, layer: int = 0, y_sort: float = 0) -> None:
+        """Добавляет изображение в очередь.
+
+        Args:
+            image (Surface): изображение.
+            coordinate (Coordinate): координаты вывода.
+            layer (int, optional): слой вывода, меньший слой выводится раньше. По дефолту 0.
+            y_sort (float, optional): ключ сортировки внутри слоя, меньший ключ выводится раньше. По дефолту 0.
+        """
+        if self._count == len(self._entries):
+            self._entries.append([layer, y_sort, self._count, image, coordinate])
+        else:
+            entry = self._entries[self._count]
+            entry[0] = layer
+            entry[1] = y_sort
+            entry[2] = self._count
+            entry[3] = image
+            entry[4] = coordinate
+        self._count += 1
+
+    def flush(self, surface: Surface) -> None:
+        """Сортирует записи по слою, ключу по y и порядку добавления и выводит их одним вызовом blits.
+        При выводе по полосам записи выводятся по горизонтальным полосам.
+
+        Args:
+            surface (Surface): отображение.
+        """
+        if not self._count:
+            return
+        entries = self._entries
+        entries.sort()
+        blits = ((entries[index][3], entries[index][4]) for index in range(self._count))
+        if self._strip_renderer.is_enabled:
+            self._strip_renderer.blits(surface, blits)
+        else:
+            surface.blits(blits, doreturn=False)
+        self.clear()
+
+    def clear(self) -> None:
+        """Очищает очередь, сохраняя буфер записей."""
+        for index in range(self._count):
+            entry = self._entries[index]
+            entry[0] = entry[1] = entry[2] = inf
+            entry[3] = entry[4] = None
+        self._count = 0
@@ -0,0 +1,145 @@
+from collections import deque
+from math import ceil
+from weakref import WeakKeyDictionary
+
+from pygame import Surface, FRect, transform
+
+from engine.metaclasses.singleton import SingletonMeta
+from engine.settings import Settings
+from engine.constants import Coordinate, Size
+from engine.map import VisibleMap
+from engine.time import GlobalClock
+from engine.render.constants import FRAME_TIMES_WINDOW, HEADROOM_COEF
+
+
+class DynamicResolution(metaclass=SingletonMeta):
+    """Динамическое разрешение вывода.
+    По среднему времени последних кадров масштаб внутреннего разрешения снижается шагами при превышении
+    бюджета кадра и повышается при запасе. Кадр выводится на уменьшенную цель вывода, изображения
+    масштабируются один раз на масштаб, а логические координаты, камера и мышь остаются в размере видимой части карты.
+
+    Attributes:
+        _settings (Settings): объект настроек игрового процесса.
+        is_enabled (bool): флаг динамического разрешения.
+        _min_scale (float): минимальный масштаб.
+        _step (float): шаг изменения масштаба.
+        scale (float): текущий масштаб внутреннего разрешения.
+    """
+
+    _settings: Settings = Settings()
+    is_enabled: bool = _settings['engine']['render']['dynamic_resolution_mode']
+    _min_scale: float = _settings['engine']['render']['min_render_scale']
+    _step: float = _settings['engine']['render']['render_scale_step']
+
+    def __init__(self) -> None:
+        """Инициализация динамического разрешения."""
+        self._global_clock: GlobalClock = GlobalClock()
+        self._visible_map: VisibleMap = VisibleMap()
+        self._frame_times: deque[int] = deque(maxlen=FRAME_TIMES_WINDOW)
+        self._surface: Surface | None = None
+        self._images: WeakKeyDictionary[Surface, Surface] = WeakKeyDictionary()
+        self.scale: float = 1
+
+    @property
+    def surface(self) -> Surface:
+        """Отдаёт цель вывода текущего масштаба, при масштабе 1 - видимую часть карты.
+
+        Returns:
+            Surface: цель вывода.
+        """
+        if self.scale == 1:
+            return self._visible_map
+        if self._surface is None:
+            self._surface = Surface(self.scale_size(self._visible_map.get_size()), 0, self._visible_map)
+        return self._surface
+
+    def _set_scale(self, scale: float) -> None:
+        """Устанавливает масштаб и сбрасывает цель вывода и масштабированные изображения.
+
+        Args:
+            scale (float): масштаб.
+        """
+        self.scale = scale
+        self._surface = None
+        self._images.clear()
+        self._frame_times.clear()
+
+    def update(self) -> bool:
+        """Запоминает время кадра и меняет масштаб по среднему времени последних кадров.
+
+        Returns:
+            bool: флаг изменения масштаба.
+        """
+        if not self._global_clock.framerate:
+            return False
+        self._frame_times.append(self._global_clock.raw_frame_time)
+        if len(self._frame_times) < FRAME_TIMES_WINDOW:
+            return False
+        frame_budget = 1000 / self._global_clock.framerate
+        average = sum(self._frame_times) / len(self._frame_times)
+        if average > frame_budget and self.scale > self._min_scale:
+            self._set_scale(max(self._min_scale, self.scale - self._step))
+            return True
+        if average < frame_budget * HEADROOM_COEF and self.scale < 1:
+            self._set_scale(min(1, self.scale + self._step))
+            return True
+        return False
+
+    def get_scale(self, surface: Surface) -> float:
+        """Отдаёт масштаб вывода на отображение.
+
+        Args:
+            surface (Surface): отображение.
+
+        Returns:
+            float: текущий масштаб для уменьшенной цели вывода, иначе 1.
+        """
+        return self.scale if surface is self._surface else 1
+
+    def scale_size(self, size: tuple[float, float]) -> Size:
+        """Переводит размер в размер уменьшенной цели вывода.
+
+        Args:
+            size (tuple[float, float]): размер.
+
+        Returns:
+            Size: размер в пикселях цели вывода.
+        """
+        return Size(ceil(size[0] * self.scale), ceil(size[1] * self.scale))
+
+    def scale_coordinate(self, coordinate: Coordinate) -> Coordinate:
+        """Переводит координаты видимой части карты в координаты уменьшенной цели вывода.
+
+        Args:
+            coordinate (Coordinate): координаты видимой части карты.
+
+        Returns:
+            Coordinate: координаты цели вывода.
+        """
+        return Coordinate(coordinate[0] * self.scale, coordinate[1] * self.scale)
+
+    def scale_rect(self, rect: FRect) -> FRect:
+        """Переводит область видимой части карты в область уменьшенной цели вывода.
+
+        Args:
+            rect (FRect): область видимой части карты.
+
+        Returns:
+            FRect: область цели вывода.
+        """
+        return FRect(rect.x * self.scale, rect.y * self.scale, rect.width * self.scale, rect.height * self.scale)
+
+    def get_image(self, image: Surface) -> Surface:
+        """Отдаёт изображение, масштабированное под текущий масштаб. Изображение масштабируется один раз.
+
+        Args:
+            image (Surface): изображение.
+
+        Returns:
+            Surface: масштабированное изображение.
+        """
+        if self.scale == 1:
+            return image
+        if (scaled := self._images.get(image)) is None:
+            scaled = self._images[image] = transform.scale(image, self.scale_size(image.get_size()))
+        return scaled
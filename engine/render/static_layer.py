@@ -0,0 +1,212 @@
+from typing import TYPE_CHECKING
+
+from math import ceil
+
+from pygame import FRect, Surface, transform
+
+from engine.constants import Size, Coordinate
+from engine.constants.empty import SRCALPHA
+from engine.render.texture_renderer import TextureRenderer
+
+if TYPE_CHECKING:
+    from engine.objects import Object
+
+
+class StaticRenderChunk:
+    """Чанк статического слоя вывода.
+
+    Attributes:
+        _texture_renderer (TextureRenderer): вывод через SDL2 Renderer.
+        rect (FRect): rect чанка в мировых координатах.
+        surface (Surface): запечённые изображения статических объектов чанка.
+        sprites (dict[Object, tuple[Surface, Coordinate]]): статические объекты чанка
+            с изображением и положением на момент запекания.
+        is_dirty (bool): флаг необходимости перезапекания.
+        _scaled (tuple[float, Surface] | None): масштаб и масштабированное изображение чанка.
+    """
+
+    _texture_renderer: TextureRenderer = TextureRenderer()
+
+    def __init__(self, rect: FRect) -> None:
+        """Инициализация чанка.
+
+        Args:
+            rect (FRect): rect чанка в мировых координатах.
+        """
+        self.rect = rect
+        self.surface = Surface((int(rect.width), int(rect.height)), SRCALPHA)
+        self.sprites: dict['Object', tuple[Surface, Coordinate]] = {}
+        self.is_dirty = True
+        self._scaled: tuple[float, Surface] | None = None
+
+    def get_surface(self, scale: float) -> Surface:
+        """Отдаёт изображение чанка в масштабе, масштабированное изображение запоминается до перезапекания.
+
+        Args:
+            scale (float): масштаб.
+
+        Returns:
+            Surface: изображение чанка.
+        """
+        if scale == 1:
+            return self.surface
+        if self._scaled is None or self._scaled[0] != scale:
+            size = (ceil(self.rect.width * scale), ceil(self.rect.height * scale))
+            self._scaled = (scale, transform.scale(self.surface, size))
+        return self._scaled[1]
+
+    def bake(self) -> None:
+        """Заново выводит изображения статических объектов на surface чанка
+        и сбрасывает закэшированные по изображению текстуру и масштабированное изображение.
+        """
+        self.surface.fill((0, 0, 0, 0))
+        self._texture_renderer.invalidate(self.surface)
+        for sprite in self.sprites:
+            self.sprites[sprite] = (sprite.image, Coordinate(*sprite.rect.topleft))
+            self.surface.blit(
+                sprite.image,
+                (
+                    sprite.rect.x - sprite.coordinate_shift.x - self.rect.x,
+                    sprite.rect.y - sprite.coordinate_shift.y - self.rect.y,
+                ),
+            )
+        self.is_dirty = False
+        self._scaled = None
+
+
+class StaticRenderLayer:
+    """Статический слой вывода. Изображения неподвижных объектов группы запекаются в чанки,
+    выровненные по сетке тайтлов, и выводятся одним blit-ом на чанк, пересекающий видимую часть карты.
+    Чанк перезапекается только при добавлении, удалении или смене изображения одного из его объектов.
+    """
+
+    def __init__(self, chunk_size: Size) -> None:
+        """Инициализация статического слоя вывода.
+
+        Args:
+            chunk_size (Size): размер чанка.
+        """
+        self._chunk_size = chunk_size
+        self._chunks: dict[tuple[int, int], StaticRenderChunk] = {}
+        self._sprites_chunks: dict['Object', tuple[StaticRenderChunk, ...]] = {}
+
+    def __contains__(self, sprite: 'Object') -> bool:
+        """Проверяет, запечён ли объект в слой.
+
+        Args:
+            sprite (Object): объект.
+
+        Returns:
+            bool: флаг наличия объекта в слое.
+        """
+        return sprite in self._sprites_chunks
+
+    def __len__(self) -> int:
+        """Отдаёт количество объектов в слое."""
+        return len(self._sprites_chunks)
+
+    def _get_keys(self, rect: FRect) -> list[tuple[int, int]]:
+        """Отдаёт ключи чанков, которые пересекает rect.
+
+        Args:
+            rect (FRect): rect для поиска.
+
+        Returns:
+            list[tuple[int, int]]: ключи чанков.
+        """
+        left = int(rect.left // self._chunk_size.width)
+        top = int(rect.top // self._chunk_size.height)
+        right = int(rect.right // self._chunk_size.width)
+        bottom = int(rect.bottom // self._chunk_size.height)
+        return [(x, y) for y in range(top, bottom + 1) for x in range(left, right + 1)]
+
+    def _get_chunk(self, key: tuple[int, int]) -> StaticRenderChunk:
+        """Отдаёт чанк по ключу, создавая его при отсутствии.
+
+        Args:
+            key (tuple[int, int]): ключ чанка.
+
+        Returns:
+            StaticRenderChunk: чанк.
+        """
+        if chunk := self._chunks.get(key):
+            return chunk
+        x, y = key
+        chunk = StaticRenderChunk(
+            FRect(Coordinate(x * self._chunk_size.width, y * self._chunk_size.height), self._chunk_size)
+        )
+        self._chunks[key] = chunk
+        return chunk
+
+    @staticmethod
+    def _get_image_rect(sprite: 'Object') -> FRect:
+        """Отдаёт область изображения объекта в мировых координатах.
+
+        Args:
+            sprite (Object): объект.
+
+        Returns:
+            FRect: область изображения.
+        """
+        return FRect(
+            Coordinate(sprite.rect.x - sprite.coordinate_shift.x, sprite.rect.y - sprite.coordinate_shift.y),
+            sprite.image.get_size(),
+        )
+
+    def add(self, sprite: 'Object') -> None:
+        """Добавляет объект в чанки, которые пересекает его изображение.
+
+        Args:
+            sprite (Object): статический объект.
+        """
+        chunks = tuple(self._get_chunk(key) for key in self._get_keys(self._get_image_rect(sprite)))
+        for chunk in chunks:
+            chunk.sprites[sprite] = (sprite.image, Coordinate(*sprite.rect.topleft))
+            chunk.is_dirty = True
+        self._sprites_chunks[sprite] = chunks
+
+    def remove(self, sprite: 'Object') -> None:
+        """Удаляет объект из слоя, затронутые чанки будут перезапечены при выводе.
+
+        Args:
+            sprite (Object): статический объект.
+        """
+        for chunk in self._sprites_chunks.pop(sprite, ()):
+            del chunk.sprites[sprite]
+            chunk.is_dirty = True
+
+    def _refresh(self, chunk: StaticRenderChunk) -> None:
+        """Перезапекает чанк, если его объекты сменили изображение или положение.
+        Сместившиеся объекты переносятся в актуальные чанки.
+
+        Args:
+            chunk (StaticRenderChunk): чанк.
+        """
+        for sprite, (image, coordinate) in tuple(chunk.sprites.items()):
+            if sprite.rect.topleft != coordinate or sprite.image.get_size() != image.get_size():
+                self.remove(sprite)
+                self.add(sprite)
+            elif sprite.image is not image:
+                chunk.is_dirty = True
+        if chunk.is_dirty:
+            chunk.bake()
+
+    def draw(self, surface: Surface, offset: Coordinate, area: FRect | None = None, scale: float = 1) -> None:
+        """Выводит чанки, пересекающие отображение.
+
+        Args:
+            surface (Surface): отображение.
+            offset (Coordinate): смещение мировых координат относительно отображения.
+            area (FRect | None, optional): область отображения, вне которой чанки не выводятся. По дефолту None.
+            scale (float, optional): масштаб вывода на отображение. По дефолту 1.
+        """
+        rect = area or FRect(0, 0, surface.get_width() / scale, surface.get_height() / scale)
+        blits = []
+        for key in self._get_keys(rect.move(-offset.x, -offset.y)):
+            if not (chunk := self._chunks.get(key)) or not chunk.sprites:
+                continue
+            self._refresh(chunk)
+            blits.append(
+                (chunk.get_surface(scale), ((chunk.rect.x + offset.x) * scale, (chunk.rect.y + offset.y) * scale))
+            )
+        surface.blits(blits, doreturn=False)
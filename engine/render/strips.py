@@ -0,0 +1,82 @@
+from math import ceil
+from typing import Iterable
+
+from pygame import Surface
+
+from engine.metaclasses.singleton import SingletonMeta
+from engine.settings import Settings
+from engine.constants import Coordinate
+from engine.render.constants import STRIP_MIN_BLITS
+
+
+class StripRenderer(metaclass=SingletonMeta):
+    """Вывод по горизонтальным полосам.
+    Отображение делится на полосы-подповерхности, каждая полоса получает изображения, которые её пересекают,
+    и выводит их своим вызовом blits. Полосы выводятся по очереди в вызывающем потоке: pygame-ce 2.5
+    держит GIL весь вызов blits, поэтому пул потоков не выводит полосы параллельно и только добавляет
+    расходы на передачу задач. Полоса пишет только в свои строки отображения, и они остаются в кэше процессора
+    на время вывода всех её изображений. Деление изображений на полосы стоит десятки микросекунд на кадр,
+    поэтому наборы меньше STRIP_MIN_BLITS выводятся одним вызовом blits.
+
+    Attributes:
+        _settings (Settings): объект настроек игрового процесса.
+        is_enabled (bool): флаг вывода по полосам.
+        _strips_count (int): количество полос.
+    """
+
+    _settings: Settings = Settings()
+    is_enabled: bool = _settings['engine']['render']['strip_render_mode']
+    _strips_count: int = _settings['engine']['render']['render_strips']
+
+    def __init__(self) -> None:
+        """Инициализация вывода по полосам."""
+        self._surface: Surface | None = None
+        self._size: tuple[int, int] = (0, 0)
+        self._strip_height = 0
+        self._strips: list[Surface] = []
+
+    def _set_strips(self, surface: Surface) -> None:
+        """Делит отображение на полосы, полосы запоминаются до смены отображения или его размера.
+
+        Args:
+            surface (Surface): отображение.
+        """
+        width, height = self._size = surface.get_size()
+        self._surface = surface
+        self._strip_height = max(1, ceil(height / self._strips_count))
+        self._strips = [
+            surface.subsurface((0, top, width, min(self._strip_height, height - top)))
+            for top in range(0, height, self._strip_height)
+        ]
+
+    def blits(self, surface: Surface, blits: Iterable[tuple[Surface, Coordinate]]) -> None:
+        """Выводит изображения на отображение по полосам.
+        При малом количестве изображений, установленной области отсечения или выводе не на Surface
+        вывод идёт одним вызовом blits.
+
+        Args:
+            surface (Surface): отображение.
+            blits (Iterable[tuple[Surface, Coordinate]]): изображения и координаты вывода.
+        """
+        blits = list(blits)
+        if (
+            not isinstance(surface, Surface)
+            or len(blits) < STRIP_MIN_BLITS
+            or surface.get_clip() != surface.get_rect()
+        ):
+            surface.blits(blits, doreturn=False)
+            return
+        if surface is not self._surface or surface.get_size() != self._size:
+            self._set_strips(surface)
+        strip_height = self._strip_height
+        last_index = len(self._strips) - 1
+        works: list[list[tuple[Surface, tuple[int, int]]]] = [[] for _ in self._strips]
+        for image, coordinate in blits:
+            x, y = int(coordinate[0]), int(coordinate[1])
+            first = max(0, y // strip_height)
+            last = min(last_index, (y + image.get_height() - 1) // strip_height)
+            for index in range(first, last + 1):
+                works[index].append((image, (x, y - index * strip_height)))
+        for strip, work in zip(self._strips, works):
+            if work:
+                strip.blits(work, doreturn=False)
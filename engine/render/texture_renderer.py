@@ -0,0 +1,221 @@
+from typing import Iterable
+from weakref import WeakKeyDictionary
+
+from pygame import Color, FRect, Rect, Surface, error
+from pygame._sdl2.sdl2 import error as SDLError
+from pygame._sdl2.video import Renderer, Texture, Window
+
+from engine.metaclasses.singleton import SingletonMeta
+from engine.settings import Settings
+from engine.settings.constants import RenderBackendEnum
+from engine.constants import Coordinate, Size
+
+
+class TextureRenderer(metaclass=SingletonMeta):
+    """Вывод через SDL2 Renderer.
+    Повторяет интерфейс отображения, которым пользуются группы, задний план и отладка (get_size, blit, blits, fill),
+    поэтому выводится на него так же, как на видимую часть карты. Изображения загружаются в текстуры один раз
+    и выводятся renderer-ом, масштабирование до окна выполняет логический размер renderer-а.
+    Изображения, изменённые на месте, сбрасываются через invalidate.
+    При отсутствии GPU используется программный renderer SDL, при ошибке создания - вывод через Surface.
+
+    Attributes:
+        _settings (Settings): объект настроек игрового процесса.
+        is_enabled (bool): флаг вывода через SDL2 Renderer.
+        _visible_map_size (Size): размер видимой части карты - логический размер renderer-а.
+    """
+
+    _settings: Settings = Settings()
+    is_enabled: bool = _settings['engine']['render']['render_backend'] == RenderBackendEnum.RENDERER
+    _visible_map_size: Size = Size(*_settings['engine']['base_visible_map_size'])
+
+    def __init__(self) -> None:
+        """Инициализация вывода через SDL2 Renderer."""
+        self.window: Window | None = None
+        self.renderer: Renderer | None = None
+        self._textures: WeakKeyDictionary[Surface, Texture] = WeakKeyDictionary()
+
+    def _create_renderer(self) -> Renderer:
+        """Создаёт renderer, при недоступности аппаратного - программный.
+
+        Returns:
+            Renderer: renderer окна.
+        """
+        try:
+            return Renderer(self.window, accelerated=-1)
+        except (error, SDLError):
+            return Renderer(self.window, accelerated=0)
+
+    def create(self, title: str, resolution: tuple[int, int], fullscreen: bool) -> bool:
+        """Создаёт окно и renderer. При ошибке вывод через SDL2 Renderer отключается.
+
+        Args:
+            title (str): заголовок окна.
+            resolution (tuple[int, int]): разрешение окна.
+            fullscreen (bool): флаг полноэкранного режима.
+
+        Returns:
+            bool: флаг успешного создания.
+        """
+        try:
+            self.window = Window(title, resolution, fullscreen=fullscreen)
+            self.renderer = self._create_renderer()
+        except (error, SDLError):
+            if self.window is not None:
+                self.window.destroy()
+            self.window = self.renderer = None
+            self.is_enabled = False
+            return False
+        self.renderer.logical_size = self._visible_map_size
+        self.fill((0, 0, 0))
+        return True
+
+    def get_size(self) -> Size:
+        """Отдаёт размер вывода.
+
+        Returns:
+            Size: размер видимой части карты.
+        """
+        return self._visible_map_size
+
+    def get_width(self) -> int:
+        """Отдаёт ширину вывода.
+
+        Returns:
+            int: ширина видимой части карты.
+        """
+        return self._visible_map_size.width
+
+    def get_height(self) -> int:
+        """Отдаёт высоту вывода.
+
+        Returns:
+            int: высота видимой части карты.
+        """
+        return self._visible_map_size.height
+
+    def get_rect(self) -> Rect:
+        """Отдаёт rect вывода.
+
+        Returns:
+            Rect: rect видимой части карты.
+        """
+        return Rect((0, 0), self._visible_map_size)
+
+    def get_frect(self) -> FRect:
+        """Отдаёт frect вывода.
+
+        Returns:
+            FRect: frect видимой части карты.
+        """
+        return FRect((0, 0), self._visible_map_size)
+
+    def get_clip(self) -> Rect:
+        """Отдаёт область отсечения, вывод через renderer всегда идёт на всю видимую часть карты.
+
+        Returns:
+            Rect: rect видимой части карты.
+        """
+        return self.get_rect()
+
+    def _get_texture(self, image: Surface) -> Texture:
+        """Отдаёт текстуру изображения, загружая изображение в текстуру один раз.
+
+        Args:
+            image (Surface): изображение.
+
+        Returns:
+            Texture: текстура.
+        """
+        if (texture := self._textures.get(image)) is None:
+            texture = self._textures[image] = Texture.from_surface(self.renderer, image)
+        return texture
+
+    def invalidate(self, surface: Surface) -> None:
+        """Сбрасывает текстуры изображения, изменённого на месте, и его подповерхностей.
+        Текстуры хранятся по изображению, поэтому без сброса выводится содержимое на момент загрузки.
+
+        Args:
+            surface (Surface): изменённое изображение.
+        """
+        for image in list(self._textures):
+            if image is surface or image.get_abs_parent() is surface:
+                del self._textures[image]
+
+    def fill(self, color: Color | tuple, rect: Rect | FRect | None = None) -> None:
+        """Заливает вывод цветом.
+
+        Args:
+            color (Color | tuple): цвет.
+            rect (Rect | FRect | None, optional): область заливки. По дефолту None - весь вывод.
+        """
+        self.renderer.draw_color = color
+        if rect is None:
+            self.renderer.clear()
+            return
+        self.renderer.fill_rect(rect)
+
+    def draw_rect(self, color: Color | tuple, rect: Rect | FRect, width: int = 1) -> None:
+        """Выводит обводку области.
+
+        Args:
+            color (Color | tuple): цвет.
+            rect (Rect | FRect): область.
+            width (int, optional): толщина обводки. По дефолту 1.
+        """
+        self.renderer.draw_color = color
+        rect = FRect(rect)
+        for _ in range(max(1, width)):
+            self.renderer.draw_rect(rect)
+            rect = rect.inflate(-2, -2)
+
+    def blit(
+        self,
+        source: Surface,
+        dest: Coordinate | Rect | FRect,
+        area: Rect | FRect | None = None,
+        special_flags: int = 0,
+    ) -> FRect:
+        """Выводит изображение. Флаги смешивания не поддерживаются, смешивание задаёт текстура изображения.
+
+        Args:
+            source (Surface): изображение.
+            dest (Coordinate | Rect | FRect): координаты или rect вывода.
+            area (Rect | FRect | None, optional): выводимая область изображения. По дефолту None - всё изображение.
+            special_flags (int, optional): флаги смешивания. По дефолту 0.
+
+        Returns:
+            FRect: область вывода.
+        """
+        dstrect = FRect(dest[0], dest[1], *((area[2], area[3]) if area else source.get_size()))
+        self._get_texture(source).draw(srcrect=area, dstrect=dstrect)
+        return dstrect
+
+    def blits(self, blit_sequence: Iterable[tuple[Surface, Coordinate]], doreturn: bool = True) -> list[FRect] | None:
+        """Выводит изображения.
+
+        Args:
+            blit_sequence (Iterable[tuple[Surface, Coordinate]]): изображения и координаты вывода.
+            doreturn (bool, optional): флаг возврата областей вывода. По дефолту True.
+
+        Returns:
+            list[FRect] | None: области вывода.
+        """
+        rects = [self.blit(*blit) for blit in blit_sequence]
+        return rects if doreturn else None
+
+    def to_visible_map(self, coordinate: Coordinate) -> Coordinate:
+        """Переводит координаты окна в координаты видимой части карты.
+
+        Args:
+            coordinate (Coordinate): координаты окна.
+
+        Returns:
+            Coordinate: координаты видимой части карты.
+        """
+        return Coordinate(*self.renderer.coordinates_from_window(coordinate))
+
+    def present(self) -> None:
+        """Выводит кадр в окно и очищает буфер следующего кадра."""
+        self.renderer.present()
+        self.fill((0, 0, 0))
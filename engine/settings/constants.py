@@ -1,4 +1,4 @@
-from enum import IntEnum, Enum
+from enum import IntEnum, Enum, StrEnum
 
 from engine.constants.path import BasePathEnum
 
@@ -114,6 +114,38 @@ class FPSEnum(IntEnum):
     MIN_FPS = 30
 
 
+class CacheBudgetEnum(IntEnum):
+    """Enum бюджета памяти кэша в мегабайтах, 0 - без ограничения."""
+
+    DEFAULT_BUDGET = 0
+    MIN_BUDGET = 0
+    MAX_BUDGET = 16384
+
+
+class TickRateEnum(IntEnum):
+    """Enum частоты шагов симуляции."""
+
+    DEFAULT_TICK_RATE = 60
+    MIN_TICK_RATE = 1
+    MAX_TICK_RATE = 300
+
+
+class MaxSubstepsEnum(IntEnum):
+    """Enum максимального количества шагов симуляции за кадр."""
+
+    DEFAULT_SUBSTEPS = 5
+    MIN_SUBSTEPS = 1
+    MAX_SUBSTEPS = 20
+
+
+class FramesBeforeSleepEnum(IntEnum):
+    """Enum количества кадров покоя до засыпания объекта."""
+
+    DEFAULT_FRAMES = 30
+    MIN_FRAMES = 1
+    MAX_FRAMES = 1000
+
+
 class TextSizeEnum(IntEnum):
     """Enum размер текста."""
 
@@ -157,3 +189,53 @@ class ColumnsRowsEnum(IntEnum):
 
     DEFAULT_COUNT = 500
     MIN_COUNT = 1
+
+
+class ScaleModeEnum(StrEnum):
+    """Enum режимов масштабирования видимой части карты на дисплей."""
+
+    STRETCH = 'stretch'
+    INTEGER = 'integer'
+    SCALED = 'scaled'
+
+
+class RenderBackendEnum(StrEnum):
+    """Enum способов вывода."""
+
+    SURFACE = 'surface'
+    RENDERER = 'renderer'
+
+
+class StaticChunkTilesEnum(IntEnum):
+    """Enum количества тайтлов по стороне чанка статического слоя вывода."""
+
+    DEFAULT_COUNT = 4
+    MIN_COUNT = 1
+    MAX_COUNT = 64
+
+
+class AtlasPageSizeEnum(IntEnum):
+    """Enum размера страницы атласа текстур."""
+
+    DEFAULT_SIZE = 2048
+    MIN_SIZE = 256
+    MAX_SIZE = 8192
+
+
+class RenderStripsEnum(IntEnum):
+    """Enum количества горизонтальных полос вывода."""
+
+    DEFAULT_COUNT = 8
+    MIN_COUNT = 2
+    MAX_COUNT = 64
+
+
+class RenderScaleEnum(Enum):
+    """Enum масштаба внутреннего разрешения вывода."""
+
+    DEFAULT_MIN_SCALE = 0.5
+    MIN_SCALE = 0.25
+    MAX_SCALE = 1
+    DEFAULT_STEP = 0.125
+    MIN_STEP = 0.05
+    MAX_STEP = 0.5
@@ -25,6 +25,16 @@ from engine.settings.constants import (
     RectOutlineRGBColorEnum,
     CameraSmoothnessEnum,
     CoefFrameTimeEnum,
+    TickRateEnum,
+    MaxSubstepsEnum,
+    FramesBeforeSleepEnum,
+    ScaleModeEnum,
+    RenderBackendEnum,
+    StaticChunkTilesEnum,
+    AtlasPageSizeEnum,
+    RenderScaleEnum,
+    RenderStripsEnum,
+    CacheBudgetEnum,
 )
 from engine.utils.file import validate_format_file
 from engine.settings.types import TYPES_SETTINGS
@@ -289,6 +299,99 @@ class CameraSchema(RectOutlineSchema):
     )
 
 
+class PhysicsSchema(BaseSettingsSchema):
+    """Схема физики."""
+
+    swept_movement: bool = Field(default=False, description='Флаг непрерывного перемещения до точки касания')
+    sleeping_mode: bool = Field(default=False, description='Флаг засыпания динамических объектов в покое')
+    frames_before_sleep: int = Field(
+        default=FramesBeforeSleepEnum.DEFAULT_FRAMES,
+        ge=FramesBeforeSleepEnum.MIN_FRAMES,
+        le=FramesBeforeSleepEnum.MAX_FRAMES,
+        description='Количество кадров покоя до засыпания динамического объекта',
+    )
+    batched_integrator: bool = Field(default=False, description='Флаг пакетного интегратора движения на NumPy')
+    collision_cache: bool = Field(default=False, description='Флаг кэширования проверок коллизии в пределах шага')
+
+
+class FixedTimestepSchema(BaseSettingsSchema):
+    """Схема фиксированного шага симуляции."""
+
+    fixed_timestep_mode: bool = Field(default=False, description='Флаг фиксированного шага симуляции')
+    tick_rate: int = Field(
+        default=TickRateEnum.DEFAULT_TICK_RATE,
+        ge=TickRateEnum.MIN_TICK_RATE,
+        le=TickRateEnum.MAX_TICK_RATE,
+        description='Частота шагов симуляции в секунду',
+    )
+    max_substeps: int = Field(
+        default=MaxSubstepsEnum.DEFAULT_SUBSTEPS,
+        ge=MaxSubstepsEnum.MIN_SUBSTEPS,
+        le=MaxSubstepsEnum.MAX_SUBSTEPS,
+        description='Максимальное количество шагов симуляции за кадр',
+    )
+    interpolation: bool = Field(default=True, description='Флаг интерполяции положения объектов при выводе')
+
+
+class RenderSchema(BaseSettingsSchema):
+    """Схема вывода."""
+
+    culling_mode: bool = Field(default=False, description='Флаг отсечения спрайтов вне видимой части карты')
+    dirty_rects_mode: bool = Field(default=False, description='Флаг перерисовки только изменившихся областей')
+    scale_mode: ScaleModeEnum = Field(
+        default=ScaleModeEnum.STRETCH,
+        description='Режим масштабирования видимой части карты на дисплей',
+    )
+    render_backend: RenderBackendEnum = Field(
+        default=RenderBackendEnum.SURFACE,
+        description='Способ вывода: через Surface или через SDL2 Renderer с текстурами',
+    )
+    static_layer_mode: bool = Field(default=False, description='Флаг запекания статических спрайтов в чанки')
+    static_chunk_tiles: int = Field(
+        default=StaticChunkTilesEnum.DEFAULT_COUNT,
+        ge=StaticChunkTilesEnum.MIN_COUNT,
+        le=StaticChunkTilesEnum.MAX_COUNT,
+        description='Количество тайтлов по стороне чанка статического слоя вывода',
+    )
+    atlas_mode: bool = Field(default=False, description='Флаг упаковки кадров анимаций в атлас текстур')
+    atlas_page_size: int = Field(
+        default=AtlasPageSizeEnum.DEFAULT_SIZE,
+        ge=AtlasPageSizeEnum.MIN_SIZE,
+        le=AtlasPageSizeEnum.MAX_SIZE,
+        description='Ширина и высота страницы атласа текстур',
+    )
+    atlas_preload_mode: bool = Field(
+        default=False, description='Флаг упаковки кадров анимации в атлас текстур при создании анимации'
+    )
+    render_queue_mode: bool = Field(
+        default=False, description='Флаг вывода спрайтов всех групп через общую очередь с сортировкой по слою и y'
+    )
+    dynamic_resolution_mode: bool = Field(
+        default=False, description='Флаг снижения внутреннего разрешения вывода при превышении времени кадра'
+    )
+    min_render_scale: float = Field(
+        default=RenderScaleEnum.DEFAULT_MIN_SCALE.value,
+        ge=RenderScaleEnum.MIN_SCALE.value,
+        le=RenderScaleEnum.MAX_SCALE.value,
+        description='Минимальный масштаб внутреннего разрешения вывода',
+    )
+    render_scale_step: float = Field(
+        default=RenderScaleEnum.DEFAULT_STEP.value,
+        ge=RenderScaleEnum.MIN_STEP.value,
+        le=RenderScaleEnum.MAX_STEP.value,
+        description='Шаг изменения масштаба внутреннего разрешения вывода',
+    )
+    strip_render_mode: bool = Field(
+        default=False, description='Флаг вывода спрайтов по горизонтальным полосам видимой части карты'
+    )
+    render_strips: int = Field(
+        default=RenderStripsEnum.DEFAULT_COUNT,
+        ge=RenderStripsEnum.MIN_COUNT,
+        le=RenderStripsEnum.MAX_COUNT,
+        description='Количество горизонтальных полос вывода',
+    )
+
+
 class EngineSettingsSchema(BaseSettingsSchema):
     """Схема настроек движка."""
 
@@ -375,6 +478,51 @@ class EngineSettingsSchema(BaseSettingsSchema):
         le=CoefFrameTimeEnum.MAX_COEF.value,
         description='Коэффициент времени кадра',
     )
+    cache_budget: int = Field(
+        default=CacheBudgetEnum.DEFAULT_BUDGET,
+        ge=CacheBudgetEnum.MIN_BUDGET,
+        le=CacheBudgetEnum.MAX_BUDGET,
+        description='Бюджет памяти кэша изображений и звуков в мегабайтах, 0 - без ограничения',
+    )
+    physics: PhysicsSchema = Field(
+        default=PhysicsSchema(
+            swept_movement=False,
+            sleeping_mode=False,
+            frames_before_sleep=FramesBeforeSleepEnum.DEFAULT_FRAMES,
+            batched_integrator=False,
+            collision_cache=False,
+        ),
+        description='Физика',
+    )
+    fixed_timestep: FixedTimestepSchema = Field(
+        default=FixedTimestepSchema(
+            fixed_timestep_mode=False,
+            tick_rate=TickRateEnum.DEFAULT_TICK_RATE,
+            max_substeps=MaxSubstepsEnum.DEFAULT_SUBSTEPS,
+            interpolation=True,
+        ),
+        description='Фиксированный шаг симуляции',
+    )
+    render: RenderSchema = Field(
+        default=RenderSchema(
+            culling_mode=False,
+            dirty_rects_mode=False,
+            scale_mode=ScaleModeEnum.STRETCH,
+            render_backend=RenderBackendEnum.SURFACE,
+            static_layer_mode=False,
+            static_chunk_tiles=StaticChunkTilesEnum.DEFAULT_COUNT,
+            atlas_mode=False,
+            atlas_page_size=AtlasPageSizeEnum.DEFAULT_SIZE,
+            atlas_preload_mode=False,
+            render_queue_mode=False,
+            dynamic_resolution_mode=False,
+            min_render_scale=RenderScaleEnum.DEFAULT_MIN_SCALE.value,
+            render_scale_step=RenderScaleEnum.DEFAULT_STEP.value,
+            strip_render_mode=False,
+            render_strips=RenderStripsEnum.DEFAULT_COUNT,
+        ),
+        description='Вывод',
+    )
 
     @field_validator('path_icon', mode='before')
     @classmethod
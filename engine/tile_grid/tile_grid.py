@@ -1,3 +1,5 @@
+from warnings import warn
+
 from pygame import FRect, Surface, draw
 
 from engine.metaclasses.singleton import SingletonMeta
@@ -6,6 +8,7 @@ from engine.constants import Size, Coordinate, Color
 from engine.constants.empty import EMPTY_FRAME, ZERO_COORDINATES, SRCALPHA
 from engine.tile_grid.constants import POSITION_RECT_INNER_OUTLINE, SHIFT_NUMBER_POSITION_BY_X
 from engine.objects.text import Text
+from engine.map import VisibleMap
 
 
 class Tile:
@@ -109,22 +112,20 @@ class TileGrid(metaclass=SingletonMeta):
                 self.surface.blits(((number_row.text, number_row), (number_column.text, number_column.rect)))
                 draw.rect(self.surface, rect_outline_color, tile.rect, rect_outline_width)
 
+    def move(self, move: Coordinate) -> None:
+        """Перемещение сетки тайтлов. Устарело: сетка хранит мировые координаты,
+        поэтому перемещение сдвигает смещение видимой части карты.
+
+        Args:
+            move (Coordinate): перемещение по осям x, y.
+        """
+        warn('TileGrid.move устарел, используйте VisibleMap.offset', DeprecationWarning, stacklevel=2)
+        visible_map = VisibleMap()
+        visible_map.offset = Coordinate(visible_map.offset.x + move.x, visible_map.offset.y + move.y)
+
     def _debug_mode(self) -> None:
         """Debug mode."""
         if not self._debug:
             return
         self._create_surface()
         self._draw_tile()
-
-    def move(self, move: Coordinate) -> None:
-        """Перемещение сетки тайтлов.
-
-        Args:
-            move (Coordinate): перемещение по осям x, y.
-        """
-        self.rect.x += move.x
-        self.rect.y += move.y
-        for column in self._tile_grid:
-            for tile in column:
-                tile.rect.x += move.x
-                tile.rect.y += move.y
@@ -13,12 +13,40 @@ class GlobalClock(metaclass=SingletonMeta):
         settings: Settings = Settings()
         self.framerate = settings['graphics']['max_fps']
         self._coef_frame_time = settings['engine']['coef_frame_time']
+        self.is_fixed_timestep: bool = settings['engine']['fixed_timestep']['fixed_timestep_mode']
+        self.is_interpolation: bool = self.is_fixed_timestep and settings['engine']['fixed_timestep']['interpolation']
+        self._fixed_frame_time: float = 1000 / settings['engine']['fixed_timestep']['tick_rate']
+        self._max_substeps: int = settings['engine']['fixed_timestep']['max_substeps']
+        self._accumulator: float = 0
         self.dt = 0
         self.frame_time = 0
+        self.raw_frame_time = 0
+        self.steps = 1
+        self.alpha = 1
+
+    def _tick_fixed_timestep(self, frame_time: int) -> None:
+        """Накапливает время кадра и рассчитывает количество фиксированных шагов симуляции.
+
+        Args:
+            frame_time (int): время кадра.
+        """
+        self._accumulator += frame_time
+        self.steps = min(int(self._accumulator // self._fixed_frame_time), self._max_substeps)
+        self._accumulator -= self.steps * self._fixed_frame_time
+        if self.steps == self._max_substeps:
+            self._accumulator %= self._fixed_frame_time
+        self.alpha = self._accumulator / self._fixed_frame_time
+        self.frame_time = self._fixed_frame_time
+        self.dt = self.frame_time * self._coef_frame_time
 
     def tick(self) -> None:
         """Ограничивает FPS."""
-        self.frame_time = self._clock.tick(self.framerate)
+        frame_time = self._clock.tick(self.framerate)
+        self.raw_frame_time = self._clock.get_rawtime()
+        if self.is_fixed_timestep:
+            self._tick_fixed_timestep(frame_time)
+            return
+        self.frame_time = frame_time
         self.dt = self.frame_time * self._coef_frame_time
 
     def get_fps(self) -> float:
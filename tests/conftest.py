@@ -0,0 +1,94 @@
+import os
+import shutil
+from itertools import count
+from pathlib import Path
+from typing import Callable
+
+# Settings создаёт файлы настроек в resources при импорте движка, каталог удаляется после тестов,
+# если его не было до них.
+RESOURCES_PATH = Path(__file__).parent.parent / 'resources'
+IS_RESOURCES_CREATED = not RESOURCES_PATH.exists()
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+import pytest
+import screeninfo
+
+screeninfo.get_monitors = lambda: [screeninfo.Monitor(x=0, y=0, width=1920, height=1080)]
+pygame.display.init()
+pygame.display.set_mode((1920, 1080))
+
+from engine.animations import Animation, EventsAnimation, EventsAnimationGroup  # noqa: E402
+from engine.collision import CollisionCache, StaticCollisionLayer  # noqa: E402
+from engine.constants.path import BasePathEnum  # noqa: E402
+from engine.events.constants import DEFAULT_EVENT  # noqa: E402
+from engine.objects import Object  # noqa: E402
+from engine.objects.groups import DynamicObjectsGroup, SolidObjectsGroup, TriggerGroup  # noqa: E402
+from engine.time import GlobalClock  # noqa: E402
+
+_names = count()
+
+
+def pytest_sessionfinish() -> None:
+    """Удаляет созданный при импорте движка каталог resources."""
+    if IS_RESOURCES_CREATED:
+        shutil.rmtree(RESOURCES_PATH, ignore_errors=True)
+
+
+@pytest.fixture
+def animation(tmp_path, monkeypatch) -> Callable[..., str]:
+    """Отдаёт фабрику временных анимаций из одного кадра в каталоге анимаций внутри tmp_path."""
+    monkeypatch.setattr(BasePathEnum.ANIMATIONS_PATH, '_value_', tmp_path)
+
+    def create(size: tuple[int, int], color: tuple[int, int, int, int] = (255, 0, 0, 255)) -> str:
+        name = f'test_{next(_names)}'
+        path = BasePathEnum.ANIMATIONS_PATH.value / name
+        path.mkdir()
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        surface.fill(color)
+        pygame.image.save(surface, str(path / '0.png'))
+        return name
+
+    return create
+
+
+@pytest.fixture
+def create_object(animation: Callable[..., str]) -> Callable[..., Object]:
+    """Отдаёт фабрику игровых объектов с прямоугольной анимацией."""
+
+    def create(base: type[Object], size: tuple[int, int], topleft: tuple[float, float], **attributes) -> Object:
+        attributes['events_animation_group'] = EventsAnimationGroup(
+            EventsAnimation(DEFAULT_EVENT, Animation(animation(size), is_loop=True))
+        )
+        obj = type(base.__name__, (base,), attributes)()
+        obj.update()
+        obj.rect.topleft = topleft
+        SolidObjectsGroup().rebucket()
+        return obj
+
+    return create
+
+
+@pytest.fixture(autouse=True)
+def clean_groups() -> None:
+    """Очищает группы объектов и кэши после теста."""
+    yield
+    for group in (SolidObjectsGroup(), DynamicObjectsGroup(), TriggerGroup()):
+        group.empty()
+    StaticCollisionLayer().__init__()
+    CollisionCache().clear()
+
+
+@pytest.fixture
+def dt() -> Callable[[float], None]:
+    """Отдаёт функцию установки времени шага глобальных часов."""
+    global_clock = GlobalClock()
+    previous = global_clock.dt
+
+    def set_dt(value: float) -> None:
+        global_clock.dt = value
+
+    yield set_dt
+    global_clock.dt = previous
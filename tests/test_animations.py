@@ -0,0 +1,28 @@
+from pygame import Surface, SRCALPHA, image
+
+from engine.animations.constants import Flip
+from engine.animations.frames import Frame
+from engine.constants import Scale
+from engine.constants.direction import DirectionGroupEnum
+from engine.constants.path import BasePathEnum
+
+
+def test_flipped_variants_are_precomputed(animation):
+    path = BasePathEnum.ANIMATIONS_PATH.value / animation((4, 2)) / '0.png'
+    surface = Surface((4, 2), SRCALPHA)
+    surface.fill((255, 0, 0, 255), (0, 0, 1, 1))
+    image.save(surface, str(path))
+    frame = Frame(str(path), Flip(direction=True), Scale(), Scale()).after_init()
+    assert frame.images[DirectionGroupEnum.RIGHT] is frame.images[None]
+    assert frame.images[DirectionGroupEnum.LEFT].get_at((3, 0)).a == 255
+    assert frame.images[DirectionGroupEnum.DOWN].get_at((0, 1)).a == 255
+    assert frame.masks[DirectionGroupEnum.LEFT].get_at((3, 0))
+    assert not frame.masks[DirectionGroupEnum.LEFT].get_at((0, 0))
+    other = Frame(str(path), Flip(direction=True), Scale(), Scale()).after_init()
+    assert other.images[DirectionGroupEnum.LEFT] is frame.images[DirectionGroupEnum.LEFT]
+
+
+def test_unflipped_frame_shares_one_image(animation):
+    path = BasePathEnum.ANIMATIONS_PATH.value / animation((4, 2)) / '0.png'
+    frame = Frame(str(path), Flip(), Scale(), Scale()).after_init()
+    assert {id(surface) for surface in frame.images.values()} == {id(frame.images[None])}
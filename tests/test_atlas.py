@@ -0,0 +1,59 @@
+import pytest
+from pygame import Surface, SRCALPHA
+
+from engine.animations import Animation
+from engine.animations.frames import Frame
+from engine.cache import Cache, TextureAtlas
+from engine.metaclasses.singleton import SingletonMeta
+
+PAGE_SIZE = 64
+
+
+@pytest.fixture
+def atlas(monkeypatch):
+    """Отдаёт отдельный включённый атлас текстур с отдельным кэшем."""
+    previous = {cls: SingletonMeta._instances.pop(cls, None) for cls in (TextureAtlas, Cache)}
+    monkeypatch.setattr(TextureAtlas, 'is_enabled', True)
+    monkeypatch.setattr(TextureAtlas, '_page_size', PAGE_SIZE)
+    monkeypatch.setattr(TextureAtlas, '_cache', Cache())
+    atlas = TextureAtlas()
+    monkeypatch.setattr(Animation, '_atlas', atlas)
+    monkeypatch.setattr(Frame, '_atlas', atlas)
+    yield atlas
+    for cls, instance in previous.items():
+        SingletonMeta._instances.pop(cls, None)
+        if instance is not None:
+            SingletonMeta._instances[cls] = instance
+
+
+def test_pages_are_counted_in_cache_budget(atlas):
+    atlas.add(('a',), Surface((16, 16), SRCALPHA))
+    atlas.add(('b',), Surface((16, 16), SRCALPHA))
+    page = atlas.pages[0]
+    assert len(atlas.pages) == 1
+    assert atlas._cache.size == page.get_pitch() * page.get_height()
+    atlas.add(('big',), big := Surface((PAGE_SIZE + 1, PAGE_SIZE), SRCALPHA))
+    assert atlas._cache.size == page.get_pitch() * page.get_height() + big.get_pitch() * big.get_height()
+    atlas._cache.clear()
+    assert len(atlas._cache) == 2
+    atlas.clear()
+    assert atlas._cache.size == 0
+    assert not len(atlas._cache)
+
+
+def test_animation_is_packed_on_load(atlas, animation, monkeypatch):
+    name = animation((8, 8))
+    Animation(name)
+    assert not len(atlas)
+    monkeypatch.setattr(TextureAtlas, 'is_preloaded', True)
+    Animation(name)
+    assert len(atlas)
+    assert atlas.pages
+
+
+def test_pack_directory(atlas, animation):
+    name = animation((8, 8))
+    assert Animation.pack_directory(name) == 1
+    assert len(atlas)
+    region = next(iter(atlas._regions.values()))
+    assert region.get_parent() is atlas.pages[0]
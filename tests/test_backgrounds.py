@@ -0,0 +1,38 @@
+from math import floor
+
+import pytest
+from pygame import Surface
+from pygame.sprite import Sprite
+
+from engine.constants import Coordinate
+from engine.map import VisibleMap
+from engine.objects.backgrounds import BackgroundsGroup
+from engine.objects.backgrounds.constants import CoefShiftRate
+
+
+@pytest.fixture
+def layer():
+    """Отдаёт слой заднего плана 10x1 с разным цветом каждого пикселя."""
+    sprite = Sprite()
+    sprite.image = Surface((10, 1))
+    for x in range(10):
+        sprite.image.set_at((x, 0), (x * 20, 0, 0))
+    sprite.rect = sprite.image.get_frect()
+    sprite.coef_shift_rate = CoefShiftRate(0.5, 1)
+    visible_map = VisibleMap()
+    previous = visible_map.offset
+    BackgroundsGroup().add(sprite)
+    yield sprite
+    sprite.kill()
+    visible_map.offset = previous
+
+
+@pytest.mark.parametrize('offset_x', (0, -6, 7, -33))
+def test_layer_wraps_around_the_surface(layer, offset_x):
+    VisibleMap().offset = Coordinate(offset_x, 0)
+    surface = Surface((25, 1))
+    BackgroundsGroup().draw(surface)
+    shift = floor(offset_x * layer.coef_shift_rate.x)
+    assert [surface.get_at((x, 0)) for x in range(25)] == [
+        layer.image.get_at(((x - shift) % 10, 0)) for x in range(25)
+    ]
@@ -0,0 +1,57 @@
+import pytest
+from pygame import Surface
+
+from engine.animations.constants import Flip
+from engine.animations.frames import Frame
+from engine.cache import Cache
+from engine.constants import Scale
+from engine.constants.path import BasePathEnum
+from engine.metaclasses.singleton import SingletonMeta
+from engine.settings.schemas import EngineSettingsSchema
+
+SURFACE_SIZE = (16, 16)
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    """Отдаёт отдельный кэш с бюджетом на два изображения."""
+    previous = SingletonMeta._instances.pop(Cache, None)
+    monkeypatch.setattr(Cache, '_budget', Surface(SURFACE_SIZE).get_pitch() * SURFACE_SIZE[1] * 2)
+    yield Cache()
+    SingletonMeta._instances.pop(Cache, None)
+    if previous is not None:
+        SingletonMeta._instances[Cache] = previous
+
+
+def test_budget_is_unlimited_by_default():
+    assert EngineSettingsSchema().cache_budget == 0
+
+
+def test_least_recently_used_is_evicted(cache):
+    for key in ('a', 'b'):
+        cache.get((key,), Surface, SURFACE_SIZE)
+    cache.get(('a',), Surface, SURFACE_SIZE)
+    cache.get(('c',), Surface, SURFACE_SIZE)
+    assert list(cache._cache) == [('a',), ('c',)]
+    assert cache.size <= cache._budget
+
+
+def test_pinned_key_is_not_evicted(cache):
+    cache.get(('a',), Surface, SURFACE_SIZE)
+    cache.pin(('a',))
+    for key in ('b', 'c', 'd'):
+        cache.get((key,), Surface, SURFACE_SIZE)
+    assert ('a',) in cache._cache
+    cache.unpin(('a',))
+    cache.get(('e',), Surface, SURFACE_SIZE)
+    assert ('a',) not in cache._cache
+
+
+def test_surface_held_by_frame_is_not_evicted(cache, monkeypatch, animation):
+    monkeypatch.setattr(Frame, '_cache', cache)
+    path_image = str(BasePathEnum.ANIMATIONS_PATH.value / animation(SURFACE_SIZE) / '0.png')
+    frame = Frame(path_image, Flip(), Scale(), Scale()).after_init()
+    for key in ('a', 'b', 'c'):
+        cache.get((key,), Surface, SURFACE_SIZE)
+    assert (path_image,) not in cache._cache
+    assert Frame(path_image, Flip(), Scale(), Scale()).after_init().image is frame.image
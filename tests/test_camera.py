@@ -0,0 +1,85 @@
+import pytest
+from pygame import mouse
+
+from engine.camera import Camera
+from engine.constants import Coordinate
+from engine.map import VisibleMap
+from engine.metaclasses.singleton import SingletonMeta
+from engine.objects import SolidObject
+from engine.objects.backgrounds import BackgroundsGroup
+from engine.objects.groups import BaseGroup, SolidObjectsGroup
+from engine.render import Presenter
+from engine.tile_grid import TileGrid
+
+
+@pytest.fixture(autouse=True)
+def offset():
+    """Восстанавливает смещение видимой части карты и камеру после теста."""
+    visible_map = VisibleMap()
+    previous = visible_map.offset
+    yield
+    visible_map.offset = previous
+    visible_map.groups_shift = None
+    SingletonMeta._instances.pop(Camera, None)
+
+
+def test_camera_keeps_groups_shift(create_object):
+    hero = create_object(SolidObject, (32, 32), (0, 0))
+    camera = Camera(hero, (SolidObjectsGroup(),))
+    assert camera.obj is hero
+    assert VisibleMap().groups_shift == (SolidObjectsGroup(),)
+
+
+def test_hud_group_stays_put_when_camera_moves(create_object, monkeypatch):
+    class HudGroup(BaseGroup):
+        pass
+
+    class Hud(SolidObject):
+        groups = (HudGroup(),)
+
+    hero = create_object(SolidObject, (32, 32), (100, 100))
+    hud = create_object(Hud, (16, 16), (10, 10))
+    Camera(hero, (SolidObjectsGroup(),))
+    try:
+        visible_map = VisibleMap()
+        visible_map.offset = Coordinate(0, 0)
+        hud_before = HudGroup()._get_blit_coordinate(hud, 1)
+        hero_before = SolidObjectsGroup()._get_blit_coordinate(hero, 1)
+        visible_map.offset = Coordinate(-50, -30)
+        assert HudGroup()._get_blit_coordinate(hud, 1) == hud_before
+        assert SolidObjectsGroup()._get_blit_coordinate(hero, 1) == (hero_before[0] - 50, hero_before[1] - 30)
+
+        monkeypatch.setattr(mouse, 'get_pos', lambda: (12, 12))
+        monkeypatch.setattr(Presenter(), 'to_visible_map', lambda pos: Coordinate(*pos))
+        assert hud.status.collision_mos
+    finally:
+        SingletonMeta._instances.pop(HudGroup, None)
+
+
+def test_screen_space_group_ignores_offset(create_object):
+    class InterfaceGroup(BaseGroup):
+        is_screen_space = True
+
+    class Button(SolidObject):
+        groups = (InterfaceGroup(),)
+
+    button = create_object(Button, (16, 16), (10, 10))
+    try:
+        visible_map = VisibleMap()
+        visible_map.offset = Coordinate(0, 0)
+        before = InterfaceGroup()._get_blit_coordinate(button, 1)
+        visible_map.offset = Coordinate(40, 40)
+        assert InterfaceGroup()._get_blit_coordinate(button, 1) == before
+    finally:
+        SingletonMeta._instances.pop(InterfaceGroup, None)
+
+
+def test_old_camera_moves_shift_offset_once(create_object):
+    block = create_object(SolidObject, (32, 32), (10, 20))
+    VisibleMap().offset = Coordinate(0, 0)
+    with pytest.deprecated_call():
+        TileGrid().move(Coordinate(5, -5))
+        SolidObjectsGroup().move(Coordinate(5, -5))
+        BackgroundsGroup().move(Coordinate(5, -5))
+    assert VisibleMap().offset == Coordinate(5, -5)
+    assert block.rect.topleft == (10, 20)
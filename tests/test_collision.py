@@ -0,0 +1,166 @@
+import pytest
+from pygame import FRect, Mask
+
+from engine.collision import CollisionCache
+from engine.constants import Coordinate
+from engine.constants.direction import DirectionGroupEnum
+from engine.objects import DynamicObject, SolidObject, Speed, TriggerObject
+from engine.objects.constants import ALL_COLLISION_CATEGORIES
+from engine.objects.groups import DynamicObjectsGroup, SolidObjectsGroup, TriggerGroup
+from engine.physics.actions import MovementAction
+from engine.physics.platformer.actions import WalkRightAction
+
+
+def test_moved_solid_is_rebucketed_in_the_same_step(monkeypatch, create_object, dt):
+    dt(1)
+    monkeypatch.setattr(MovementAction, '_integrator', None)
+    platform = create_object(
+        DynamicObject,
+        (32, 32),
+        (0, 0),
+        speed=Speed(walk=200),
+        groups=(DynamicObjectsGroup(), SolidObjectsGroup()),
+    )
+    probe = create_object(DynamicObject, (32, 32), (200, 0))
+    assert not SolidObjectsGroup().collide_rect_with_mask(probe)
+    WalkRightAction(obj=platform).after_init().perform()
+    assert platform.rect.x == 200
+    assert SolidObjectsGroup().collide_rect_with_mask(probe)[0] is platform
+
+
+def test_object_does_not_collide_with_itself(create_object):
+    block = create_object(SolidObject, (32, 32), (0, 0))
+    assert not SolidObjectsGroup().collide_rect_with_mask(block)
+
+
+def test_moved_static_solid_is_rebaked(create_object):
+    block = create_object(SolidObject, (32, 32), (0, 0), is_static=True)
+    SolidObjectsGroup().bake_static()
+    probe = create_object(DynamicObject, (32, 32), (200, 0))
+    block.rect.x = 200
+    assert not SolidObjectsGroup().collide_rect_with_mask(probe)
+    SolidObjectsGroup().rebucket_sprite(block)
+    assert SolidObjectsGroup().collide_rect_with_mask(probe)[0] is block
+
+
+def test_static_layer_agrees_with_hash_at_subpixel_offset(create_object):
+    wall = create_object(SolidObject, (4, 4), (12, 0), is_static=True)
+    body = create_object(DynamicObject, (4, 4), (8.5, 0))
+    assert SolidObjectsGroup().collide_rect_with_mask(body)[0] is wall
+    CollisionCache().clear()
+    SolidObjectsGroup().bake_static()
+    assert SolidObjectsGroup().collide_rect_with_mask(body)[0] is wall
+
+
+def test_collision_cache_key_includes_candidate_mask(monkeypatch, create_object):
+    monkeypatch.setattr(CollisionCache, 'is_enabled', True)
+    block = create_object(SolidObject, (32, 32), (0, 0))
+    probe = create_object(DynamicObject, (32, 32), (0, 0))
+    assert SolidObjectsGroup().collide_mask(probe)
+    block.mask = Mask((32, 32))
+    assert not SolidObjectsGroup().collide_mask(probe)
+
+
+def test_manifold_side_follows_movement(create_object):
+    create_object(SolidObject, (64, 64), (100, 0))
+    hero = create_object(DynamicObject, (32, 32), (60, 54))
+    DynamicObjectsGroup().save_previous_coordinates()
+    hero.rect.x += 28
+    manifold = SolidObjectsGroup().collide_mask_manifold(hero)
+    assert manifold.side == DirectionGroupEnum.RIGHT
+    assert manifold.depth == Coordinate(20, 0)
+
+
+def test_manifold_depth_is_measured_along_normal(create_object):
+    create_object(SolidObject, (64, 4), (0, 300))
+    hero = create_object(DynamicObject, (32, 32), (0, 250))
+    DynamicObjectsGroup().save_previous_coordinates()
+    hero.rect.y += 28
+    manifold = SolidObjectsGroup().collide_mask_manifold(hero)
+    assert manifold.side == DirectionGroupEnum.DOWN
+    assert manifold.depth == Coordinate(0, 10)
+
+
+def test_penetration_is_resolved_to_contact(create_object, monkeypatch):
+    create_object(SolidObject, (64, 4), (0, 300))
+    hero = create_object(DynamicObject, (32, 32), (0, 250))
+    DynamicObjectsGroup().save_previous_coordinates()
+    hero.rect.y += 28
+    manifold = SolidObjectsGroup().collide_mask_manifold(hero)
+    shifts = []
+    collide_mask_with_shift = hero._collide_mask_with_shift
+    monkeypatch.setattr(
+        hero,
+        '_collide_mask_with_shift',
+        lambda obj, shift: shifts.append(shift) or collide_mask_with_shift(obj, shift),
+    )
+    resolution = hero.resolve_penetration(manifold, (0, 1))
+    assert resolution.depth == 9
+    assert resolution.coordinate == Coordinate(0, 269)
+    assert len(shifts) < resolution.depth
+    hero.rect.topleft = resolution.coordinate
+    assert SolidObjectsGroup().collide_mask(hero)
+    hero.rect.y -= 1
+    assert not SolidObjectsGroup().collide_mask(hero)
+
+
+@pytest.mark.parametrize('is_static', (False, True))
+def test_collision_categories_filter_queries(create_object, is_static):
+    create_object(SolidObject, (32, 32), (0, 0), collision_category=2, is_static=is_static)
+    SolidObjectsGroup().bake_static()
+    hero = create_object(DynamicObject, (32, 32), (10, 0), collision_mask=ALL_COLLISION_CATEGORIES & ~2)
+    assert not SolidObjectsGroup().collide_mask(hero)
+    move, sprite = SolidObjectsGroup().sweep(FRect(100, 0, 32, 32), hero.mask, Coordinate(-100, 0), hero)
+    assert (move, sprite) == (Coordinate(-100, 0), None)
+    hero.collision_mask = ALL_COLLISION_CATEGORIES
+    assert SolidObjectsGroup().collide_mask(hero)
+
+
+def test_raycast_hits_first_solid(create_object):
+    far = create_object(SolidObject, (32, 32), (200, 0))
+    near = create_object(SolidObject, (32, 32), (100, 0))
+    hit = SolidObjectsGroup().raycast(Coordinate(0, 16), Coordinate(1, 0), 300)
+    assert hit.obj is near
+    assert hit.distance == pytest.approx(100, abs=1)
+    assert not SolidObjectsGroup().raycast(Coordinate(0, 16), Coordinate(1, 0), 50)
+    hero = create_object(DynamicObject, (8, 8), (0, 100), collision_mask=ALL_COLLISION_CATEGORIES & ~2)
+    near.collision_category = 2
+    assert SolidObjectsGroup().raycast(Coordinate(0, 16), Coordinate(1, 0), 300, hero).obj is far
+
+
+def test_shapecast_stops_in_contact(create_object):
+    create_object(SolidObject, (64, 4), (0, 300))
+    hit = SolidObjectsGroup().shapecast(FRect(0, 200, 32, 32), Coordinate(0, 200))
+    assert hit.coordinate == Coordinate(0, 268)
+    assert hit.distance == 68
+
+
+def test_trigger_reports_enter_stay_and_exit(create_object):
+    trigger = create_object(TriggerObject, (32, 32), (0, 0))
+    hero = create_object(DynamicObject, (16, 16), (100, 0))
+    group = TriggerGroup()
+    group.update_triggers()
+    assert not group.get_overlaps(trigger)
+    hero.rect.x = 10
+    group.update_triggers()
+    assert group.get_entered(trigger) == [hero]
+    assert group.get_entered(hero) == [trigger]
+    assert (hero.status.trigger_enter, hero.status.trigger_stay) == (True, False)
+    group.update_triggers()
+    assert not group.get_entered(trigger)
+    assert (trigger.status.trigger_enter, trigger.status.trigger_stay) == (False, True)
+    hero.rect.x = 100
+    group.update_triggers()
+    assert group.get_exited(trigger) == [hero]
+    assert (hero.status.trigger_exit, hero.status.trigger_stay) == (True, False)
+
+
+def test_removed_object_exits_trigger(create_object):
+    trigger = create_object(TriggerObject, (32, 32), (0, 0))
+    hero = create_object(DynamicObject, (16, 16), (10, 0))
+    group = TriggerGroup()
+    group.update_triggers()
+    hero.kill()
+    group.update_triggers()
+    assert group.get_exited(trigger) == [hero]
+    assert trigger.status.trigger_exit
@@ -0,0 +1,71 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from engine.objects import DynamicObject, SolidObject, Speed
+from engine.objects.groups import SolidObjectsGroup
+from engine.objects.integrator import BatchIntegrator
+from engine.physics.actions import MovementAction
+from engine.physics.platformer.actions import FallAction, WalkRightAction
+
+
+@pytest.fixture
+def integrator(monkeypatch, dt):
+    dt(1)
+    integrator = BatchIntegrator()
+    monkeypatch.setattr(MovementAction, '_integrator', integrator)
+    return integrator
+
+
+def test_speed_change_is_read_every_step(integrator, create_object):
+    hero = create_object(DynamicObject, (32, 32), (0, 0), speed=Speed(walk=10))
+    WalkRightAction(obj=hero).after_init().perform()
+    integrator.step(1, SolidObjectsGroup())
+    hero.speed.walk = 30
+    integrator.step(1, SolidObjectsGroup())
+    assert hero.rect.x == 40
+
+
+def test_broad_phase_skips_mask_checks_away_from_solids(monkeypatch, integrator, create_object):
+    create_object(SolidObject, (64, 4), (0, 300), is_static=True)
+    SolidObjectsGroup().bake_static()
+    far = create_object(DynamicObject, (32, 32), (1000, 0), speed=Speed(fall=50))
+    near = create_object(DynamicObject, (32, 32), (0, 250), speed=Speed(fall=50))
+    checked = []
+    collide_rect_with_mask = SolidObjectsGroup.collide_rect_with_mask
+
+    def spy(group, obj, *args):
+        checked.append(obj)
+        return collide_rect_with_mask(group, obj, *args)
+
+    monkeypatch.setattr(SolidObjectsGroup, 'collide_rect_with_mask', spy)
+    for obj in (far, near):
+        FallAction(obj=obj).after_init().perform()
+    integrator.step(1, SolidObjectsGroup())
+    assert checked == [near]
+    assert far.rect.y == 50
+    assert near.rect.bottom == 300
+
+
+def test_broad_phase_skips_solids_touching_the_path(monkeypatch, integrator, create_object):
+    create_object(SolidObject, (640, 32), (0, 300), is_static=True)
+    SolidObjectsGroup().bake_static()
+    hero = create_object(DynamicObject, (32, 32), (0, 268), speed=Speed(walk=10))
+    checked = []
+    monkeypatch.setattr(SolidObjectsGroup, 'collide_rect_with_mask', lambda group, obj, *args: checked.append(obj))
+    WalkRightAction(obj=hero).after_init().perform()
+    integrator.step(1, SolidObjectsGroup())
+    assert not checked
+    assert hero.rect.topleft == (10, 268)
+
+
+def test_groups_import_numpy_lazily():
+    code = (
+        'import sys, screeninfo\n'
+        'screeninfo.get_monitors = lambda: [screeninfo.Monitor(x=0, y=0, width=1920, height=1080)]\n'
+        'import engine.objects.groups, engine.collision.static_layer, engine.physics.actions\n'
+        'sys.exit("numpy" in sys.modules)\n'
+    )
+    assert not subprocess.run([sys.executable, '-c', code], env=os.environ).returncode
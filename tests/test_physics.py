@@ -0,0 +1,113 @@
+import pytest
+from pygame import FRect, Mask
+
+from engine.constants import Coordinate
+
+from engine.events import Pressed
+from engine.objects import DynamicObject, SolidObject, Speed
+from engine.objects.groups import DynamicObjectsGroup, SolidObjectsGroup
+from engine.objects.integrator import BatchIntegrator
+from engine.physics import PlatformerPhysics
+from engine.physics.actions import MovementAction
+
+PLATFORM_TOP = 300
+
+
+@pytest.fixture
+def hero(create_object, dt):
+    """Отдаёт объект, падающий со скоростью 50 на тонкую платформу."""
+    dt(1)
+    create_object(SolidObject, (64, 4), (0, PLATFORM_TOP))
+    return create_object(
+        DynamicObject,
+        (32, 48),
+        (0, PLATFORM_TOP - 48 - 60),
+        speed=Speed(fall=50),
+        physics_events_action_group=PlatformerPhysics.physics_events_action_group,
+    )
+
+
+def fall(hero: DynamicObject, steps: int = 5) -> None:
+    for _ in range(steps):
+        hero.events(Pressed())
+
+
+@pytest.mark.parametrize('is_swept', (False, True))
+def test_fall_lands_on_surface(monkeypatch, hero, is_swept):
+    monkeypatch.setattr(MovementAction, '_is_swept', is_swept)
+    monkeypatch.setattr(MovementAction, '_integrator', None)
+    fall(hero)
+    assert hero.rect.bottom == PLATFORM_TOP
+    assert not hero.status.fall
+
+
+@pytest.mark.parametrize('is_swept', (False, True))
+def test_batched_fall_lands_on_surface(monkeypatch, hero, is_swept):
+    integrator = BatchIntegrator()
+    monkeypatch.setattr(MovementAction, '_integrator', integrator)
+    for _ in range(5):
+        hero.events(Pressed())
+        integrator.step(1, SolidObjectsGroup(), is_swept)
+    assert hero.rect.bottom == PLATFORM_TOP
+    assert not hero.status.fall
+
+
+def test_sweep_stops_in_contact(create_object):
+    create_object(SolidObject, (64, 4), (0, PLATFORM_TOP))
+    rect = FRect(0, 0, 32, 48)
+    move, sprite = SolidObjectsGroup().sweep(rect, Mask(rect.size, fill=True), Coordinate(0, 500))
+    assert sprite is not None
+    assert rect.bottom + move.y == PLATFORM_TOP
+
+
+@pytest.fixture
+def sleeper(monkeypatch, create_object):
+    """Отдаёт спящий динамический объект, стоящий на платформе."""
+    monkeypatch.setattr(DynamicObjectsGroup, '_sleeping_mode', True)
+    create_object(SolidObject, (64, 4), (0, PLATFORM_TOP))
+    sleeper = create_object(
+        DynamicObject,
+        (32, 48),
+        (0, PLATFORM_TOP - 48),
+        groups=(DynamicObjectsGroup(), SolidObjectsGroup()),
+    )
+    SolidObjectsGroup().rebucket()
+    sleeper.is_sleeping = True
+    return sleeper
+
+
+def test_added_solid_wakes_up_neighbour(sleeper, create_object):
+    block = create_object(SolidObject, (32, 32), (1000, 0))
+    assert sleeper.is_sleeping
+    block.kill()
+    block.rect.topleft = (40, PLATFORM_TOP - 32)
+    SolidObjectsGroup().add(block)
+    assert not sleeper.is_sleeping
+
+
+def test_moved_solid_wakes_up_neighbour(sleeper, create_object):
+    block = create_object(SolidObject, (32, 32), (1000, 0))
+    sleeper.is_sleeping = True
+    block.rect.topleft = (40, PLATFORM_TOP - 32)
+    SolidObjectsGroup().rebucket()
+    assert not sleeper.is_sleeping
+
+
+def test_contact_wakes_up_sleeper(sleeper, create_object):
+    box = create_object(DynamicObject, (32, 32), (0, 0))
+    move, sprite = SolidObjectsGroup().sweep(box.rect, box.rect_mask, Coordinate(0, 500), box)
+    assert sprite is sleeper
+    assert not sleeper.is_sleeping
+
+
+def test_wake_up_queries_only_nearby_sleepers(sleeper, create_object):
+    far = create_object(DynamicObject, (32, 32), (5000, 0))
+    awake = create_object(DynamicObject, (32, 32), (40, PLATFORM_TOP - 32))
+    far.is_sleeping = True
+    group = DynamicObjectsGroup()
+    assert len(group._spatial_hash) == 2
+    assert awake not in group._spatial_hash
+    group.wake_up(FRect(40, PLATFORM_TOP - 32, 32, 32))
+    assert not sleeper.is_sleeping
+    assert far.is_sleeping
+    assert group._spatial_hash.query(far.rect) == [far]
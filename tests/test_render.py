@@ -0,0 +1,331 @@
+from random import Random
+from types import SimpleNamespace
+
+import pytest
+from pygame import FRect, Rect, Surface, SRCALPHA, WINDOWSIZECHANGED, display, error, event, image
+
+from engine.constants import Coordinate, Size
+from engine.engine import Engine
+from engine.map import VisibleMap
+from engine.metaclasses.singleton import SingletonMeta
+from engine.objects import SolidObject
+from engine.objects.groups import BaseGroup
+from engine.render import (
+    DynamicResolution,
+    Presenter,
+    RenderQueue,
+    StaticRenderChunk,
+    StaticRenderLayer,
+    StripRenderer,
+    TextureRenderer,
+)
+from engine.render.constants import DIRTY_RECTS_MAX_COUNT, FRAME_TIMES_WINDOW
+from engine.settings.constants import ScaleModeEnum
+
+
+class DrawGroup(BaseGroup):
+    """Группа вывода с отсечением."""
+
+
+@pytest.fixture
+def draw_group(monkeypatch):
+    """Отдаёт отдельную группу вывода с индексом отсечения."""
+    monkeypatch.setattr(BaseGroup, '_culling_mode', True)
+    visible_map = VisibleMap()
+    previous, visible_map.offset = visible_map.offset, Coordinate(0, 0)
+    yield DrawGroup()
+    visible_map.offset = previous
+    SingletonMeta._instances.pop(DrawGroup, None)
+
+
+@pytest.fixture
+def half_scale():
+    """Отдаёт динамическое разрешение с масштабом 0.5."""
+    dynamic_resolution = DynamicResolution()
+    dynamic_resolution._set_scale(0.5)
+    yield dynamic_resolution
+    dynamic_resolution._set_scale(1)
+
+
+@pytest.fixture
+def texture_renderer():
+    """Отдаёт отдельный вывод через SDL2 Renderer с окном размером с видимую часть карты."""
+    previous = SingletonMeta._instances.pop(TextureRenderer, None)
+    texture_renderer = TextureRenderer()
+    assert texture_renderer.create('test', VisibleMap().get_size(), False)
+    yield texture_renderer
+    texture_renderer.window.destroy()
+    SingletonMeta._instances.pop(TextureRenderer, None)
+    if previous is not None:
+        SingletonMeta._instances[TextureRenderer] = previous
+
+
+@pytest.fixture
+def presenter():
+    """Отдаёт отдельный вывод на дисплей с разрешением дисплея."""
+    previous = SingletonMeta._instances.pop(Presenter, None)
+    presenter = Presenter()
+    presenter._resolution = display.get_surface().get_size()
+    yield presenter
+    SingletonMeta._instances.pop(Presenter, None)
+    if previous is not None:
+        SingletonMeta._instances[Presenter] = previous
+
+
+def merge(*rects: Rect) -> list[Rect]:
+    """Объединяет области перерисовки на видимой части карты 100x100."""
+    return Engine._merge_dirty_rects(SimpleNamespace(visible_map=Surface((100, 100))), list(rects))
+
+
+def test_overlapping_dirty_rects_are_merged():
+    assert merge(Rect(0, 0, 10, 10), Rect(20, 20, 5, 5), Rect(5, 5, 20, 20)) == [Rect(0, 0, 25, 25)]
+    assert merge(Rect(0, 0, 10, 10), Rect(50, 50, 5, 5)) == [Rect(0, 0, 10, 10), Rect(50, 50, 5, 5)]
+
+
+def test_dirty_rects_fall_back_to_full_redraw():
+    assert merge(Rect(0, 0, 80, 80)) == [Rect(0, 0, 100, 100)]
+    rects = [Rect(index * 3 % 99, index * 3 // 99 * 3, 1, 1) for index in range(DIRTY_RECTS_MAX_COUNT + 1)]
+    assert merge(*rects) == [Rect(0, 0, 100, 100)]
+
+
+def test_draw_area_queries_index_by_area(draw_group, create_object, monkeypatch):
+    near = create_object(SolidObject, (10, 10), (0, 0))
+    far = create_object(SolidObject, (10, 10), (500, 0))
+    draw_group.add(near, far)
+    queries = []
+    query = draw_group._draw_index.query
+    monkeypatch.setattr(draw_group._draw_index, 'query', lambda rect: queries.append(rect) or query(rect))
+    assert draw_group._get_draw_sprites(Surface((1000, 100)), FRect(0, 0, 20, 20)) == [near]
+    assert queries and all(rect.right < 500 for rect in queries)
+
+
+def test_coordinates_are_converted_with_scale():
+    visible_map = VisibleMap()
+    previous, visible_map.offset = visible_map.offset, Coordinate(10, -20)
+    assert visible_map.to_screen((30, 40), 0.5) == Coordinate(20, 10)
+    assert visible_map.to_world((20, 10), 0.5) == Coordinate(30, 40)
+    assert visible_map.to_world(visible_map.to_screen((30, 40))) == Coordinate(30, 40)
+    visible_map.offset = previous
+
+
+def test_culling_and_blits_use_scale(draw_group, create_object, half_scale):
+    width = VisibleMap().get_width()
+    edge = create_object(SolidObject, (10, 10), (width - 20, 0))
+    outside = create_object(SolidObject, (10, 10), (width + 20, 0))
+    draw_group.add(edge, outside)
+    surface = half_scale.surface
+    assert surface.get_width() == width // 2
+    sprites = draw_group._get_draw_sprites(surface)
+    assert sprites == [edge]
+    assert [coordinate for _, coordinate in draw_group._get_blits(surface, sprites)] == [((width - 20) / 2, 0)]
+
+
+def test_mouse_picking_with_scale(create_object, half_scale, monkeypatch):
+    visible_map = VisibleMap()
+    previous, visible_map.offset = visible_map.offset, Coordinate(-50, 0)
+    obj = create_object(SolidObject, (10, 10), (100, 100))
+    monkeypatch.setattr(Presenter, 'to_visible_map', lambda self, coordinate: Coordinate(*coordinate))
+    monkeypatch.setattr('engine.objects.dataclasses.mouse.get_pos', lambda: (55, 105))
+    assert obj.status.collision_mos
+    monkeypatch.setattr('engine.objects.dataclasses.mouse.get_pos', lambda: (105, 105))
+    assert not obj.status.collision_mos
+    visible_map.offset = previous
+
+
+def test_strip_blits_match_serial_blits(monkeypatch):
+    monkeypatch.setattr('engine.render.strips.STRIP_MIN_BLITS', 1)
+    random = Random(0)
+    images = []
+    for size in ((8, 8), (32, 32), (50, 120)):
+        surface = Surface(size, SRCALPHA)
+        surface.fill((random.randrange(256), random.randrange(256), random.randrange(256), 128))
+        images.append(surface)
+    blits = [(random.choice(images), (random.randrange(-60, 320), random.randrange(-130, 200))) for _ in range(200)]
+    serial, strips = Surface((320, 200)), Surface((320, 200))
+    serial.blits(blits, doreturn=False)
+    StripRenderer().blits(strips, blits)
+    assert image.tobytes(strips, 'RGB') == image.tobytes(serial, 'RGB')
+
+
+def test_invalidated_surface_is_uploaded_again(texture_renderer):
+    surface = Surface((4, 4))
+    region = surface.subsurface((0, 0, 2, 2))
+    surface.fill((255, 0, 0))
+    texture_renderer.blit(surface, (0, 0))
+    texture_renderer.blit(region, (10, 0))
+    surface.fill((0, 0, 255))
+    texture_renderer.blit(surface, (0, 0))
+    assert texture_renderer.renderer.to_surface().get_at((0, 0))[:3] == (255, 0, 0)
+    texture_renderer.invalidate(surface)
+    texture_renderer.blit(surface, (0, 0))
+    texture_renderer.blit(region, (10, 0))
+    pixels = texture_renderer.renderer.to_surface()
+    assert pixels.get_at((0, 0))[:3] == (0, 0, 255)
+    assert pixels.get_at((10, 0))[:3] == (0, 0, 255)
+
+
+def test_rebaked_chunk_invalidates_texture(create_object, monkeypatch):
+    invalidated = []
+    monkeypatch.setattr(StaticRenderChunk._texture_renderer, 'invalidate', invalidated.append)
+    chunk = StaticRenderChunk(FRect(0, 0, 64, 64))
+    chunk.sprites[create_object(SolidObject, (10, 10), (0, 0))] = None
+    chunk.bake()
+    surface = chunk.surface
+    chunk.bake()
+    assert chunk.surface is surface
+    assert invalidated == [surface, surface]
+    assert surface.get_at((0, 0))[:3] == (255, 0, 0)
+
+
+def test_render_queue_sorts_by_layer_y_and_order():
+    render_queue = RenderQueue()
+    colors = {}
+    for name, color in (('red', (255, 0, 0)), ('green', (0, 255, 0)), ('blue', (0, 0, 255))):
+        colors[name] = Surface((4, 4))
+        colors[name].fill(color)
+    surface = Surface((4, 4))
+    for name, coordinate, layer, y_sort in (('red', (-3, 0), 1, 0), ('green', (0, 0), 0, 10), ('blue', (0, 0), 0, 5)):
+        render_queue.submit(colors[name], coordinate, layer, y_sort)
+    render_queue.flush(surface)
+    assert surface.get_at((0, 0))[:3] == (255, 0, 0)
+    assert surface.get_at((1, 0))[:3] == (0, 255, 0)
+    assert not len(render_queue)
+    render_queue.submit(colors['green'], (0, 0), 0, 5)
+    render_queue.submit(colors['blue'], (0, 0), 0, 5)
+    render_queue.flush(surface)
+    assert surface.get_at((0, 0))[:3] == (0, 0, 255)
+
+
+def test_culling_keeps_visible_sprites_in_added_order(draw_group, create_object, monkeypatch):
+    VisibleMap().offset = Coordinate(-1000, 0)
+    first = create_object(SolidObject, (10, 10), (1010, 0))
+    hidden = create_object(SolidObject, (10, 10), (0, 0))
+    last = create_object(SolidObject, (10, 10), (1000, 20))
+    draw_group.add(first, hidden, last)
+    assert draw_group._get_draw_sprites(VisibleMap()) == [first, last]
+    assert draw_group.culled == 1
+    hidden.rect.topleft = (1005, 40)
+    hidden.update()
+    monkeypatch.setattr(draw_group._draw_index, 'rebucket', lambda sprite: pytest.fail('rebucket during draw'))
+    assert draw_group._get_draw_sprites(VisibleMap()) == [first, hidden, last]
+    assert draw_group.culled == 0
+
+
+def test_integer_frame_is_centered(presenter):
+    presenter.scale_mode = ScaleModeEnum.INTEGER
+    width, height = presenter.resolution
+    frame_rect = presenter._get_frame_rect((width // 2 - 10, height // 2 - 10))
+    assert frame_rect.size == (width - 20, height - 20)
+    assert frame_rect.center == (width // 2, height // 2)
+
+
+def test_present_scales_into_the_same_frame(presenter):
+    presenter.scale_mode = ScaleModeEnum.STRETCH
+    surface = Surface(VisibleMap().get_size())
+    surface.fill((0, 255, 0))
+    presenter.present(surface)
+    frame = presenter._frame
+    surface.fill((0, 0, 255))
+    presenter.present(surface)
+    assert presenter._frame is frame
+    width, height = presenter.resolution
+    assert display.get_surface().get_at((width - 1, height - 1))[:3] == (0, 0, 255)
+    coordinate = presenter.to_visible_map((width, height))
+    assert coordinate == pytest.approx(tuple(VisibleMap().get_size()))
+
+
+def test_static_layer_matches_sprite_blits(create_object):
+    static_render_layer = StaticRenderLayer(Size(64, 64))
+    sprites = [create_object(SolidObject, (8, 8), topleft) for topleft in ((10, 10), (60, 60), (-4, 30))]
+    for sprite in sprites:
+        static_render_layer.add(sprite)
+    offset = Coordinate(5, 3)
+
+    def assert_drawn() -> None:
+        baked, blitted = Surface((128, 128)), Surface((128, 128))
+        static_render_layer.draw(baked, offset)
+        blitted.blits([(sprite.image, sprite.rect.move(offset)) for sprite in sprites if sprite.alive()])
+        assert image.tobytes(baked, 'RGB') == image.tobytes(blitted, 'RGB')
+
+    assert_drawn()
+    sprites[0].rect.topleft = (70, 10)
+    assert_drawn()
+    static_render_layer.remove(sprites[1])
+    sprites[1].kill()
+    assert_drawn()
+    assert len(static_render_layer) == 2
+
+
+def test_render_scale_follows_frame_time(monkeypatch):
+    dynamic_resolution = DynamicResolution()
+    global_clock = SimpleNamespace(framerate=50, raw_frame_time=30)
+    monkeypatch.setattr(dynamic_resolution, '_global_clock', global_clock)
+    monkeypatch.setattr(dynamic_resolution, '_min_scale', 0.5)
+    monkeypatch.setattr(dynamic_resolution, '_step', 0.25)
+    changes = [dynamic_resolution.update() for _ in range(FRAME_TIMES_WINDOW)]
+    assert changes == [False] * (FRAME_TIMES_WINDOW - 1) + [True]
+    assert dynamic_resolution.scale == 0.75
+    assert dynamic_resolution.surface.get_size() == dynamic_resolution.scale_size(VisibleMap().get_size())
+    for _ in range(FRAME_TIMES_WINDOW * 2):
+        dynamic_resolution.update()
+    assert dynamic_resolution.scale == 0.5
+    global_clock.raw_frame_time = 5
+    for _ in range(FRAME_TIMES_WINDOW * 2):
+        dynamic_resolution.update()
+    assert dynamic_resolution.scale == 1
+    assert dynamic_resolution.surface is VisibleMap()
+
+
+def test_renderer_falls_back_to_surface_output(monkeypatch):
+    previous = SingletonMeta._instances.pop(TextureRenderer, None)
+    monkeypatch.setattr(TextureRenderer, 'is_enabled', True)
+
+    def fail(*args, **kwargs) -> None:
+        raise error('no renderer')
+
+    monkeypatch.setattr('engine.render.texture_renderer.Renderer', fail)
+    texture_renderer = TextureRenderer()
+    assert not texture_renderer.create('test', (64, 64), False)
+    assert not texture_renderer.is_enabled
+    assert texture_renderer.window is texture_renderer.renderer is None
+    SingletonMeta._instances.pop(TextureRenderer, None)
+    if previous is not None:
+        SingletonMeta._instances[TextureRenderer] = previous
+
+
+def test_renderer_falls_back_to_software(texture_renderer, monkeypatch):
+    accelerations = []
+
+    def create(window, accelerated: int) -> object:
+        accelerations.append(accelerated)
+        if accelerated:
+            raise error('no accelerated renderer')
+        return texture_renderer.renderer
+
+    monkeypatch.setattr('engine.render.texture_renderer.Renderer', create)
+    assert texture_renderer._create_renderer() is texture_renderer.renderer
+    assert accelerations == [-1, 0]
+
+
+def test_resize_is_handled_in_frames_without_steps():
+    class FrameDrawn(Exception):
+        pass
+
+    def draw():
+        raise FrameDrawn
+
+    resized, steps = [], []
+    engine = SimpleNamespace(
+        _global_clock=SimpleNamespace(tick=lambda: None, steps=0),
+        _presenter=SimpleNamespace(resize=lambda: resized.append(True)),
+        _check_quit=lambda events: None,
+        _get_events=lambda: Engine._get_events(engine),
+        _step=lambda: steps.append(True),
+        _draw=draw,
+    )
+    engine._window_events = lambda: Engine._window_events(engine)
+    event.post(event.Event(WINDOWSIZECHANGED, x=800, y=600))
+    with pytest.raises(FrameDrawn):
+        Engine._main_loop(engine)
+    assert resized
+    assert not steps
@@ -0,0 +1,63 @@
+import pytest
+
+from engine.constants import Coordinate
+from engine.map import VisibleMap
+from engine.metaclasses.singleton import SingletonMeta
+from engine.objects import SolidObject
+from engine.objects.groups import SolidObjectsGroup
+from engine.time import GlobalClock
+
+
+@pytest.fixture
+def global_clock():
+    """Отдаёт отдельные глобальные часы с фиксированным шагом 10 мс и не более чем тремя шагами за кадр."""
+    previous = SingletonMeta._instances.pop(GlobalClock, None)
+    global_clock = GlobalClock()
+    global_clock.is_fixed_timestep = global_clock.is_interpolation = True
+    global_clock._fixed_frame_time = 10
+    global_clock._max_substeps = 3
+    yield global_clock
+    SingletonMeta._instances.pop(GlobalClock, None)
+    if previous is not None:
+        SingletonMeta._instances[GlobalClock] = previous
+
+
+def test_fixed_timestep_accumulates_frame_time(global_clock):
+    global_clock._tick_fixed_timestep(25)
+    assert (global_clock.steps, global_clock.alpha, global_clock.frame_time) == (2, 0.5, 10)
+    global_clock._tick_fixed_timestep(5)
+    assert (global_clock.steps, global_clock.alpha) == (1, 0)
+    global_clock._tick_fixed_timestep(7)
+    assert (global_clock.steps, global_clock.alpha) == (0, 0.7)
+
+
+def test_fixed_timestep_drops_backlog(global_clock):
+    global_clock._tick_fixed_timestep(104)
+    assert global_clock.steps == 3
+    assert global_clock.alpha == pytest.approx(0.4)
+
+
+def test_draw_position_is_interpolated(global_clock, create_object, monkeypatch):
+    block = create_object(SolidObject, (10, 10), (0, 0))
+    group = SolidObjectsGroup()
+    monkeypatch.setattr(group, '_global_clock', global_clock)
+    group.save_previous_coordinates()
+    block.rect.x = 10
+    global_clock.alpha = 0.25
+    assert group._get_interpolated_coordinate(block) == Coordinate(2.5, 0)
+
+
+def test_camera_offset_is_interpolated_with_sprites(global_clock, create_object, monkeypatch):
+    hero = create_object(SolidObject, (10, 10), (0, 0))
+    group, visible_map = SolidObjectsGroup(), VisibleMap()
+    monkeypatch.setattr(group, '_global_clock', global_clock)
+    monkeypatch.setattr(visible_map, '_global_clock', global_clock)
+    monkeypatch.setattr(visible_map, 'offset', Coordinate(50, 0))
+    monkeypatch.setattr(visible_map, 'previous_offset', visible_map.offset)
+    group.save_previous_coordinates()
+    visible_map.save_previous_offset()
+    hero.rect.x = 10
+    visible_map.offset = Coordinate(40, 0)
+    for alpha in (0, 0.25, 0.5, 1):
+        global_clock.alpha = alpha
+        assert group._get_blit_coordinate(hero) == Coordinate(50, 0)